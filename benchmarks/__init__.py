@@ -0,0 +1,24 @@
+"""
+Micro-benchmarks for the hot paths of `plasmapy_sphinx`.
+
+The benchmarks are written for `asv <https://asv.readthedocs.io>`_ and run
+offline against synthetic packages generated on the fly (see
+`benchmarks.common`).  From the repository root...
+
+.. code-block:: bash
+
+   # benchmark the current environment and record the results
+   asv run --python=same --set-commit-hash $(git rev-parse HEAD)
+
+   # compare two recorded commits
+   asv compare <commit_a> <commit_b>
+
+The same benchmarks can be run with
+`pytest-benchmark <https://pytest-benchmark.readthedocs.io>`_ through the
+`benchmarks.test_benchmarks` adapter...
+
+.. code-block:: bash
+
+   python -m pytest benchmarks --benchmark-json=results.json
+   python -m pytest benchmarks --benchmark-autosave --benchmark-compare
+"""
@@ -0,0 +1,49 @@
+"""Benchmarks for `plasmapy_sphinx.autodoc.automodapi`."""
+import importlib
+
+from docutils.utils import Reporter
+from sphinx.ext.autodoc import Options
+from sphinx.ext.autodoc.directive import DocumenterBridge
+
+from plasmapy_sphinx.autodoc.automodapi import ModAPIDocumenter
+from plasmapy_sphinx.automodsumm.inventory import InventoryStore
+
+from benchmarks.common import make_app, make_package
+
+
+class GenerateMoreContent:
+    """
+    Benchmarks for
+    `~plasmapy_sphinx.autodoc.automodapi.ModAPIDocumenter.generate_more_content`,
+    which generates the :rst:dir:`automodsumm` tables and inheritance diagrams
+    of an :rst:dir:`automodapi` directive.
+    """
+
+    params = (["small", "large"], [False, True])
+    param_names = ["size", "inheritance_diagram"]
+
+    def setup(self, size, inheritance_diagram):
+        app = make_app(size)
+        self.modname = make_package(size)
+        importlib.import_module(self.modname)
+
+        env = app.env
+        env.prepare_settings("index")
+        env.automodsumm_inventory_store = InventoryStore()
+
+        options = Options({"toctree": "api"})
+        if inheritance_diagram:
+            options["inheritance-diagram"] = True
+        else:
+            options["no-inheritance-diagram"] = True
+
+        bridge = DocumenterBridge(
+            env, Reporter("", 4, 4), options, 1, state=None
+        )
+        self.documenter = ModAPIDocumenter(bridge, self.modname)
+
+    def time_generate_more_content(self, size, inheritance_diagram):
+        self.documenter.generate_more_content(self.modname)
+
+    def peakmem_generate_more_content(self, size, inheritance_diagram):
+        self.documenter.generate_more_content(self.modname)
@@ -0,0 +1,232 @@
+"""Benchmarks for `plasmapy_sphinx.automodsumm`."""
+import importlib
+
+from plasmapy_sphinx.automodsumm.core import AutomodsummOptions
+from plasmapy_sphinx.automodsumm import inventory, walk
+from plasmapy_sphinx.automodsumm.generate import (
+    AutomodsummEntry,
+    AutomodsummRenderer,
+    GenDocsFromAutomodsumm,
+)
+from plasmapy_sphinx.automodsumm.inventory import InventoryStore, inspect_module
+from plasmapy_sphinx.automodsumm.isolated import InspectionPool
+from plasmapy_sphinx.automodsumm.members import ClassMemberCache
+from plasmapy_sphinx.automodsumm.metrics import StubGenMetrics
+
+from benchmarks.common import SIZES, make_app, make_documents, make_package
+
+
+class GenerateObjList:
+    """
+    Benchmarks for
+    `~plasmapy_sphinx.automodsumm.core.AutomodsummOptions.generate_obj_list`.
+    A ``"cold"`` store forces the module to be inspected, while a ``"warm"``
+    store serves the module inventory from the build's
+    `~plasmapy_sphinx.automodsumm.inventory.InventoryStore`.
+    """
+
+    params = (["small", "large"], ["cold", "warm"])
+    param_names = ["size", "store"]
+
+    def setup(self, size, store):
+        self.app = make_app(size)
+        self.modname = make_package(size)
+        self.cold = store == "cold"
+        importlib.import_module(self.modname)
+
+        self.app.env.automodsumm_inventory_store = InventoryStore()
+        self._generate()
+
+    def _generate(self):
+        if self.cold:
+            self.app.env.automodsumm_inventory_store = InventoryStore()
+
+        option_processor = AutomodsummOptions(
+            self.app, self.modname, {"toctree": "api"}, docname="index"
+        )
+        return option_processor.generate_obj_list()
+
+    def time_generate_obj_list(self, size, store):
+        self._generate()
+
+    def peakmem_generate_obj_list(self, size, store):
+        self._generate()
+
+
+class DirectiveScanning:
+    """
+    Benchmarks for scanning source documents for the :rst:dir:`automodapi` and
+    :rst:dir:`automodsumm` directives.
+    """
+
+    params = ([500, 3000],)
+    param_names = ["n_docs"]
+
+    def setup(self, n_docs):
+        self.app = make_app("small")
+        self.docs = make_documents("small", n_docs)
+        self.gen = GenDocsFromAutomodsumm()
+        self.gen.app = self.app
+
+    def time_find_in_lines(self, n_docs):
+        for ii, doc in enumerate(self.docs):
+            self.gen.find_in_lines(doc.splitlines(), filename=f"doc_{ii}.rst")
+
+    def time_find_in_text(self, n_docs):
+        for ii, doc in enumerate(self.docs):
+            self.gen.find_in_text(doc, filename=f"doc_{ii}.rst")
+
+    def time_scan_directives(self, n_docs):
+        for doc in self.docs:
+            self.gen.scan_directives(doc)
+
+    def peakmem_find_in_text(self, n_docs):
+        for ii, doc in enumerate(self.docs):
+            self.gen.find_in_text(doc, filename=f"doc_{ii}.rst")
+
+
+class RendererRender:
+    """
+    Benchmarks for
+    `~plasmapy_sphinx.automodsumm.generate.AutomodsummRenderer.render`
+    of the :rst:dir:`automodsumm` templates.
+    """
+
+    params = (["class", "module", "function"],)
+    param_names = ["template"]
+
+    def setup(self, template):
+        self.renderer = AutomodsummRenderer(make_app("large"))
+
+        n_members = SIZES["large"]["methods"] * SIZES["large"]["classes"]
+        self.context = {
+            "objname": "Class000",
+            "name": "Class000",
+            "fullname": "synth_large.mod_00.Class000",
+            "module": "synth_large.mod_00",
+            "objtype": template,
+            "methods": ["__init__"] + [f"method_{ii:03d}" for ii in range(n_members)],
+            "attributes": [f"prop_{ii:03d}" for ii in range(n_members)],
+        }
+
+    def time_render(self, template):
+        context = self.context.copy()
+        context["methods"] = list(context["methods"])
+        self.renderer.render(template, context)
+
+
+class ClassStubs:
+    """
+    Benchmarks for rendering the stub files of all classes of a module, which
+    inherit from each other, with and without the
+    `~plasmapy_sphinx.automodsumm.members.ClassMemberCache` (see
+    :confval:`automodapi_class_member_cache`).
+    """
+
+    params = (["small", "large"], ["cached", "uncached"])
+    param_names = ["size", "cache"]
+
+    def setup(self, size, cache):
+        self.app = make_app(size)
+        pkg_name = make_package(size)
+        importlib.import_module(pkg_name)
+
+        self.cached = cache == "cached"
+        self.renderer = AutomodsummRenderer(self.app)
+        self.entries = [
+            AutomodsummEntry(
+                name=f"{pkg_name}.mod_00.Class{ii:03d}",
+                path="api",
+                template="class",
+                recursive=False,
+            )
+            for ii in range(SIZES[size]["classes"])
+        ]
+        self.gen = GenDocsFromAutomodsumm()
+        self.gen.app = self.app
+
+    def time_render_class_stubs(self, size, cache):
+        gen = self.gen
+        gen.metrics = StubGenMetrics()
+        gen.member_cache = (
+            ClassMemberCache(self.app, gen.metrics) if self.cached else None
+        )
+        for entry in self.entries:
+            gen.render_entry(entry, self.renderer)
+
+
+class Inventory:
+    """
+    Benchmarks for `~plasmapy_sphinx.automodsumm.inventory.inspect_module` with
+    the ``"import"`` and ``"static"`` engines (see
+    :confval:`automodapi_inventory_engine`).
+    """
+
+    params = (["small", "large"], ["import", "static"])
+    param_names = ["size", "engine"]
+
+    def setup(self, size, engine):
+        self.app = make_app(size)
+        self.modname = make_package(size)
+        importlib.import_module(self.modname)
+
+    def time_inspect_module(self, size, engine):
+        inspect_module(self.modname, app=self.app, engine=engine)
+
+    def peakmem_inspect_module(self, size, engine):
+        inspect_module(self.modname, app=self.app, engine=engine)
+
+
+class IsolatedInventory:
+    """
+    Benchmarks for the ``"subprocess"`` inventory engine, inspecting all
+    modules of a package with a warm
+    `~plasmapy_sphinx.automodsumm.isolated.InspectionPool`.
+    """
+
+    params = (["small", "large"], [1, 4])
+    param_names = ["size", "workers"]
+
+    def setup(self, size, workers):
+        pkg_name = make_package(size)
+        self.modnames = [pkg_name] + [
+            f"{pkg_name}.mod_{ii:02d}" for ii in range(SIZES[size]["modules"])
+        ]
+
+        self.pool = InspectionPool(workers, max_modules=len(self.modnames) * 10)
+        # start the workers outside of the timed section
+        self.pool.prefetch(self.modnames[:workers])
+        for modname in self.modnames[:workers]:
+            self.pool.inspect(modname)
+
+    def teardown(self, size, workers):
+        self.pool.close()
+
+    def time_inspect_package(self, size, workers):
+        self.pool.prefetch(self.modnames)
+        for modname in self.modnames:
+            self.pool.inspect(modname)
+
+
+class PackageWalk:
+    """
+    Benchmarks for precomputing the inventories of a whole package (see
+    :confval:`automodapi_inventory_packages`).
+    """
+
+    params = (["small", "large"],)
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.app = make_app(size)
+        self.pkg_name = make_package(size)
+        self.app.config.automodapi_inventory_packages = [self.pkg_name]
+        importlib.import_module(self.pkg_name)
+
+    def time_walk_package(self, size):
+        list(walk.walk_package(self.pkg_name))
+
+    def time_precompute_inventories(self, size):
+        # a fresh inventory store for each run
+        inventory.event_handler__builder_inited(self.app)
+        walk.event_handler__builder_inited(self.app)
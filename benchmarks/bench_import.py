@@ -0,0 +1,56 @@
+"""
+Benchmarks for ``import plasmapy_sphinx``.  The imports are measured in fresh
+interpreters, since the benchmark process has already imported
+`plasmapy_sphinx` and `sphinx`.
+"""
+import json
+import subprocess
+import sys
+
+from typing import Dict
+
+IMPORT_CODE = "import plasmapy_sphinx"
+
+# modules that ``import plasmapy_sphinx`` is expected not to import, they are
+# imported by the Sphinx extensions when set up
+HEAVY_MODULES = ("sphinx", "jinja2", "docutils", "packaging", "sphinx_gallery")
+
+
+def import_stats() -> Dict[str, object]:
+    """
+    Import `plasmapy_sphinx` in a fresh interpreter (with ``-X importtime``) and
+    return the cumulative import time (``"import_us"``, in microseconds) and
+    the names of the newly imported modules (``"modules"``).
+    """
+    code = (
+        "import json, sys; before = set(sys.modules); "
+        f"{IMPORT_CODE}; "
+        "print(json.dumps(sorted(set(sys.modules) - before)))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    import_us = 0
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == "plasmapy_sphinx":
+            import_us = int(fields[1])
+
+    return {"import_us": import_us, "modules": json.loads(proc.stdout)}
+
+
+class Import:
+    """Benchmarks for ``import plasmapy_sphinx``."""
+
+    def timeraw_import_plasmapy_sphinx(self):
+        return IMPORT_CODE
+
+    def track_modules_imported(self):
+        return len(import_stats()["modules"])
+
+    track_modules_imported.unit = "modules"
@@ -0,0 +1,66 @@
+"""Benchmarks for `plasmapy_sphinx.utils`."""
+import importlib
+import types
+
+from plasmapy_sphinx.utils import find_mod_objs, group_mod_objs
+
+from benchmarks.common import make_app, make_package
+
+
+class FindModObjs:
+    """Benchmarks for `~plasmapy_sphinx.utils.find_mod_objs`."""
+
+    params = (["small", "large"], ["package", "module"])
+    param_names = ["size", "target"]
+
+    def setup(self, size, target):
+        pkg_name = make_package(size)
+        self.modname = pkg_name if target == "package" else f"{pkg_name}.mod_00"
+        self.app = make_app(size)
+        importlib.import_module(self.modname)
+
+    def time_find_mod_objs(self, size, target):
+        find_mod_objs(self.modname, app=self.app)
+
+    def peakmem_find_mod_objs(self, size, target):
+        find_mod_objs(self.modname, app=self.app)
+
+
+class GroupModObjs:
+    """
+    Benchmarks for `~plasmapy_sphinx.utils.group_mod_objs` on modules with many
+    exports.
+    """
+
+    params = ([1_000, 10_000],)
+    param_names = ["n_exports"]
+
+    def setup(self, n_exports):
+        mod = types.ModuleType("bench_exports")
+        for ii in range(n_exports):
+            if ii % 2:
+                func = lambda: None  # noqa: E731
+                func.__name__ = f"func_{ii:05d}"
+                func.__module__ = mod.__name__
+                setattr(mod, func.__name__, func)
+            else:
+                cls = type(f"Class{ii:05d}", (), {"__module__": mod.__name__})
+                setattr(mod, cls.__name__, cls)
+        mod.__all__ = [name for name in vars(mod) if not name.startswith("_")]
+        self.mod = mod
+        self.inventory = group_mod_objs(mod)
+
+    def time_group_mod_objs(self, n_exports):
+        group_mod_objs(self.mod)
+
+    def peakmem_group_mod_objs(self, n_exports):
+        group_mod_objs(self.mod)
+
+    def time_lookup(self, n_exports):
+        # a fresh inventory, so the index is built
+        inventory = self.inventory.filtered()
+        for name in self.mod.__all__:
+            inventory.lookup(name)
+
+    def time_sorted_qualnames(self, n_exports):
+        self.inventory.filtered(skip=["func_00001"]).sorted_qualnames()
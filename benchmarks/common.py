@@ -0,0 +1,200 @@
+"""
+Synthetic packages, source documents, and Sphinx applications shared by the
+benchmarks.  Everything is generated in a temporary directory, so the
+benchmarks do not depend on any package other than `plasmapy_sphinx` and its
+requirements.
+"""
+__all__ = ["SIZES", "make_app", "make_documents", "make_package"]
+
+import atexit
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+from functools import lru_cache
+from typing import List, Tuple
+
+SIZES = {
+    "small": {"modules": 4, "functions": 10, "classes": 5, "methods": 5},
+    "large": {"modules": 40, "functions": 50, "classes": 25, "methods": 15},
+}
+"""Dimensions of the synthetic packages, keyed by the benchmark ``size`` parameter."""
+
+_CUSTOM_GROUPS = {"aliases": {"title": "Aliases", "dunder": "__aliases__"}}
+
+
+@lru_cache(maxsize=None)
+def _tmp_root() -> str:
+    root = tempfile.mkdtemp(prefix="plasmapy_sphinx_bench_")
+    atexit.register(shutil.rmtree, root, ignore_errors=True)
+    return root
+
+
+def _module_source(size: str) -> Tuple[str, List[str]]:
+    dims = SIZES[size]
+    lines = ['"""A synthetic module."""']
+
+    names = []
+    for ii in range(dims["functions"]):
+        names.append(f"func_{ii:03d}")
+        lines.extend(
+            [
+                f"def func_{ii:03d}(x, y=1):",
+                f'    """Synthetic function {ii}."""',
+                "    return x + y",
+            ]
+        )
+
+    for ii in range(dims["classes"]):
+        names.append(f"Class{ii:03d}")
+        base = "object" if ii == 0 else f"Class{ii - 1:03d}"
+        lines.extend([f"class Class{ii:03d}({base}):", f'    """Synthetic class {ii}."""'])
+        for jj in range(dims["methods"]):
+            lines.extend(
+                [
+                    f"    def method_{ii:03d}_{jj:03d}(self):",
+                    '        """Synthetic method."""',
+                    "",
+                    "    @property",
+                    f"    def prop_{ii:03d}_{jj:03d}(self):",
+                    '        """Synthetic property."""',
+                ]
+            )
+
+    names.extend(["SyntheticError", "SyntheticWarning", "CONSTANT", "alias_"])
+    lines.extend(
+        [
+            "class SyntheticError(Exception):",
+            '    """Synthetic exception."""',
+            "class SyntheticWarning(UserWarning):",
+            '    """Synthetic warning."""',
+            "CONSTANT = 42",
+            "alias_ = func_000",
+        ]
+    )
+
+    header = [
+        f"__all__ = {names!r}",
+        '__aliases__ = ["alias_"]',
+    ]
+    return "\n".join(lines[:1] + header + lines[1:]) + "\n", names
+
+
+@lru_cache(maxsize=None)
+def make_package(size: str) -> str:
+    """
+    Write the synthetic package for benchmark ``size`` (see `SIZES`), make it
+    importable, and return its name.  The package consists of
+    ``SIZES[size]["modules"]`` modules re-exported by the package
+    ``__init__.py``.
+    """
+    pkg_name = f"synth_{size}"
+    root = _tmp_root()
+    pkg_dir = os.path.join(root, pkg_name)
+    os.makedirs(pkg_dir, exist_ok=True)
+
+    source, names = _module_source(size)
+    modnames = [f"mod_{ii:02d}" for ii in range(SIZES[size]["modules"])]
+    for modname in modnames:
+        with open(os.path.join(pkg_dir, f"{modname}.py"), "w") as f:
+            f.write(source)
+
+    init_lines = ['"""A synthetic package."""', f"__all__ = {modnames + names!r}"]
+    init_lines.extend(f"from {pkg_name} import {modname}" for modname in modnames)
+    init_lines.append(f"from {pkg_name}.mod_00 import *")
+    with open(os.path.join(pkg_dir, "__init__.py"), "w") as f:
+        f.write("\n".join(init_lines) + "\n")
+
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+    return pkg_name
+
+
+def make_documents(
+    size: str, n_docs: int, n_lines: int = 200, directive_every: int = 20
+) -> List[str]:
+    """
+    Generate ``n_docs`` reStructuredText documents of ``n_lines`` lines each,
+    where every ``directive_every``-th document contains an
+    :rst:dir:`automodapi` and an :rst:dir:`automodsumm` directive for a module
+    of the synthetic package of benchmark ``size``.
+    """
+    pkg_name = make_package(size)
+    filler = [
+        "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
+        "",
+        ".. note::",
+        "",
+        "   Some note text here.",
+        "",
+        "* a list item with ``code`` and `a link <https://www.plasmapy.org>`_",
+        "",
+        ".. code-block:: python",
+        "",
+        "   x = 1",
+        "",
+    ]
+    directives = [
+        f".. currentmodule:: {pkg_name}",
+        "",
+        ".. automodapi:: mod_00",
+        "   :toctree: api",
+        "   :skip: func_000",
+        "",
+        f".. automodsumm:: {pkg_name}.mod_01",
+        "   :toctree: api",
+        "   :groups: functions",
+        "",
+    ]
+
+    docs = []
+    for ii in range(n_docs):
+        lines = [filler[jj % len(filler)] for jj in range(n_lines)]
+        if ii % directive_every == 0:
+            lines[n_lines // 2 : n_lines // 2] = directives
+        docs.append("\n".join(lines) + "\n")
+
+    return docs
+
+
+@lru_cache(maxsize=None)
+def make_app(size: str):
+    """
+    Create a `~sphinx.application.Sphinx` application (with the ``dummy``
+    builder) that has `plasmapy_sphinx.ext.autodoc` enabled and the synthetic
+    package of benchmark ``size`` importable.  Stub file generation is disabled.
+    """
+    from sphinx.application import Sphinx
+
+    make_package(size)
+
+    root = os.path.join(_tmp_root(), f"docs_{size}")
+    srcdir = os.path.join(root, "src")
+    os.makedirs(srcdir, exist_ok=True)
+    with open(os.path.join(srcdir, "conf.py"), "w") as f:
+        f.write(
+            "\n".join(
+                [
+                    'extensions = ["plasmapy_sphinx.ext.autodoc"]',
+                    "autosummary_generate = False",
+                    f"automodapi_custom_groups = {_CUSTOM_GROUPS!r}",
+                    "automodapi_inventory_cache = False",
+                ]
+            )
+        )
+    with open(os.path.join(srcdir, "index.rst"), "w") as f:
+        f.write("Benchmarks\n==========\n")
+
+    return Sphinx(
+        srcdir=srcdir,
+        confdir=srcdir,
+        outdir=os.path.join(root, "_build"),
+        doctreedir=os.path.join(root, "_build", ".doctrees"),
+        buildername="dummy",
+        status=None,
+        warning=io.StringIO(),
+        freshenv=True,
+    )
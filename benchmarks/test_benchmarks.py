@@ -0,0 +1,109 @@
+"""
+Adapter running the asv benchmarks with
+`pytest-benchmark <https://pytest-benchmark.readthedocs.io>`_.  Each ``time_*``
+benchmark is timed by the ``benchmark`` fixture, each ``timeraw_*`` benchmark
+times its code in a fresh interpreter, each ``peakmem_*`` benchmark records the
+peak memory allocated (as reported by `tracemalloc`) in the ``extra_info`` of
+the benchmark JSON, and each ``track_*`` benchmark records its value in the
+``extra_info``.
+
+Additionally, :func:`test_import_time` guards against regressions of
+``import plasmapy_sphinx``.
+"""
+import inspect
+import itertools
+import subprocess
+import sys
+import tracemalloc
+
+from benchmarks import bench_automodapi, bench_automodsumm, bench_import, bench_utils
+
+try:
+    # asv imports every module of the benchmark directory, so the adapter is
+    # only defined when pytest-benchmark is available
+    import pytest
+    import pytest_benchmark  # noqa: F401
+except ImportError:  # coverage: ignore
+    pytest = None
+
+
+def _collect():
+    cases = []
+    for module in (bench_utils, bench_automodsumm, bench_automodapi, bench_import):
+        for cls_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+
+            params = getattr(cls, "params", ())
+            param_names = getattr(cls, "param_names", [])
+            if not isinstance(params, tuple):
+                params = (params,)
+
+            for meth_name, _ in inspect.getmembers(cls, inspect.isfunction):
+                if not meth_name.startswith(
+                    ("time_", "timeraw_", "peakmem_", "track_")
+                ):
+                    continue
+
+                for values in itertools.product(*params):
+                    case_id = "-".join(
+                        [f"{cls_name}.{meth_name}"]
+                        + [f"{name}={value}" for name, value in zip(param_names, values)]
+                    )
+                    cases.append(pytest.param(cls, meth_name, values, id=case_id))
+
+    return cases
+
+
+def _test_benchmark(benchmark, cls, meth_name, values):
+    instance = cls()
+    if hasattr(instance, "setup"):
+        instance.setup(*values)
+
+    method = getattr(instance, meth_name)
+    benchmark.group = f"{cls.__name__}.{meth_name}"
+
+    if meth_name.startswith("peakmem_"):
+        tracemalloc.start()
+        try:
+            method(*values)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["peakmem"] = peak
+        benchmark.pedantic(method, args=values, rounds=1, iterations=1)
+    elif meth_name.startswith("timeraw_"):
+        code = method(*values)
+        benchmark(subprocess.run, [sys.executable, "-c", code], check=True)
+    elif meth_name.startswith("track_"):
+        benchmark.extra_info["track"] = benchmark.pedantic(
+            method, args=values, rounds=1, iterations=1
+        )
+    else:
+        benchmark(method, *values)
+
+    if hasattr(instance, "teardown"):
+        instance.teardown(*values)
+
+
+#: Cap on the cumulative time of ``import plasmapy_sphinx`` (in microseconds),
+#: as reported by ``python -X importtime``.
+IMPORT_TIME_CAP = 50_000
+
+
+def test_import_time():
+    stats = bench_import.import_stats()
+
+    heavy = [
+        name
+        for name in stats["modules"]
+        if name.split(".")[0] in bench_import.HEAVY_MODULES
+    ]
+    assert not heavy, f"import plasmapy_sphinx imports {heavy}"
+    assert 0 < stats["import_us"] < IMPORT_TIME_CAP
+
+
+if pytest is not None:
+    test_benchmark = pytest.mark.parametrize("cls, meth_name, values", _collect())(
+        _test_benchmark
+    )
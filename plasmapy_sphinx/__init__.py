@@ -73,50 +73,95 @@ import sys
 if sys.version_info < (3, 8):  # coverage: ignore
     raise ImportError("plasmapy_sphinx does not support Python < 3.8")
 
-from importlib.metadata import version, PackageNotFoundError
-
-from plasmapy_sphinx import autodoc, automodsumm, directives, utils
-
-
-# define version
-try:
-    # note: if there's any distribution metadata in your source files, then this
-    #       will find a version based on those files.  Keep distribution metadata
-    #       out of your repository unless you've intentionally installed the package
-    #       as editable (e.g. `pip install -e {root_directory}`),
-    #       but then __version__ will not be updated with each commit, it is
-    #       frozen to the version at time of install.
-    #
-    #: `plasmapy_sphinx` version string
-    __version__ = version("plasmapy_sphinx")
-except PackageNotFoundError:
-    # package is not installed
-    fallback_version = "unknown"
+import importlib
+
+# Sub-packages are imported on first access (see __getattr__), so importing
+# plasmapy_sphinx does not import sphinx.ext.autodoc, sphinx.ext.autosummary,
+# jinja2, etc.  The Sphinx extensions import what they need when set up.
+_submodules = {"autodoc", "automodsumm", "directives", "ext", "theme", "utils"}
+
+
+def _get_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        # note: if there's any distribution metadata in your source files, then
+        #       this will find a version based on those files.  Keep distribution
+        #       metadata out of your repository unless you've intentionally
+        #       installed the package as editable (e.g. `pip install -e
+        #       {root_directory}`), but then __version__ will not be updated with
+        #       each commit, it is frozen to the version at time of install.
+        return version("plasmapy_sphinx")
+    except PackageNotFoundError:
+        pass
+
     try:
-        # code most likely being used from source
-        # if setuptools_scm is installed then generate a version
-        from setuptools_scm import get_version
-
-        __version__ = get_version(
-            root="..", relative_to=__file__, fallback_version=fallback_version
-        )
-        del get_version
-        warn_add = "setuptools_scm failed to detect the version"
-    except ModuleNotFoundError:
-        # setuptools_scm is not installed
-        __version__ = fallback_version
-        warn_add = "setuptools_scm is not installed"
-
-    if __version__ == fallback_version:
-        from warnings import warn
-
-        warn(
-            f"plasmapy_sphinx.__version__ not generated (set to 'unknown'), "
-            f"plasmapy_sphinx is not an installed package and {warn_add}.",
-            RuntimeWarning,
-        )
-
-        del warn
-    del fallback_version, warn_add
+        # package is not installed, but was built from source, in which case
+        # setuptools_scm wrote the version module (no git subprocess is spawned)
+        from plasmapy_sphinx._version import version as scm_version
+
+        return scm_version
+    except ImportError:
+        pass
+
+    # plasmapy_sphinx is not an installed package and was not built with
+    # setuptools_scm (e.g. an uninstalled source checkout)
+    return "unknown"
+
+
+_cache_version = None
+
+
+def _get_cache_version() -> str:
+    """
+    The version of `plasmapy_sphinx` used in the keys of the caches persisted
+    between builds.  If the version is unknown (see ``__version__``), a hash
+    of the package sources is used instead, so editing the sources of an
+    uninstalled checkout invalidates the caches.
+    """
+    global _cache_version
+
+    if _cache_version is not None:
+        return _cache_version
+
+    version = _get_version()
+    if version == "unknown":
+        import hashlib
+        import os
+
+        package_dir = os.path.dirname(os.path.abspath(__file__))
+        sha = hashlib.sha256()
+        for root, dirs, files in os.walk(package_dir):
+            dirs[:] = sorted(name for name in dirs if name != "__pycache__")
+            for name in sorted(files):
+                if name.endswith((".pyc", ".pyo")):
+                    continue
+                filename = os.path.join(root, name)
+                sha.update(os.path.relpath(filename, package_dir).encode())
+                with open(filename, "rb") as file:
+                    sha.update(file.read())
+
+        version = f"unknown+{sha.hexdigest()}"
+
+    _cache_version = version
+    return version
+
+
+def __getattr__(name: str):
+    if name == "__version__":
+        #: `plasmapy_sphinx` version string
+        value = _get_version()
+    elif name in _submodules:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _submodules | {"__version__"})
+
 
 del sys
@@ -49,12 +49,17 @@ to control the default behavior Sphinx and Sphinx extension packages like
 | |include_diagram|                         | Control if :rst:dir:`automodapi` should  |
 |                                           | display inheritance diagrams by default. |
 +-------------------------------------------+------------------------------------------+
+| |diagram_cache|                           | Cache the rendered inheritance diagrams  |
+|                                           | across builds.                           |
++-------------------------------------------+------------------------------------------+
 
 .. |with_diagrams| replace::
    :confval:`automodapi_groups_with_inheritance_diagrams`
 .. |include_diagram| replace::
    :confval:`automodapi_include_inheritance_diagram`
+.. |diagram_cache| replace::
+   :confval:`automodapi_inheritance_diagram_cache`
 
 """
 
-from plasmapy_sphinx.autodoc import automodapi
+from plasmapy_sphinx.autodoc import automodapi, inheritance
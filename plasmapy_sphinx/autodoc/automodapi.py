@@ -291,6 +291,15 @@ below relate to the behavior of the :rst:dir:`automodapi` directive.
     groups should have inheritance diagrams associated with them when displayed
     by :rst:dir:`automodapi`.
 
+.. confval:: automodapi_inheritance_diagram_cache
+
+    (Default `True`) Cache the rendered images of the inheritance diagrams in
+    the doctree directory of the build, keyed by a hash of the class graph and
+    the rendering options, so unchanged diagrams are not rendered by graphviz
+    again, not even for full rebuilds.  Cached diagrams not used by a complete
+    HTML build are removed from the cache.  (See
+    `~plasmapy_sphinx.autodoc.inheritance.InheritanceDiagramCache`.)
+
 .. confval:: automodapi_include_inheritance_diagram
 
     (Default `True`) Controls if :rst:dir:`automodapi` will by default generated
@@ -320,11 +329,13 @@ except ImportError:
         pass
 
 
+from sphinx.ext import inheritance_diagram
 from sphinx.ext.autodoc import bool_option, ModuleDocumenter
 from sphinx.locale import __
 from sphinx.util import logging
 from typing import Any, Callable, Dict, List, Optional, Union
 
+from plasmapy_sphinx.autodoc import inheritance
 from plasmapy_sphinx.automodsumm.core import AutomodsummOptions, option_str_list
 from plasmapy_sphinx.utils import default_grouping_info
 
@@ -816,10 +827,19 @@ def setup(app: Sphinx):
     rtn = setup_automodsumm(app)
 
     app.setup_extension("sphinx.ext.inheritance_diagram")
+    app.add_node(
+        inheritance_diagram.inheritance_diagram,
+        override=True,
+        html=(inheritance.html_visit_inheritance_diagram, None),
+    )
+    app.connect("builder-inited", inheritance.event_handler__builder_inited)
+    app.connect("doctree-resolved", inheritance.event_handler__doctree_resolved)
+    app.connect("build-finished", inheritance.event_handler__build_finished)
 
     app.add_autodocumenter(ModAPIDocumenter)
 
     app.add_config_value("automodapi_include_inheritance_diagram", True, True)
+    app.add_config_value("automodapi_inheritance_diagram_cache", True, True)
     app.add_config_value("automodapi_default_toctree_dir", "api", True)
     app.add_config_value(
         "automodapi_group_order",
@@ -0,0 +1,390 @@
+"""
+This module contains functionality for caching the images of the inheritance
+diagrams generated by :rst:dir:`automodapi` (and :rst:dir:`inheritance-diagram`)
+across builds.  Rendering a diagram spawns graphviz ``dot``, which dominates the
+write phase of an API with many classes.  Sphinx only avoids ``dot`` if the image
+still exists in the output directory, so full rebuilds re-render every diagram.
+
+The rendered images (and image maps) are stored in the doctree directory of the
+build, addressed by a hash of the ``dot`` code (i.e. the resolved class graph
+and its links) and the rendering options.  The HTML visitor of the
+:rst:dir:`inheritance-diagram` node restores a cached diagram into the output
+directory before rendering it, which makes Sphinx reuse the image without
+calling ``dot``.  Cached diagrams not used by a complete build are removed.
+(See configuration value :confval:`automodapi_inheritance_diagram_cache`.)
+"""
+__all__ = [
+    "InheritanceDiagramCache",
+    "event_handler__build_finished",
+    "event_handler__builder_inited",
+    "event_handler__doctree_resolved",
+    "html_visit_inheritance_diagram",
+]
+
+import hashlib
+import json
+import os
+import shutil
+
+from docutils import nodes
+from packaging.version import Version
+from sphinx import __version__ as sphinx_version
+from sphinx.ext import graphviz, inheritance_diagram
+from sphinx.util import logging
+from typing import Any, Dict
+
+if False:
+    # for annotation, does not need real import
+    from docutils.nodes import document
+    from sphinx.application import Sphinx
+    from sphinx.writers.html import HTMLTranslator
+
+logger = logging.getLogger(__name__)
+
+
+class InheritanceDiagramCache:
+    """
+    A persistent (on-disk), content-addressed cache of rendered inheritance
+    diagrams.  Each cache entry is a directory named by the key of the diagram
+    (see :meth:`key`) containing the files rendered by ``dot``, with the names
+    Sphinx gave them.
+
+    Entries are marked as used when they are stored or restored, and the
+    entries not used during a complete build are removed by :meth:`prune`.
+
+    Parameters
+    ----------
+    path : str
+        Path to the directory where the diagrams are cached.
+    """
+
+    _version = 1
+    _stamp_name = ".build"
+
+    def __init__(self, path: str):
+        self._path = path
+        self._resolved_docs = set()
+
+    def __getstate__(self):
+        # the cache is attached to the build environment, which is pickled
+        state = self.__dict__.copy()
+        state["_resolved_docs"] = set()
+        return state
+
+    @classmethod
+    def from_app(cls, app: "Sphinx") -> "InheritanceDiagramCache":
+        """
+        Create the cache associated with the Sphinx application ``app``.  The
+        cache is stored in the doctree directory of the build.
+        """
+        path = os.path.join(app.doctreedir, "plasmapy_sphinx", "inheritance_cache")
+        return cls(path)
+
+    @property
+    def path(self) -> str:
+        """Path to the directory where the diagrams are cached."""
+        return self._path
+
+    def key(
+        self,
+        translator: "HTMLTranslator",
+        code: str,
+        options: Dict[str, Any],
+        format: str,
+        prefix: str,
+    ) -> str:
+        """
+        Generate the key of the diagram with ``dot`` code ``code`` rendered by
+        ``translator`` to the image format ``format``.
+        """
+        builder = translator.builder
+        config = builder.config
+        key = [
+            self._version,
+            sphinx_version,
+            code,
+            str(options),
+            format,
+            prefix,
+            str(options.get("graphviz_dot", config.graphviz_dot)),
+            list(config.graphviz_dot_args),
+        ]
+        if format == "svg":
+            # links in SVG images are adjusted relative to the output directory
+            key.append(os.path.join(str(builder.outdir), builder.imagedir))
+
+        return hashlib.sha256(json.dumps(key).encode()).hexdigest()
+
+    def begin_build(self) -> None:
+        """
+        Mark the start of a build.  Entries not used after this are considered
+        unused by :meth:`prune`.
+        """
+        self._resolved_docs.clear()
+        os.makedirs(self._path, exist_ok=True)
+        with open(os.path.join(self._path, self._stamp_name), "w"):
+            pass
+
+    def note_resolved(self, docname: str) -> None:
+        """Note that document ``docname`` was resolved for writing."""
+        self._resolved_docs.add(docname)
+
+    def resolved_all(self, docnames) -> bool:
+        """
+        `True` if all documents ``docnames`` were resolved for writing during
+        the build, i.e. all of their diagrams were rendered.
+        """
+        return self._resolved_docs.issuperset(docnames)
+
+    def prune(self) -> int:
+        """
+        Remove the entries that were not used since the last call of
+        :meth:`begin_build`.  Returns the number of entries removed.
+        """
+        try:
+            started = os.stat(os.path.join(self._path, self._stamp_name)).st_mtime
+            names = os.listdir(self._path)
+        except OSError:
+            return 0
+
+        removed = 0
+        for name in names:
+            entry = os.path.join(self._path, name)
+            if name == self._stamp_name:
+                continue
+
+            try:
+                # entries are touched when used, possibly by parallel writers,
+                # so compare with the filesystem clock
+                if os.stat(entry).st_mtime >= started:
+                    continue
+            except OSError:
+                continue
+
+            shutil.rmtree(entry, ignore_errors=True)
+            removed += 1
+
+        return removed
+
+    def restore(self, key: str, imagedir: str) -> bool:
+        """
+        Copy the cached files of diagram ``key`` to the image directory
+        ``imagedir``.  Returns `False` if the diagram is not cached.
+        """
+        entry = os.path.join(self._path, key)
+        try:
+            names = os.listdir(entry)
+        except OSError:
+            return False
+
+        if not names:
+            return False
+
+        os.makedirs(imagedir, exist_ok=True)
+        for name in names:
+            target = os.path.join(imagedir, name)
+            if not os.path.isfile(target):
+                shutil.copyfile(os.path.join(entry, name), target)
+
+        # mark the entry as used
+        os.utime(entry)
+        return True
+
+    def store(self, key: str, outfn: str) -> None:
+        """
+        Cache the image ``outfn`` (and its image map, if any) rendered for
+        diagram ``key``.
+        """
+        entry = os.path.join(self._path, key)
+        if os.path.isdir(entry):
+            return
+
+        # fill a temporary directory, which is then moved into place, so
+        # parallel writers and interrupted builds never leave partial entries
+        tmp_entry = f"{entry}.{os.getpid()}.tmp"
+        os.makedirs(tmp_entry, exist_ok=True)
+        try:
+            for filename in (outfn, f"{outfn}.map"):
+                if os.path.isfile(filename):
+                    shutil.copyfile(
+                        filename, os.path.join(tmp_entry, os.path.basename(filename))
+                    )
+            os.rename(tmp_entry, entry)
+        except OSError:
+            # most likely, the diagram was cached by another process
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+
+
+def _generate_dot(
+    translator: "HTMLTranslator", node: inheritance_diagram.inheritance_diagram
+) -> str:
+    """
+    Generate the ``dot`` code of the inheritance diagram ``node``, as done by
+    the HTML visitor of `sphinx.ext.inheritance_diagram`.
+    """
+    builder = translator.builder
+    graph = node["graph"]
+    name = f"inheritance{inheritance_diagram.get_graph_hash(node)}"
+
+    # Create a mapping from fully-qualified class names to URLs.
+    svg = builder.config.graphviz_output_format.upper() == "SVG"
+    current_filename = builder.current_docname + builder.out_suffix
+    urls = {}
+    for child in node:
+        if Version(sphinx_version) < Version("7.2"):
+            if child.get("refuri") is not None:
+                prefix = "../" if svg else ""
+                urls[child["reftitle"]] = prefix + child.get("refuri")
+            elif child.get("refid") is not None:
+                prefix = f"../{current_filename}" if svg else ""
+                urls[child["reftitle"]] = f"{prefix}#{child.get('refid')}"
+        elif child.get("refuri") is not None:
+            # construct the name from the URI if the reference is external
+            # via intersphinx
+            if not child.get("internal", True):
+                refname = child["refuri"].rsplit("#", 1)[-1]
+            else:
+                refname = child["reftitle"]
+
+            urls[refname] = child.get("refuri")
+        elif child.get("refid") is not None:
+            prefix = os.path.basename(current_filename) if svg else ""
+            urls[child["reftitle"]] = f"{prefix}#{child.get('refid')}"
+
+    if Version(sphinx_version) < Version("8.2"):
+        return graph.generate_dot(name, urls, env=builder.env)
+
+    return graph._generate_dot(name, urls, config=builder.config)
+
+
+def _render_dot_cached(
+    translator: "HTMLTranslator",
+    cache: InheritanceDiagramCache,
+    code: str,
+    format: str,
+) -> None:
+    """
+    Make sure the image of the inheritance diagram with ``dot`` code ``code``
+    exists in the output directory, restoring it from ``cache`` or rendering
+    it (and storing it in ``cache``).
+    """
+    builder = translator.builder
+    try:
+        key = cache.key(translator, code, {}, format, "inheritance")
+        imagedir = os.path.join(str(builder.outdir), builder.imagedir)
+        if cache.restore(key, imagedir):
+            return
+    except OSError as err:
+        logger.warning(f"[automodapi] unable to read inheritance diagram cache: {err}")
+        return
+
+    try:
+        _, outfn = graphviz.render_dot(translator, code, {}, format, "inheritance")
+    except graphviz.GraphvizError:
+        # the error is reported when render_dot_html() renders the diagram
+        return
+
+    if outfn is None:
+        return
+
+    try:
+        cache.store(key, str(outfn))
+    except OSError as err:
+        logger.warning(
+            f"[automodapi] unable to write inheritance diagram cache: {err}"
+        )
+
+
+def html_visit_inheritance_diagram(
+    self: "HTMLTranslator", node: inheritance_diagram.inheritance_diagram
+) -> None:
+    """
+    HTML visitor of the :rst:dir:`inheritance-diagram` node, which renders the
+    diagram like the visitor of `sphinx.ext.inheritance_diagram`, but serves
+    the images from the
+    `~plasmapy_sphinx.autodoc.inheritance.InheritanceDiagramCache`.
+    """
+    cache = getattr(self.builder.env, "automodapi_inheritance_diagram_cache", None)
+    if cache is None:
+        return inheritance_diagram.html_visit_inheritance_diagram(self, node)
+
+    dotcode = _generate_dot(self, node)
+
+    format = self.builder.config.graphviz_output_format
+    if format in ("png", "svg"):
+        # the image exists after this, so render_dot_html() does not call dot
+        _render_dot_cached(self, cache, dotcode, format)
+
+    graphviz.render_dot_html(
+        self,
+        node,
+        dotcode,
+        {},
+        "inheritance",
+        "inheritance",
+        alt="Inheritance diagram of " + node["content"],
+    )
+    raise nodes.SkipNode
+
+
+def event_handler__builder_inited(app: "Sphinx") -> None:
+    """
+    Event handler for the Sphinx event :event:`builder-inited`.  This handler
+    attaches the `~plasmapy_sphinx.autodoc.inheritance.InheritanceDiagramCache`
+    (if enabled by :confval:`automodapi_inheritance_diagram_cache`) to the
+    build environment.
+    """
+    if app.config.automodapi_inheritance_diagram_cache:
+        cache = InheritanceDiagramCache.from_app(app)
+    else:
+        cache = None
+
+    if cache is not None and app.builder.format == "html":
+        try:
+            cache.begin_build()
+        except OSError as err:
+            logger.warning(
+                f"[automodapi] unable to write inheritance diagram cache: {err}"
+            )
+
+    app.env.automodapi_inheritance_diagram_cache = cache
+
+
+def event_handler__doctree_resolved(
+    app: "Sphinx", doctree: "document", docname: str
+) -> None:
+    """
+    Event handler for the Sphinx event :event:`doctree-resolved`.  This handler
+    notes the documents written by the build, so unused entries of the
+    `~plasmapy_sphinx.autodoc.inheritance.InheritanceDiagramCache` are only
+    pruned after complete builds.
+    """
+    cache = getattr(app.env, "automodapi_inheritance_diagram_cache", None)
+    if cache is not None:
+        cache.note_resolved(docname)
+
+
+def event_handler__build_finished(app: "Sphinx", exception: Exception) -> None:
+    """
+    Event handler for the Sphinx event :event:`build-finished`.  This handler
+    removes the entries of the
+    `~plasmapy_sphinx.autodoc.inheritance.InheritanceDiagramCache` not used
+    by a successful HTML build that wrote all documents.  (Incremental builds
+    do not render the diagrams of unchanged documents, so they cannot tell
+    which entries are unused.)
+    """
+    cache = getattr(app.env, "automodapi_inheritance_diagram_cache", None)
+    if (
+        exception is not None
+        or cache is None
+        or app.builder.format != "html"
+        or not cache.resolved_all(app.env.found_docs)
+    ):
+        return
+
+    removed = cache.prune()
+    if removed:
+        logger.info(
+            f"[automodapi] removed {removed} unused inheritance diagram(s) "
+            "from the cache"
+        )
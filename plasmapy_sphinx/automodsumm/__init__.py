@@ -38,16 +38,85 @@ to control the default behavior Sphinx and Sphinx extension packages like
 +--------------------------------------------------+-----------------------------------+
 | Configuration Value                              | Description                       |
 +==================================================+===================================+
+| :confval:`automodapi_class_member_cache`         | Used to control if the members of |
+|                                                  | documented classes are shared     |
+|                                                  | across class stub files.          |
++--------------------------------------------------+-----------------------------------+
 | :confval:`automodapi_custom_groups`              | Used to define custom groups to   |
 |                                                  | be displayed by the               |
 |                                                  | :rst:dir:`automodsumm` and        |
 |                                                  | :rst:dir:`automodapi` directives  |
 +--------------------------------------------------+-----------------------------------+
+| :confval:`automodapi_directive_index`            | Used to control if the directives |
+|                                                  | found in each document are        |
+|                                                  | indexed between builds.           |
++--------------------------------------------------+-----------------------------------+
+| :confval:`automodapi_directive_scanner`          | Used to select the engine that    |
+|                                                  | scans documents for directives.   |
++--------------------------------------------------+-----------------------------------+
 | :confval:`automodapi_generate_module_stub_files` | Used to control is stub files are |
 |                                                  | by default generated to modules   |
 |                                                  | (i.e. sub-packages and ``.py``    |
 |                                                  | files).                           |
 +--------------------------------------------------+-----------------------------------+
+| :confval:`automodapi_import_profile`             | Used to control if the imports of |
+|                                                  | the documented modules are        |
+|                                                  | profiled and reported.            |
++--------------------------------------------------+-----------------------------------+
+| :confval:`automodapi_inventory_cache`            | Used to control if module         |
+|                                                  | inventories are cached between    |
+|                                                  | builds.                           |
++--------------------------------------------------+-----------------------------------+
+| :confval:`automodapi_inventory_engine`           | Used to select if modules are     |
+|                                                  | inspected by importing them (in   |
+|                                                  | the Sphinx process or in worker   |
+|                                                  | subprocesses) or by statically    |
+|                                                  | parsing their source.             |
++--------------------------------------------------+-----------------------------------+
+| :confval:`automodapi_inventory_packages`         | Root packages whose module        |
+|                                                  | inventories are precomputed at    |
+|                                                  | the start of the build.           |
++--------------------------------------------------+-----------------------------------+
+| :confval:`automodapi_inventory_store_size`       | Maximum number of module          |
+|                                                  | inventories held in memory during |
+|                                                  | a build.                          |
++--------------------------------------------------+-----------------------------------+
+| |inv_max_modules|                                | Number of modules inspected by a  |
+|                                                  | worker subprocess before it is    |
+|                                                  | replaced.                         |
++--------------------------------------------------+-----------------------------------+
+| :confval:`automodapi_inventory_workers`          | Number of worker subprocesses     |
+|                                                  | used to inspect modules.          |
++--------------------------------------------------+-----------------------------------+
+| :confval:`automodapi_source_dependencies`        | Used to control if documents are  |
+|                                                  | re-read when the sources of their |
+|                                                  | documented modules change.        |
++--------------------------------------------------+-----------------------------------+
+| :confval:`automodapi_stub_manifest`              | Used to control if unchanged stub |
+|                                                  | files are skipped using a         |
+|                                                  | persisted manifest.               |
++--------------------------------------------------+-----------------------------------+
+| :confval:`automodapi_stub_metrics`               | Used to control if a JSON report  |
+|                                                  | of the stub file generation       |
+|                                                  | metrics is written.               |
++--------------------------------------------------+-----------------------------------+
+| :confval:`automodapi_stub_orphans`               | Used to control if stub files no  |
+|                                                  | longer generated are removed or   |
+|                                                  | reported.                         |
++--------------------------------------------------+-----------------------------------+
+| :confval:`automodapi_stub_workers`               | Number of worker processes used   |
+|                                                  | to render stub files.             |
++--------------------------------------------------+-----------------------------------+
+| :confval:`automodapi_stub_write_threads`         | Number of I/O threads used to     |
+|                                                  | write stub files.                 |
++--------------------------------------------------+-----------------------------------+
+| :confval:`automodapi_template_bytecode_cache`    | Used to control if compiled stub  |
+|                                                  | file templates are cached across  |
+|                                                  | builds.                           |
++--------------------------------------------------+-----------------------------------+
+
+.. |inv_max_modules| replace::
+   :confval:`automodapi_inventory_worker_max_modules`
 
 Connected Sphinx Events
 -----------------------
@@ -61,14 +130,68 @@ with the processed results.
 +------------------------------+-----------------------------------------------+
 | Event                        | Connected                                     |
 +==============================+===============================================+
-| :event:`builder-inited`      | |gendoc|                                      |
+| :event:`builder-inited`      | |inv_init|, |prof_init|, |walk_init|,         |
+|                              | |gendoc|                                      |
++------------------------------+-----------------------------------------------+
+| :event:`env-purge-doc`       | |inv_purge|                                   |
++------------------------------+-----------------------------------------------+
+| :event:`env-get-outdated`    | |inv_outdated|                                |
++------------------------------+-----------------------------------------------+
+| :event:`env-merge-info`      | |inv_merge|, |prof_merge|                     |
++------------------------------+-----------------------------------------------+
+| :event:`build-finished`      | |inv_finish|, |prof_finish|, |gen_finish|     |
 +------------------------------+-----------------------------------------------+
 | :event:`autodoc-skip-member` | |skip_mem|                                    |
 +------------------------------+-----------------------------------------------+
 
+.. |inv_init| replace::
+   `~plasmapy_sphinx.automodsumm.inventory.event_handler__builder_inited`
+.. |inv_purge| replace::
+   `~plasmapy_sphinx.automodsumm.inventory.event_handler__env_purge_doc`
+.. |inv_outdated| replace::
+   `~plasmapy_sphinx.automodsumm.inventory.event_handler__env_get_outdated`
+.. |inv_merge| replace::
+   `~plasmapy_sphinx.automodsumm.inventory.event_handler__env_merge_info`
+.. |inv_finish| replace::
+   `~plasmapy_sphinx.automodsumm.inventory.event_handler__build_finished`
+.. |prof_init| replace::
+   `~plasmapy_sphinx.automodsumm.profiler.event_handler__builder_inited`
+.. |prof_merge| replace::
+   `~plasmapy_sphinx.automodsumm.profiler.event_handler__env_merge_info`
+.. |prof_finish| replace::
+   `~plasmapy_sphinx.automodsumm.profiler.event_handler__build_finished`
+.. |walk_init| replace::
+   `~plasmapy_sphinx.automodsumm.walk.event_handler__builder_inited`
 .. |gendoc| replace:: `~plasmapy_sphinx.automodsumm.generate.GenDocsFromAutomodsumm`
+.. |gen_finish| replace::
+   `~plasmapy_sphinx.automodsumm.generate.GenDocsFromAutomodsumm.event_handler__build_finished`
 .. |skip_mem| replace::
    `~plasmapy_sphinx.automodsumm.generate.GenDocsFromAutomodsumm.event_handler__autodoc_skip_member`
 
+Command Line Interface
+----------------------
+
+The stub files can be generated outside of a Sphinx build with the
+``plasmapy-sphinx-autogen`` command (see `plasmapy_sphinx.automodsumm.autogen`),
+which produces the same stub files as the build.
+
+.. code-block:: bash
+
+    $ plasmapy-sphinx-autogen docs -j 4
+    $ plasmapy-sphinx-autogen docs --check
+
+With ``--watch``, the command keeps regenerating the stub files affected by
+edits to the documents or the documented modules (see
+`plasmapy_sphinx.automodsumm.watch`).
+
+The ``plasmapy-sphinx-server`` command runs builds from a long-lived local
+server, which keeps the documented packages imported between builds (see
+`plasmapy_sphinx.automodsumm.server`).
+
+.. code-block:: bash
+
+    $ plasmapy-sphinx-server serve docs docs/_build/html &
+    $ plasmapy-sphinx-server build
+
 """
 from plasmapy_sphinx.automodsumm import core, generate
@@ -0,0 +1,284 @@
+"""
+This module contains the ``plasmapy-sphinx-autogen`` command line interface,
+which generates the stub files of the :rst:dir:`automodapi` and
+:rst:dir:`automodsumm` directives outside of a Sphinx build (e.g. as a separate
+CI step before the documentation is built).
+
+.. code-block:: bash
+
+    $ plasmapy-sphinx-autogen docs -j 4
+    $ plasmapy-sphinx-autogen docs --check --plan stub_plan.json
+
+The ``conf.py`` of the documentation is loaded and the stub files are generated
+just like at the start of a build (i.e. by
+`~plasmapy_sphinx.automodsumm.generate.GenDocsFromAutomodsumm` at
+:event:`builder-inited`), so the stub files are byte-identical to those
+generated by the build.  The stub manifest, directive index, and inventory
+cache are kept in the doctree directory (``-d``, by default
+``<sourcedir>/_build/doctrees``), so a build using the same doctree directory
+reuses them.
+
+With ``--check``, no stub file is written or removed, and the command exits with
+status ``1`` if any stub file is stale (i.e. it would be written or removed).
+With ``--plan``, the plan of the stub file generation (see
+`~plasmapy_sphinx.automodsumm.generate.GenDocsFromAutomodsumm.plan`) is written
+as JSON to the given file, or to stdout if ``-``.  With ``--watch``, the command
+keeps running after the generation and regenerates the stub files affected by
+changes to the documents or the documented modules (see
+`plasmapy_sphinx.automodsumm.watch`).
+"""
+__all__ = ["AutogenApplication", "main"]
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+from sphinx.application import Sphinx
+from sphinx.errors import SphinxError
+from typing import Any, Dict, List, TextIO
+
+from plasmapy_sphinx.automodsumm import inventory
+from plasmapy_sphinx.automodsumm.watch import watch_stubs
+
+STALE_STATUSES = ("written", "removed")
+"""Statuses of the stub files (see ``--plan``) that make a ``--check`` fail."""
+
+
+class AutogenApplication(Sphinx):
+    """
+    A `~sphinx.application.Sphinx` application recording the plan of the stub
+    file generation performed at its initialization (i.e. at
+    :event:`builder-inited`) in :attr:`automodsumm_plan`.
+
+    Parameters
+    ----------
+    *args, **kwargs
+        The arguments of `~sphinx.application.Sphinx`.
+
+    dry_run : bool
+        (Default `False`) Set `True` to only compare the stub files, without
+        writing or removing any of them.
+    """
+
+    def __init__(self, *args, dry_run: bool = False, **kwargs):
+        self.automodsumm_dry_run = dry_run
+        self.automodsumm_plan = []  # type: List[Dict[str, Any]]
+        super().__init__(*args, **kwargs)
+
+    def finish(self) -> None:
+        """
+        Persist the inventory cache and stop the workers of the ``"subprocess"``
+        inventory engine, as done at the end of a build.
+        """
+        inventory.event_handler__build_finished(self, None)
+
+
+def _jobs(value: str) -> int:
+    """Convert the ``-j`` argument, where ``"auto"`` is one worker per CPU."""
+    if value == "auto":
+        return 0
+
+    try:
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{value}' is not a number of workers")
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Create the argument parser of ``plasmapy-sphinx-autogen``."""
+    parser = argparse.ArgumentParser(
+        prog="plasmapy-sphinx-autogen",
+        description=(
+            "Generate the stub files of the automodapi and automodsumm "
+            "directives of a Sphinx project, like at the start of a build."
+        ),
+    )
+    parser.add_argument("sourcedir", help="path to the documentation source files")
+    parser.add_argument(
+        "-c",
+        dest="confdir",
+        default=None,
+        help="directory containing conf.py (default: sourcedir)",
+    )
+    parser.add_argument(
+        "-d",
+        dest="doctreedir",
+        default=None,
+        help=(
+            "directory for the stub manifest and the caches "
+            "(default: sourcedir/_build/doctrees)"
+        ),
+    )
+    parser.add_argument(
+        "-b",
+        dest="builder",
+        default="dummy",
+        help="builder the project is configured for (default: dummy)",
+    )
+    parser.add_argument(
+        "-D",
+        dest="define",
+        action="append",
+        default=[],
+        metavar="setting=value",
+        help="override a setting in conf.py",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_jobs,
+        default=None,
+        metavar="N",
+        help=(
+            "number of worker processes rendering stub files, 'auto' for one "
+            "per CPU (default: automodapi_stub_workers)"
+        ),
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="do not write stub files, exit with 1 if any stub file is stale",
+    )
+    parser.add_argument(
+        "--plan",
+        default=None,
+        metavar="FILE",
+        help="write the stub file plan as JSON to FILE ('-' for stdout)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="keep regenerating the stub files affected by source changes",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.25,
+        metavar="SECONDS",
+        help="seconds between polls of the watched files (default: 0.25)",
+    )
+    parser.add_argument(
+        "-v",
+        dest="verbosity",
+        action="count",
+        default=0,
+        help="increase verbosity (can be repeated)",
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="only print warnings and errors"
+    )
+    return parser
+
+
+def _relpath(filename: str, srcdir: str) -> str:
+    return None if filename is None else os.path.relpath(filename, srcdir)
+
+
+def _report(
+    app: AutogenApplication, args: argparse.Namespace, srcdir: str, status: TextIO
+) -> int:
+    """
+    Write the plan of the stub file generation and summarize it.  Returns the
+    exit status.
+    """
+    stubs = [
+        dict(
+            record,
+            filename=_relpath(record["filename"], srcdir),
+            sources=[_relpath(source, srcdir) for source in record["sources"]],
+        )
+        for record in app.automodsumm_plan
+    ]
+    stale = [stub for stub in stubs if stub["status"] in STALE_STATUSES]
+
+    if args.plan is not None:
+        plan = {"srcdir": srcdir, "check": args.check, "stubs": stubs}
+        if args.plan == "-":
+            json.dump(plan, sys.stdout, indent=2)
+            sys.stdout.write("\n")
+        else:
+            with open(args.plan, "w", encoding="utf-8") as f:
+                json.dump(plan, f, indent=2)
+
+    counts = {}  # type: Dict[str, int]
+    for stub in stubs:
+        counts[stub["status"]] = counts.get(stub["status"], 0) + 1
+    summary = ", ".join(f"{count} {name}" for name, count in sorted(counts.items()))
+    if not args.quiet:
+        print(
+            f"[automodsumm] {len(stubs)} stub files: {summary or 'none'}", file=status
+        )
+
+    if args.check and stale:
+        print(f"[automodsumm] {len(stale)} stub files are stale:", file=sys.stderr)
+        for stub in stale:
+            print(f"    {stub['filename']} ({stub['status']})", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Entry point of ``plasmapy-sphinx-autogen``.  Returns the exit status, which
+    is ``1`` if ``--check`` found stale stub files and ``2`` on errors.
+    """
+    parser = get_parser()
+    args = parser.parse_args(argv)
+
+    srcdir = os.path.abspath(args.sourcedir)
+    confdir = srcdir if args.confdir is None else os.path.abspath(args.confdir)
+    if args.doctreedir is None:
+        doctreedir = os.path.join(srcdir, "_build", "doctrees")
+    else:
+        doctreedir = os.path.abspath(args.doctreedir)
+
+    overrides = {}  # type: Dict[str, Any]
+    for define in args.define:
+        name, sep, value = define.partition("=")
+        if not sep:
+            parser.error(f"-D option argument must be in the form name=value: {define}")
+        overrides[name] = value
+    if args.jobs is not None:
+        overrides["automodapi_stub_workers"] = args.jobs
+    if args.watch and args.check:
+        parser.error("--watch can not be combined with --check")
+
+    # keep stdout clean for the JSON plan
+    status = sys.stderr if args.plan == "-" else sys.stdout
+
+    with tempfile.TemporaryDirectory(prefix="plasmapy_sphinx_autogen_") as outdir:
+        try:
+            app = AutogenApplication(
+                srcdir,
+                confdir,
+                outdir,
+                doctreedir,
+                args.builder,
+                confoverrides=overrides,
+                status=None if args.quiet else status,
+                warning=sys.stderr,
+                verbosity=args.verbosity,
+                dry_run=args.check,
+            )
+        except SphinxError as err:
+            print(f"plasmapy-sphinx-autogen: error: {err}", file=sys.stderr)
+            return 2
+
+        exit_status = _report(app, args, srcdir, status)
+
+        if args.watch:
+            try:
+                watch_stubs(app, interval=args.interval)
+            except KeyboardInterrupt:
+                pass
+
+        app.finish()
+
+    return exit_status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -145,6 +145,16 @@ A configuration value is a variable that con be defined in ``conf.py`` to config
 the default behavior of related `sphinx` directives.  The configuration values
 below relate to the behavior of the :rst:dir:`automodsumm` directive.
 
+.. confval:: automodapi_class_member_cache
+
+    (Default `True`)  Share the enumerated members of the documented classes
+    across all class stub files of a build.  Members inherited by several
+    documented classes are then classified, and passed through
+    :event:`autodoc-skip-member`, only once instead of once per class stub
+    file.  The rendered stub files are identical.  Set to `False` to have
+    `sphinx.ext.autosummary` enumerate the members of each class.  (See
+    `~plasmapy_sphinx.automodsumm.members.ClassMemberCache`.)
+
 .. confval:: automodapi_custom_groups
 
     Configuration value used to define custom groups which are used by
@@ -182,6 +192,25 @@ below relate to the behavior of the :rst:dir:`automodsumm` directive.
     .. automodsumm:: plasmapy.formulary.speeds
            :groups: aliases
 
+.. confval:: automodapi_directive_index
+
+    (Default `True`)  Persist the :rst:dir:`automodapi` and
+    :rst:dir:`automodsumm` directives found in each source document to the
+    build's doctree directory.  In subsequent builds, documents with an
+    unchanged modification time and size are not re-read and re-scanned when
+    generating stub files.  Only used with the ``"single-pass"``
+    :confval:`automodapi_directive_scanner`.
+
+.. confval:: automodapi_directive_scanner
+
+    (Default ``"single-pass"``)  The engine used to scan the source documents
+    for the :rst:dir:`automodapi` and :rst:dir:`automodsumm` directives when
+    generating stub files.  The ``"single-pass"`` engine skips documents that
+    do not contain ``"automod"`` and finds all directives (and their options)
+    with a single regular expression pass over the whole document.  The
+    ``"lines"`` engine searches the document line-by-line.  Both engines find
+    the same directives.
+
 .. confval:: automodapi_generate_module_stub_files
 
     (Default `False`)  By default :rst:dir:`automodsumm` will not generated stub files
@@ -192,6 +221,139 @@ below relate to the behavior of the :rst:dir:`automodsumm` directive.
     is set `True`.  Setting this configure variable to `True` will cause stub
     files to be generated for the **modules** group.
 
+.. confval:: automodapi_import_profile
+
+    (Default `False`)  Set `True` to profile the imports performed to inspect
+    the documented modules and to generate the stub files.  The wall time and
+    memory of each import, and the time spent importing each (third-party)
+    package, are written as ranked reports ``automodsumm_import_profile.json``
+    and ``automodsumm_import_profile.txt`` to the output directory.  (See
+    `~plasmapy_sphinx.automodsumm.profiler.ImportProfiler`.)
+
+.. confval:: automodapi_inventory_cache
+
+    (Default `True`)  Inspecting a module for :rst:dir:`automodsumm` requires the
+    module be imported, which can be expensive for large packages.  When enabled,
+    the inventory of each inspected module (i.e. names, qualified names, and
+    groups of the found objects) is cached to the build's doctree directory and
+    reused in subsequent builds, as long as the module's source files, the
+    :confval:`automodapi_custom_groups` definition, and the `plasmapy_sphinx`
+    and `sphinx` versions are unchanged.  Set to `False` to always inspect
+    modules by importing them.
+
+.. confval:: automodapi_inventory_engine
+
+    (Default ``"import"``)  The engine used to inspect modules.  The
+    ``"import"`` engine imports the module and inspects the live objects.  The
+    ``"static"`` engine parses the module source instead (see
+    `plasmapy_sphinx.automodsumm.static`), and only imports a module when
+    some of its objects can not be statically classified.  The
+    ``"subprocess"`` engine imports and inspects the module in a pool of
+    worker subprocesses (see `plasmapy_sphinx.automodsumm.isolated`), so the
+    inspection does not leave the module's import graph in the Sphinx process
+    and modules are inspected in parallel.
+
+.. confval:: automodapi_inventory_packages
+
+    (Default ``[]``)  A list of root packages (e.g. ``["plasmapy"]``) whose
+    module inventories are precomputed at the start of the build.  Each package
+    is walked once, and the inventories of all its (non-test, non-private)
+    sub-packages and modules are pinned into the build's inventory store, so
+    the :rst:dir:`automodapi` and :rst:dir:`automodsumm` directives are served
+    from it no matter how often a module is referenced.  The inventories are
+    still served from, and saved to, the inventory cache (see
+    :confval:`automodapi_inventory_cache`).  (See
+    `plasmapy_sphinx.automodsumm.walk`.)
+
+.. confval:: automodapi_inventory_worker_max_modules
+
+    (Default ``50``)  Number of modules a worker subprocess of the
+    ``"subprocess"`` :confval:`automodapi_inventory_engine` inspects before it
+    is replaced by a fresh worker, which releases the memory held by the
+    modules it imported.
+
+.. confval:: automodapi_inventory_workers
+
+    (Default ``2``)  Number of worker subprocesses used by the
+    ``"subprocess"`` :confval:`automodapi_inventory_engine`.  A value of ``0``
+    (or less) uses one worker per CPU.
+
+.. confval:: automodapi_inventory_store_size
+
+    (Default ``1024``)  Within a build, module inventories are held in memory so
+    each module is only inspected once, no matter how many times it is
+    referenced by :rst:dir:`automodapi` and :rst:dir:`automodsumm`.  This sets
+    the maximum number of inventories held, beyond which the least recently
+    used inventory is discarded.
+
+.. confval:: automodapi_source_dependencies
+
+    (Default `True`)  When enabled, the source files of the modules documented
+    by the :rst:dir:`automodapi` and :rst:dir:`automodsumm` directives of a
+    document (including the modules the documented objects are re-exported
+    from) are recorded as dependencies of the document.  Incremental builds
+    then re-read the documents whose module sources changed content, without
+    the need for a full (``-E``) rebuild.  Set to `False` to only re-read
+    documents when they change.  (See
+    `~plasmapy_sphinx.automodsumm.inventory.SourceDependencies`.)
+
+.. confval:: automodapi_stub_manifest
+
+    (Default `True`)  Keep a manifest of the generated stub files in the
+    build's doctree directory.  The manifest records a hash of the inputs each
+    stub file was rendered from (the entry, templates, relevant configuration
+    values, and versions) and the fingerprints of the documented object's
+    source files.  Stub files whose inputs are unchanged are neither
+    re-rendered nor re-read in subsequent builds.  The manifest is also used to
+    find orphaned stub files (see :confval:`automodapi_stub_orphans`).
+
+.. confval:: automodapi_stub_metrics
+
+    (Default `True`)  Write the counters and timers gathered for each phase of
+    the stub file generation (files scanned, directives found, modules
+    imported, import and render times, stub files written or skipped, etc.) as
+    the JSON report ``automodsumm_metrics.json`` to the build's output
+    directory (see `~plasmapy_sphinx.automodsumm.metrics.StubGenMetrics`).  A
+    summary of the metrics is always reported in the build log.
+
+.. confval:: automodapi_stub_orphans
+
+    (Default ``"warn"``)  What to do with stub files recorded in the stub
+    manifest (see :confval:`automodapi_stub_manifest`) that are no longer
+    generated by any :rst:dir:`automodapi` or :rst:dir:`automodsumm` directive,
+    e.g. the stub file of an object removed from the documented package.  Set to
+    ``"remove"`` to delete the stub files, or ``"warn"`` to only report them.
+    Files not generated by `plasmapy_sphinx` are never removed, and neither are
+    the stub files of objects, or of documents with directives on modules,
+    that failed to import.
+
+.. confval:: automodapi_stub_workers
+
+    (Default ``1``)  Number of worker processes used to render the stub files.
+    With more than one worker, the stub files are rendered by a forked process
+    pool, where the entries of each module are handled by a single worker and
+    the modules with the most entries are scheduled first.  A value of ``0``
+    (or less) uses one worker per CPU.  The written stub files do not depend on
+    the number of workers.  Forking is not supported on all platforms (e.g.
+    Windows), in which case the stub files are always rendered serially.
+
+.. confval:: automodapi_stub_write_threads
+
+    (Default ``4``)  Number of I/O threads used to write the stub files.  The
+    stub files are queued to the threads while the remaining stub files are
+    rendered.  Each stub file is only written if its content changed (leaving
+    the modification time of unchanged stub files untouched) and is written to
+    a temporary file that then replaces the stub file, so an interrupted build
+    never leaves a truncated stub file behind.  A value of ``0`` writes the stub
+    files without threads.
+
+.. confval:: automodapi_template_bytecode_cache
+
+    (Default `True`)  Cache the compiled stub file templates in the build's
+    doctree directory, so subsequent builds do not need to re-compile the
+    templates.  The cache is keyed by the template source, so modified
+    templates are always re-compiled.
+
 .. confval:: autosummary_generate
 
     Same as the :rst:dir:`autosummary` configuration value `autosummary_generate
@@ -207,18 +369,19 @@ __all__ = [
 
 import os
 
-from importlib import import_module
 from packaging.version import Version
 from sphinx import __version__ as sphinx_version
 from sphinx.ext.autosummary import Autosummary
 from sphinx.util import logging
 from typing import Any, Callable, Dict, List, Tuple, Union
 
+from plasmapy_sphinx.automodsumm import inventory, profiler, walk
 from plasmapy_sphinx.automodsumm.generate import GenDocsFromAutomodsumm
 from plasmapy_sphinx.utils import (
     default_grouping_info,
     find_mod_objs,
     get_custom_grouping_info,
+    ModuleInventory,
 )
 
 if False:
@@ -302,6 +465,10 @@ class AutomodsummOptions:
         self._docname = docname
         self._warn = self.logger.warning
 
+        self._mod_objs = None  # type: Union[ModuleInventory, None]
+        self._mod_objs_filtered = None  # type: Union[ModuleInventory, None]
+        self._import_failed = False
+
         self.toctree = {
             "original": None,
             "rel_to_doc": None,
@@ -330,6 +497,14 @@ class AutomodsummOptions:
         """Name of the document where :rst:dir:`automodsumm` was declared."""
         return self._docname
 
+    @property
+    def import_failed(self) -> bool:
+        """
+        `True` if the module named by :attr:`modname` could not be imported
+        when its objects were collected (see :attr:`mod_objs_option_filtered`).
+        """
+        return self._import_failed
+
     @property
     def warn(self) -> Callable:
         """
@@ -344,11 +519,7 @@ class AutomodsummOptions:
         Is module specified by :attr:`modname` a package or module (i.e. `.py` file).
         Return ``"pkg"`` for a package and ``"module"`` for a `.py` file.
         """
-        mod = import_module(self.modname)
-        if mod.__package__ == mod.__name__:
-            return "pkg"
-        else:
-            return "module"
+        return self.mod_inventory["pkg_or_module"]
 
     def condition_options(self):
         """
@@ -429,15 +600,33 @@ class AutomodsummOptions:
         self.options["groups"] = list(do_groups)
 
     @property
-    def mod_objs(self) -> Dict[str, Dict[str, Any]]:
+    def mod_objs(self) -> ModuleInventory:
         """
-        Dictionary of the grouped objects found in the module named by :attr:`modname`.
+        Inventory of the grouped objects found in the module named by :attr:`modname`.
 
         See Also
         --------
         plasmapy_sphinx.utils.find_mod_objs
         """
-        return find_mod_objs(self.modname, app=self.app)
+        if self._mod_objs is None:
+            self._mod_objs = find_mod_objs(self.modname, app=self.app)
+        return self._mod_objs
+
+    @property
+    def mod_inventory(self) -> Dict[str, Any]:
+        """
+        The inventory of the module named by :attr:`modname`.  Unlike
+        :attr:`mod_objs`, the inventory does not contain the object instances and
+        is shared by all the directives of a build and served from the build's
+        inventory cache when possible.
+
+        See Also
+        --------
+        plasmapy_sphinx.automodsumm.inventory.get_inventory
+        """
+        return inventory.get_inventory(
+            self.modname, app=self.app, docname=self.docname
+        )
 
     @property
     def groupings(self) -> set:
@@ -477,59 +666,37 @@ class AutomodsummOptions:
         return grouping_info
 
     @property
-    def mod_objs_option_filtered(self) -> Dict[str, Dict[str, Any]]:
+    def mod_objs_option_filtered(self) -> ModuleInventory:
         """
-        A filtered version of :attr:`mod_objs` according to the specifications
-        given in :attr:`options` (i.e. those given to :rst:dir:`automodsumm`).
+        A filtered version of the grouped names and qualified names of
+        :attr:`mod_inventory` according to the specifications given in
+        :attr:`options` (i.e. those given to :rst:dir:`automodsumm`).  The
+        inventory is filtered on first access.
         """
+        if self._mod_objs_filtered is not None:
+            return self._mod_objs_filtered
+
         try:
-            mod_objs = self.mod_objs
+            groups = self.mod_inventory["groups"]
         except ImportError:
-            mod_objs = {}
+            groups = {}
+            self._import_failed = True
             self.warn(f"Could not import module {self.modname}")
 
         do_groups = set(self.options["groups"])
 
         if len(do_groups) == 0:
-            return {}
-
-        # remove excluded groups
-        for group in list(mod_objs):
-            if group not in do_groups:
-                del mod_objs[group]
+            self._mod_objs_filtered = ModuleInventory(self.modname, {})
+            return self._mod_objs_filtered
 
         # objects to skip
         skip_names = set()
         if "skip" in self.options:
             skip_names = set(self.options["skip"])
 
-        # filter out skipped objects
-        for group in list(mod_objs.keys()):
-
-            names = mod_objs[group]["names"]
-            qualnames = mod_objs[group]["qualnames"]
-            objs = mod_objs[group]["objs"]
-
-            names_filtered = []
-            qualnames_filtered = []
-            objs_filtered = []
-
-            for name, qualname, obj in zip(names, qualnames, objs):
-                if not (name in skip_names or qualname in skip_names):
-                    names_filtered.append(name)
-                    qualnames_filtered.append(qualname)
-                    objs_filtered.append(obj)
-
-            if len(names_filtered) == 0:
-                del mod_objs[group]
-                continue
-
-            mod_objs[group] = {
-                "names": names_filtered,
-                "qualnames": qualnames_filtered,
-                "objs": objs_filtered,
-            }
-        return mod_objs
+        mod_objs = ModuleInventory.from_groups(self.modname, groups)
+        self._mod_objs_filtered = mod_objs.filtered(groups=do_groups, skip=skip_names)
+        return self._mod_objs_filtered
 
     def generate_obj_list(self, exclude_modules: bool = False) -> List[str]:
         """
@@ -543,30 +710,8 @@ class AutomodsummOptions:
             (Default `False`) Set `True` to exclude the qualified names related to
             objects sorted in the **modules** group.
         """
-
-        mod_objs = self.mod_objs_option_filtered
-
-        if not bool(mod_objs):
-            return []
-
-        gather_groups = set(mod_objs.keys())
-        if exclude_modules:
-            gather_groups.discard("modules")
-
-        names = []
-        qualnames = []
-        for group in gather_groups:
-            names.extend(mod_objs[group]["names"])
-            qualnames.extend(mod_objs[group]["qualnames"])
-
-        content = [
-            qualname
-            for name, qualname in sorted(
-                zip(names, qualnames), key=lambda x: str.casefold(x[0])
-            )
-        ]
-
-        return content
+        exclude_groups = {"modules"} if exclude_modules else set()
+        return self.mod_objs_option_filtered.sorted_qualnames(exclude_groups)
 
 
 class Automodsumm(Autosummary):
@@ -694,14 +839,53 @@ def setup(app: "Sphinx"):
 
     app.add_directive("automodsumm", Automodsumm)
 
+    # the inventory store and cache need to be attached to the build environment before
+    # the stub files are generated
+    app.connect(
+        "builder-inited", inventory.event_handler__builder_inited, priority=400
+    )
+    app.connect("env-purge-doc", inventory.event_handler__env_purge_doc)
+    app.connect("env-get-outdated", inventory.event_handler__env_get_outdated)
+    app.connect("env-merge-info", inventory.event_handler__env_merge_info)
+    app.connect("build-finished", inventory.event_handler__build_finished)
+
+    # the packages are walked after the inventory store is attached, but before
+    # the stub files are generated
+    app.connect("builder-inited", walk.event_handler__builder_inited, priority=450)
+
+    # the import profiler needs to be attached before the stub files are generated
+    app.connect("builder-inited", profiler.event_handler__builder_inited, priority=400)
+    app.connect("env-merge-info", profiler.event_handler__env_merge_info)
+    app.connect("build-finished", profiler.event_handler__build_finished)
+
     gendocs_from_automodsumm = GenDocsFromAutomodsumm()
     app.connect("builder-inited", gendocs_from_automodsumm)
     app.connect(
         "autodoc-skip-member",
         gendocs_from_automodsumm.event_handler__autodoc_skip_member,
     )
+    app.connect(
+        "build-finished", gendocs_from_automodsumm.event_handler__build_finished
+    )
 
+    app.add_config_value("automodapi_class_member_cache", True, True)
     app.add_config_value("automodapi_custom_groups", dict(), True)
+    app.add_config_value("automodapi_directive_index", True, True)
+    app.add_config_value("automodapi_directive_scanner", "single-pass", True)
     app.add_config_value("automodapi_generate_module_stub_files", False, True)
+    app.add_config_value("automodapi_import_profile", False, True)
+    app.add_config_value("automodapi_inventory_cache", True, True)
+    app.add_config_value("automodapi_inventory_engine", "import", True)
+    app.add_config_value("automodapi_inventory_packages", [], True)
+    app.add_config_value("automodapi_inventory_store_size", 1024, True)
+    app.add_config_value("automodapi_inventory_worker_max_modules", 50, True)
+    app.add_config_value("automodapi_inventory_workers", 2, True)
+    app.add_config_value("automodapi_source_dependencies", True, True)
+    app.add_config_value("automodapi_stub_manifest", True, True)
+    app.add_config_value("automodapi_stub_metrics", True, True)
+    app.add_config_value("automodapi_stub_orphans", "warn", True)
+    app.add_config_value("automodapi_stub_workers", 1, True)
+    app.add_config_value("automodapi_stub_write_threads", 4, True)
+    app.add_config_value("automodapi_template_bytecode_cache", True, True)
 
     return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -4,14 +4,21 @@ the :rst:dir:`automodapi` and :rst:dir:`automodsumm` directives.
 """
 __all__ = ["AutomodsummEntry", "AutomodsummRenderer", "GenDocsFromAutomodsumm"]
 
+import multiprocessing
 import os
 import re
+import sys
 
-from jinja2 import TemplateNotFound
+from jinja2 import FileSystemBytecodeCache, Template, TemplateNotFound
 from packaging.version import Version
 from sphinx import __version__ as sphinx_version
 from sphinx.ext.autodoc.mock import mock
-from sphinx.ext.autosummary import get_rst_suffix, import_by_name, import_ivar_by_name
+from sphinx.ext.autosummary import (
+    ImportExceptionGroup,
+    get_rst_suffix,
+    import_by_name,
+    import_ivar_by_name,
+)
 from sphinx.ext.autosummary.generate import (
     AutosummaryEntry,
     AutosummaryRenderer,
@@ -19,9 +26,19 @@ from sphinx.ext.autosummary.generate import (
 )
 from sphinx.locale import __
 from sphinx.util import logging
-from sphinx.util.osutil import ensuredir
-from typing import Any, Dict, List
-
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from plasmapy_sphinx.automodsumm.index import DirectiveIndex
+from plasmapy_sphinx.automodsumm.inventory import prefetch_inventories
+from plasmapy_sphinx.automodsumm.manifest import (
+    StubManifest,
+    _hash_templates,
+    gather_entry_sources,
+)
+from plasmapy_sphinx.automodsumm.members import ClassMemberCache
+from plasmapy_sphinx.automodsumm.metrics import StubGenMetrics
+from plasmapy_sphinx.automodsumm.profiler import profile_import
+from plasmapy_sphinx.automodsumm.writer import StubWriter
 from plasmapy_sphinx.utils import templates_dir
 
 if False:
@@ -31,6 +48,51 @@ if False:
 
 logger = logging.getLogger(__name__)
 
+_pool_state = {}  # type: Dict[str, Any]
+"""
+State shared with the forked stub rendering workers (see
+`~plasmapy_sphinx.automodsumm.generate.GenDocsFromAutomodsumm.render_entries`).
+The state is set by the parent process right before the pool is forked, so the
+workers inherit it without pickling.
+"""
+
+
+def _render_shard(
+    entries: List["AutomodsummEntry"],
+) -> Tuple[
+    List[Tuple["AutomodsummEntry", Any, Optional[str]]],
+    Dict[str, Any],
+    List[Dict[str, Any]],
+]:
+    """
+    Render the stub files for a shard of entries in a pool worker.  Returns a
+    list of ``(entry, (name, content, sources), warning)`` tuples, where
+    ``(name, content, sources)`` is `None` if the entry could not be rendered,
+    the `~plasmapy_sphinx.automodsumm.metrics.StubGenMetrics` gathered while
+    rendering the shard (as a dictionary), and the call records of the
+    `~plasmapy_sphinx.automodsumm.profiler.ImportProfiler` made while rendering
+    the shard.
+    """
+    gendocs = _pool_state["gendocs"]
+    gendocs.metrics = StubGenMetrics()
+    if gendocs.member_cache is not None:
+        gendocs.member_cache.metrics = gendocs.metrics
+    profiler = getattr(gendocs.app.env, "automodsumm_import_profiler", None)
+    n_calls = 0 if profiler is None else len(profiler.calls)
+    results = []
+    for entry in entries:
+        try:
+            rendered = gendocs.render_entry(
+                entry,
+                _pool_state["template"],
+                imported_members=_pool_state["imported_members"],
+            )
+            results.append((entry, rendered, None))
+        except ImportError as err:
+            results.append((entry, None, str(err)))
+    calls = [] if profiler is None else profiler.calls[n_calls:]
+    return results, gendocs.metrics.as_dict(), calls
+
 
 class AutomodsummEntry(AutosummaryEntry):
     """
@@ -59,7 +121,9 @@ class AutomodsummEntry(AutosummaryEntry):
 class AutomodsummRenderer(AutosummaryRenderer):
     """
     A helper class for retrieving and rendering :rst:dir:`automodsumm` templates
-    when writing stub files.
+    when writing stub files.  Resolved templates are memoized by the renderer,
+    and the compiled templates are cached on disk across builds (see
+    :confval:`automodapi_template_bytecode_cache`).
 
     Parameters
     ----------
@@ -70,13 +134,62 @@ class AutomodsummRenderer(AutosummaryRenderer):
 
     def __init__(self, app: "Sphinx") -> None:
 
-        # add plasmapy_sphinx templates directory to the overall templates path
-        asumm_path = templates_dir
-        relpath = os.path.relpath(asumm_path, start=app.srcdir)
-        app.config.templates_path.append(relpath)
+        # add plasmapy_sphinx templates directory to the overall templates path,
+        # unless it is already registered
+        asumm_path = os.path.normpath(templates_dir)
+        registered = {
+            os.path.normpath(os.path.join(app.srcdir, path))
+            for path in app.config.templates_path
+        }
+        if asumm_path not in registered:
+            relpath = os.path.relpath(asumm_path, start=app.srcdir)
+            app.config.templates_path.append(relpath)
 
         super().__init__(app)
 
+        if getattr(app.config, "automodapi_template_bytecode_cache", False):
+            cache_dir = os.path.join(app.doctreedir, "plasmapy_sphinx", "jinja_cache")
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+            except OSError:
+                pass
+            else:
+                self.env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+
+        self._templates = {}  # type: Dict[str, Template]
+
+    def get_template(self, template_name: str) -> Template:
+        """
+        Retrieve the template for ``template_name`` (see :meth:`render`).  The
+        resolved template is memoized, so the template search is only performed
+        once per template name (or object type).
+
+        Parameters
+        ----------
+        template_name : str
+            Name of the template file, or the object type to be rendered.
+        """
+        template = self._templates.get(template_name, None)
+        if template is not None:
+            return template
+
+        name = template_name
+        if not name.endswith(".rst"):
+            # if does not have '.rst' then objtype likely given for template_name
+            name += ".rst"
+
+        for candidate in [name, "base.rst"]:
+            for _path in ["", "automodsumm/", "autosummary/"]:
+                try:
+                    template = self.env.get_template(_path + candidate)
+                except TemplateNotFound:
+                    continue
+
+                self._templates[template_name] = template
+                return template
+
+        raise TemplateNotFound(template_name)
+
     def render(self, template_name: str, context: Dict) -> str:
         """
         Render a template file.  The render will first search for the template in
@@ -94,21 +207,7 @@ class AutomodsummRenderer(AutosummaryRenderer):
         context: dict
             Dictionary of values to be rendered (inserted) into the template.
         """
-        if not template_name.endswith(".rst"):
-            # if does not have '.rst' then objtype likely given for template_name
-            template_name += ".rst"
-
-        template = None
-        for name in [template_name, "base.rst"]:
-            for _path in ["", "automodsumm/", "autosummary/"]:
-                try:
-                    template = self.env.get_template(_path + name)
-                    return template.render(context)
-                except TemplateNotFound:
-                    pass
-
-        if template is None:
-            raise TemplateNotFound
+        return self.get_template(template_name).render(context)
 
 
 class GenDocsFromAutomodsumm:
@@ -126,10 +225,20 @@ class GenDocsFromAutomodsumm:
         "currentmodule": re.compile(
             r"^\s*\.\.\s+(|\S+:)(current)?module::\s*([a-zA-Z0-9_.]+)\s*$"
         ),
+        "directives": re.compile(
+            r"^[^\S\n]*\.\.[^\S\n]+(?:"
+            r"(?P<kind>automodsumm|automodapi)::[^\S\n]*(?P<modname>\S+)[^\S\n]*$"
+            r"(?P<options>(?:\n[^\S\n]+:\S*:[^\n]*)*)"
+            r"|(?:\S+:)?(?:current)?module::[^\S\n]*(?P<currentmodule>[a-zA-Z0-9_.]+)"
+            r"[^\S\n]*$)",
+            re.MULTILINE,
+        ),
     }
     """
     Dictionary of regular expressions used for string matching a read document
-    and identify key directives.
+    and identify key directives.  The ``"directives"`` expression is the
+    multi-line equivalent of the other (single line) expressions used by
+    :meth:`scan_directives` to scan a whole document in a single pass.
     """
 
     app = None  # type: "Sphinx"
@@ -141,7 +250,64 @@ class GenDocsFromAutomodsumm:
     builds.
     """
 
-    def __call__(self, app: "Sphinx"):
+    directive_index = None  # type: DirectiveIndex
+    """
+    The `~plasmapy_sphinx.automodsumm.index.DirectiveIndex` of the build, or
+    `None` if disabled by :confval:`automodapi_directive_index`.
+    """
+
+    manifest = None  # type: StubManifest
+    """
+    The `~plasmapy_sphinx.automodsumm.manifest.StubManifest` of the build, or
+    `None` if disabled by :confval:`automodapi_stub_manifest`.
+    """
+
+    member_cache = None  # type: ClassMemberCache
+    """
+    The `~plasmapy_sphinx.automodsumm.members.ClassMemberCache` shared by the
+    class stub files of the stub file generation, or `None` if disabled by
+    :confval:`automodapi_class_member_cache`.
+    """
+
+    def __init__(self):
+        self.metrics = StubGenMetrics()
+        """
+        The `~plasmapy_sphinx.automodsumm.metrics.StubGenMetrics` gathered
+        during the stub file generation of the build.
+        """
+
+        self.dry_run = False
+        """
+        `True` if the stub files are only rendered and compared to the existing
+        stub files, without writing or removing any stub file, and without
+        persisting the stub manifest and directive index.  Set from the
+        application's ``automodsumm_dry_run`` attribute (see
+        `~plasmapy_sphinx.automodsumm.autogen.AutogenApplication`).
+        """
+
+        self.plan = None  # type: Optional[List[Dict[str, Any]]]
+        """
+        List recording the plan of the stub file generation, or `None` if not
+        recorded.  Each stub file entry is recorded as a dictionary with the
+        keys ``"name"`` (name of the documented object), ``"filename"`` (the
+        stub file), ``"sources"`` (the documents with the directives), and
+        ``"status"``, which is one of ``"written"``, ``"unchanged"``,
+        ``"kept"``, ``"up-to-date"`` (skipped using the stub manifest),
+        ``"failed"``, ``"orphaned"``, or ``"removed"`` (orphaned stub files
+        removed according to :confval:`automodapi_stub_orphans`).  In a
+        :attr:`dry_run`, the statuses are those the stub files would have.  The
+        list is taken from the application's ``automodsumm_plan`` attribute
+        (see `~plasmapy_sphinx.automodsumm.autogen.AutogenApplication`).
+        """
+
+        self._generated = False
+
+        # the renderer is kept across generations (e.g. of the build server, see
+        # plasmapy_sphinx.automodsumm.server) while the templates are unchanged
+        self._renderer = None  # type: Optional[AutomodsummRenderer]
+        self._renderer_key = None  # type: Optional[str]
+
+    def __call__(self, app: "Sphinx", filenames: List[str] = None):
         """
         Scan through source files, check for the :rst:dir:`automodsumm` and
         :rst:dir:`automodapi` directives, and auto generate any associated
@@ -152,11 +318,22 @@ class GenDocsFromAutomodsumm:
         app :  `~sphinx.application.Sphinx`
             Instance of the Sphinx application.
 
+        filenames : List[str]
+            The source files (e.g. documents or stub files) to be scanned.  If
+            `None` (default), the source files are given by
+            `autosummary_generate`.  Stub files recorded in the
+            `~plasmapy_sphinx.automodsumm.manifest.StubManifest` for source
+            files that are not scanned are kept.
+
 
         .. note:: Adapted from :func:`sphinx.ext.autosummary.process_generate_options`.
         """
         self.app = app
-        genfiles = app.config.autosummary_generate
+        self.metrics = StubGenMetrics()
+        self._generated = False
+        self.dry_run = bool(getattr(app, "automodsumm_dry_run", False))
+        self.plan = getattr(app, "automodsumm_plan", None)
+        genfiles = app.config.autosummary_generate if filenames is None else filenames
 
         if genfiles is True:
             env = app.builder.env
@@ -194,16 +371,60 @@ class GenDocsFromAutomodsumm:
             )
             return
 
+        if app.config.automodapi_directive_index:
+            self.directive_index = DirectiveIndex.from_app(app)
+        else:
+            self.directive_index = None
+
+        if app.config.automodapi_stub_manifest:
+            self.manifest = StubManifest.from_app(app)
+        else:
+            self.manifest = None
+
+        if app.config.automodapi_class_member_cache:
+            self.member_cache = ClassMemberCache(app, self.metrics)
+        else:
+            self.member_cache = None
+
+        self._generated = True
         imported_members = app.config.autosummary_imported_members
-        with mock(app.config.autosummary_mock_imports):
-            self.generate_docs(
-                genfiles,
-                suffix=suffix,
-                base_path=app.srcdir,
-                imported_members=imported_members,
-                overwrite=app.config.autosummary_generate_overwrite,
-                encoding=app.config.source_encoding,
-            )
+        with self.metrics.timer("total_seconds"):
+            with mock(app.config.autosummary_mock_imports):
+                try:
+                    self.generate_docs(
+                        genfiles,
+                        suffix=suffix,
+                        base_path=app.srcdir,
+                        imported_members=imported_members,
+                        overwrite=app.config.autosummary_generate_overwrite,
+                        encoding=app.config.source_encoding,
+                    )
+                finally:
+                    # the cached members belong to the imported modules of this
+                    # generation only
+                    self.member_cache = None
+
+            if self.manifest is not None:
+                self.prune_orphans()
+
+        if self.dry_run:
+            return
+
+        if self.manifest is not None:
+            try:
+                self.manifest.save()
+            except OSError as err:
+                self.logger.warning(
+                    f"[automodsumm] unable to write stub manifest: {err}"
+                )
+
+        if self.directive_index is not None:
+            try:
+                self.directive_index.save()
+            except OSError as err:
+                self.logger.warning(
+                    f"[automodsumm] unable to write directive index: {err}"
+                )
 
     def generate_docs(
         self,
@@ -219,6 +440,12 @@ class GenDocsFromAutomodsumm:
         Generate and write stub files for objects defined in the :rst:dir:`automodapi`
         and :rst:dir:`automodsumm` directives.
 
+        The generation works through a worklist of source files.  Newly written
+        stub files (e.g. of modules documented with :rst:dir:`automodapi`) are
+        added to the worklist with their rendered content, so nested directives
+        are found without reading the stub files back from disk.  Each entry is
+        only rendered once, even if found again in a nested stub file.
+
         Parameters
         ----------
 
@@ -250,115 +477,562 @@ class GenDocsFromAutomodsumm:
         .. note::  Adapted from
                    :func:`sphinx.ext.autosummary.generate.generate_autosummary_docs`.
         """
-        app = self.app
-
-        _info = self.logger.info
-        _warn = self.logger.warning
-
-        showed_sources = list(sorted(source_filenames))
-        _info(
-            __(f"[automodsumm] generating stub files for {len(showed_sources)} sources")
-        )
-
         if output_dir:
-            _info(__(f"[automodsumm] writing to {output_dir}"))
+            self.logger.info(__(f"[automodsumm] writing to {output_dir}"))
 
         if base_path is not None:
             source_filenames = [
                 os.path.join(base_path, filename) for filename in source_filenames
             ]
 
-        template = AutomodsummRenderer(app)
+        template = self.get_renderer()
+
+        # entries already handled, mapped to their stub file (or None if the
+        # entry could not be rendered)
+        handled = {}  # type: Dict[AutomodsummEntry, Optional[str]]
+
+        # source files to be scanned, mapped to their content if already known
+        worklist = dict.fromkeys(source_filenames)  # type: Dict[str, Optional[str]]
+
+        depth = 0
+        while worklist:
+            self.metrics.maximum("recursion_depth", depth)
+            worklist = self._generate_level(
+                worklist,
+                handled,
+                template,
+                output_dir=output_dir,
+                suffix=suffix,
+                imported_members=imported_members,
+                overwrite=overwrite,
+                encoding=encoding,
+            )
+            depth += 1
+
+    def _generate_level(
+        self,
+        worklist: Dict[str, Optional[str]],
+        handled: Dict[AutomodsummEntry, Optional[str]],
+        template: AutomodsummRenderer,
+        output_dir: str = None,
+        suffix: str = ".rst",
+        imported_members: bool = False,
+        overwrite: bool = True,
+        encoding: str = "utf-8",
+    ) -> Dict[str, str]:
+        """
+        Generate the stub files for the entries found in the source files of
+        ``worklist`` (see :meth:`generate_docs`).  Returns the newly written
+        stub files mapped to their content.
+        """
+        app = self.app
+        metrics = self.metrics
+
+        _info = self.logger.info
+        _warn = self.logger.warning
+
+        _info(__(f"[automodsumm] generating stub files for {len(worklist)} sources"))
 
         # read
-        items = self.find_in_files(source_filenames)
+        items = []
+        item_sources = {}  # type: Dict[AutomodsummEntry, List[str]]
+        for source_filename in worklist:
+            found = self.find_in_files([source_filename], contents=worklist)
+            items.extend(found)
+            for entry in found:
+                item_sources.setdefault(entry, []).append(source_filename)
+
+            if self.manifest is not None:
+                self.manifest.note_scanned(source_filename)
 
         # keep track of new files
-        new_files = []
+        new_files = {}  # type: Dict[str, str]
 
         if app:
             filename_map = app.config.autosummary_filename_map
         else:
             filename_map = {}
 
-        # write
+        # render
+        # Note: entries without a path correspond to automodsumm:: directives
+        #       without a :toctree: option
+        entries = []
         for entry in sorted(set(items), key=str):
             if entry.path is None:
-                # The corresponding automodsumm:: directive did not have
-                # a :toctree: option
+                continue
+            elif entry not in handled:
+                entries.append(entry)
                 continue
 
+            # entry already handled for another source file
+            filename = handled[entry]
+            if self.manifest is not None and filename is not None:
+                for source_filename in item_sources[entry]:
+                    self.manifest.note_produced(filename, source_filename)
+        metrics.count("entries_found", len(entries))
+
+        # skip entries whose stub file is up-to-date with the manifest
+        to_render = []
+        for entry in entries:
             path = output_dir or os.path.abspath(entry.path)
-            ensuredir(path)
+            filename = (
+                None if self.manifest is None else self.manifest.lookup(entry, path)
+            )
+            handled[entry] = filename
+            if filename is None:
+                to_render.append(entry)
+                continue
+
+            for source_filename in item_sources[entry]:
+                self.manifest.note_produced(filename, source_filename)
+            self._note_plan(entry, filename, item_sources[entry], "up-to-date")
+
+        metrics.count("stubs_up_to_date", len(entries) - len(to_render))
+        if len(to_render) != len(entries):
+            _info(
+                f"[automodsumm] {len(entries) - len(to_render)} of {len(entries)} "
+                f"stub files are up-to-date"
+            )
+
+        # render and queue the stub files to be written, the I/O threads write
+        # the stub files while the remaining entries are rendered
+        writes = {}  # type: Dict[AutomodsummEntry, Tuple[Any, ...]]
+        with StubWriter(
+            encoding,
+            overwrite=overwrite,
+            threads=self._get_stub_write_threads(),
+            dry_run=self.dry_run,
+        ) as writer:
+            for entry, result in self.iter_render_entries(
+                to_render, template, imported_members=imported_members
+            ):
+                if isinstance(result, str):
+                    metrics.count("stubs_failed")
+                    _warn(__(f"[automodsumm] failed to import {entry.name}: {result}"))
+                    self._note_plan(
+                        entry, None, item_sources[entry], "failed", error=result
+                    )
+                    self._keep_failed_stub(entry, item_sources[entry], output_dir)
+                    continue
+
+                name, content, sources = result
+
+                path = output_dir or os.path.abspath(entry.path)
+                filename = os.path.join(path, filename_map.get(name, name) + suffix)
+                handled[entry] = filename
+
+                if self.manifest is not None and self.manifest.is_unchanged(
+                    filename, content, encoding
+                ):
+                    # stub file is unchanged, no need to read it
+                    future = None
+                else:
+                    future = writer.write(filename, content)
+
+                writes[entry] = (path, filename, content, sources, future)
+
+            # write
+            with metrics.timer("write_seconds"):
+                for entry in to_render:
+                    if entry not in writes:
+                        continue
+
+                    path, filename, content, sources, future = writes[entry]
+                    try:
+                        status = "unchanged" if future is None else future.result()
+                    except OSError as err:
+                        metrics.count("stubs_failed")
+                        _warn(f"[automodsumm] unable to write stub file: {err}")
+                        self._note_plan(
+                            entry,
+                            filename,
+                            item_sources[entry],
+                            "failed",
+                            error=str(err),
+                        )
+                        self._keep_failed_stub(entry, item_sources[entry], output_dir)
+                        continue
+
+                    metrics.count(f"stubs_{status}")
+                    self._note_plan(entry, filename, item_sources[entry], status)
+                    if status == "written":
+                        new_files[filename] = content
+
+                    if status == "kept" or self.dry_run:
+                        # the existing stub file is kept (but it was not rendered
+                        # from the current inputs), or was not written at all
+                        if self.manifest is not None:
+                            for source_filename in item_sources[entry]:
+                                self.manifest.note_produced(filename, source_filename)
+                        continue
+
+                    if self.manifest is not None:
+                        self.manifest.update(
+                            entry,
+                            path,
+                            filename,
+                            source=item_sources[entry][0],
+                            sources=sources,
+                            content=content,
+                            encoding=encoding,
+                        )
+                        for source_filename in item_sources[entry][1:]:
+                            self.manifest.note_produced(filename, source_filename)
+
+        return new_files
+
+    def _keep_failed_stub(
+        self, entry: AutomodsummEntry, source_filenames: List[str], output_dir: str
+    ) -> None:
+        """
+        Record the stub file of ``entry`` already in the manifest (if any) as
+        produced by ``source_filenames``, so a stub file failing to be
+        generated (e.g. due to a temporary import error) is not pruned as
+        orphaned.
+        """
+        if self.manifest is None:
+            return
+
+        path = output_dir or os.path.abspath(entry.path)
+        filename = self.manifest.recorded_stub(entry, path)
+        if filename is None:
+            return
+
+        for source_filename in source_filenames:
+            self.manifest.note_produced(filename, source_filename)
+
+    def get_renderer(self) -> AutomodsummRenderer:
+        """
+        Retrieve the `~plasmapy_sphinx.automodsumm.generate.AutomodsummRenderer`
+        for the stub files.  The renderer, with its Jinja environment and
+        resolved templates, is reused by later generations of the same
+        application until any template file changes.
+        """
+        key = _hash_templates(self.app)
+        if self._renderer is None or key != self._renderer_key:
+            self._renderer = AutomodsummRenderer(self.app)
+            self._renderer_key = key
+
+        return self._renderer
+
+    def prune_orphans(self) -> None:
+        """
+        Handle the stub files recorded in the
+        `~plasmapy_sphinx.automodsumm.manifest.StubManifest` that are no longer
+        produced by any :rst:dir:`automodapi` or :rst:dir:`automodsumm`
+        directive.  Depending on :confval:`automodapi_stub_orphans`, the
+        orphaned stub files are removed or reported.  Stub files not recorded in
+        the manifest are never touched.
+        """
+        manifest = self.manifest
+        orphans = manifest.find_orphans()
+
+        missing = [filename for filename in orphans if not os.path.exists(filename)]
+        for filename in missing:
+            manifest.forget(filename)
+            orphans.remove(filename)
+
+        if not orphans:
+            return
+
+        if self.app.config.automodapi_stub_orphans != "remove":
+            self.logger.warning(
+                f"[automodsumm] found {len(orphans)} stub file(s) no longer "
+                f"generated by any directive: {', '.join(orphans)}"
+            )
+            for filename in orphans:
+                self._note_plan(None, filename, [], "orphaned")
+            return
+
+        if self.dry_run:
+            for filename in orphans:
+                self._note_plan(None, filename, [], "removed")
+            return
+
+        for filename in orphans:
+            try:
+                os.remove(filename)
+            except OSError as err:
+                self.logger.warning(
+                    f"[automodsumm] unable to remove orphaned stub file: {err}"
+                )
+                continue
+
+            manifest.forget(filename)
+            self.metrics.count("orphans_removed")
+            self._note_plan(None, filename, [], "removed")
+
+        self.logger.info(f"[automodsumm] removed {len(orphans)} orphaned stub file(s)")
+
+    def _note_plan(
+        self,
+        entry: Optional[AutomodsummEntry],
+        filename: Optional[str],
+        sources: List[str],
+        status: str,
+        **extra: Any,
+    ) -> None:
+        """Record the ``status`` of stub file ``filename`` in the :attr:`plan`."""
+        if self.plan is None:
+            return
+
+        record = {
+            "name": None if entry is None else entry.name,
+            "filename": filename,
+            "sources": list(sources),
+            "status": status,
+        }
+        record.update(extra)
+        self.plan.append(record)
+
+    def render_entry(
+        self,
+        entry: AutomodsummEntry,
+        template: AutomodsummRenderer,
+        imported_members: bool = False,
+    ) -> Tuple[str, str, List[str]]:
+        """
+        Import the object associated with ``entry`` and render the content of its
+        stub file.
 
+        Parameters
+        ----------
+        entry : `~plasmapy_sphinx.automodsumm.generate.AutomodsummEntry`
+            The stub file entry to be rendered.
+
+        template : `~plasmapy_sphinx.automodsumm.generate.AutomodsummRenderer`
+            The renderer used to render the stub file templates.
+
+        imported_members : `bool`
+            (Default `False`) Set `True` to include imported members in the
+            stub file documentation for *module* object types.
+
+        Returns
+        -------
+        Tuple[str, str, List[str]]
+            The fully qualified name of the object, the rendered content, and
+            the source files the content was rendered from (see
+            `~plasmapy_sphinx.automodsumm.manifest.gather_entry_sources`).
+
+        Raises
+        ------
+        ImportError
+            If the object associated with ``entry`` can not be imported.
+        """
+        app = self.app
+        metrics = self.metrics
+
+        n_modules = len(sys.modules)
+        with metrics.timer("import_seconds"), profile_import(
+            app, "import_by_name", entry.name
+        ):
             try:
-                name, obj, parent, modname = import_by_name(entry.name, prefixes=(None,))
+                name, obj, parent, modname = import_by_name(
+                    entry.name, prefixes=(None,)
+                )
                 qualname = name.replace(modname + ".", "")
-            except ImportError as e:
+            except (ImportError, ImportExceptionGroup) as e:
                 try:
                     # try to import as an instance attribute
                     name, obj, parent, modname = import_ivar_by_name(entry.name)
                     qualname = name.replace(modname + ".", "")
-                except ImportError:
-                    _warn(__(f"[automodsumm] failed to import {entry.name}: {e}"))
-                    continue
+                except (ImportError, ImportExceptionGroup):
+                    if isinstance(e, ImportError):
+                        raise e
 
-            context = {}
-            if app:
-                context.update(app.config.autosummary_context)
-
-            _kwargs = {
-                "name": name,
-                "obj": obj,
-                "parent": parent,
-                "template": template,
-                "template_name": entry.template,
-                "imported_members": imported_members,
-                "recursive": entry.recursive,
-                "context": context,
-                "modname": modname,
-                "qualname": qualname,
-            }
-            if Version(sphinx_version) < Version("8.2"):
-                _kwargs["app"] = app
-            elif Version(sphinx_version) < Version("9.0"):
-                _kwargs["config"] = app.config
-                _kwargs["events"] = app.events
-                _kwargs["registry"] = app.registry
-            else:
-                _kwargs["config"] = app.config
-                _kwargs["events"] = app.events
+                    # newer sphinx versions group the import errors of all the
+                    # tried names
+                    raise ImportError(str(e)) from e
+            finally:
+                metrics.count("modules_imported", len(sys.modules) - n_modules)
+
+        context = {}
+        if app:
+            context.update(app.config.autosummary_context)
+
+        _kwargs = {
+            "name": name,
+            "obj": obj,
+            "parent": parent,
+            "template": template,
+            "template_name": entry.template,
+            "imported_members": imported_members,
+            "recursive": entry.recursive,
+            "context": context,
+            "modname": modname,
+            "qualname": qualname,
+        }
+        if Version(sphinx_version) < Version("8.2"):
+            _kwargs["app"] = app
+        elif Version(sphinx_version) < Version("9.0"):
+            _kwargs["config"] = app.config
+            _kwargs["events"] = app.events
+            _kwargs["registry"] = app.registry
+        else:
+            _kwargs["config"] = app.config
+            _kwargs["events"] = app.events
+
+        with metrics.timer("render_seconds"):
+            content = None
+            if self.member_cache is not None:
+                content = self.member_cache.generate_content(
+                    name,
+                    obj,
+                    parent,
+                    template,
+                    entry.template,
+                    context,
+                    modname=modname,
+                    qualname=qualname,
+                )
+            if content is None:
+                content = generate_autosummary_content(**_kwargs)
+            sources = gather_entry_sources(obj, modname)
+        metrics.count("stubs_rendered")
 
-            content = generate_autosummary_content(**_kwargs)
+        return name, content, sources
 
-            filename = os.path.join(path, filename_map.get(name, name) + suffix)
-            if os.path.isfile(filename):
-                with open(filename, encoding=encoding) as f:
-                    old_content = f.read()
+    def render_entries(
+        self,
+        entries: List[AutomodsummEntry],
+        template: AutomodsummRenderer,
+        imported_members: bool = False,
+    ) -> Dict[AutomodsummEntry, Any]:
+        """
+        Render the stub file content for all ``entries`` (see
+        :meth:`iter_render_entries`).
 
-                if content == old_content:
-                    continue
-                elif overwrite:  # content has changed
-                    with open(filename, "w", encoding=encoding) as f:
-                        f.write(content)
-                    new_files.append(filename)
-            else:
-                with open(filename, "w", encoding=encoding) as f:
-                    f.write(content)
-                new_files.append(filename)
-
-        # descend recursively to new files
-        if new_files:
-            self.generate_docs(
-                new_files,
-                output_dir=output_dir,
-                suffix=suffix,
-                base_path=base_path,
-                imported_members=imported_members,
-                overwrite=overwrite,
+        Parameters
+        ----------
+        entries : List[AutomodsummEntry]
+            The stub file entries to be rendered.
+
+        template : `~plasmapy_sphinx.automodsumm.generate.AutomodsummRenderer`
+            The renderer used to render the stub file templates.
+
+        imported_members : `bool`
+            (Default `False`) Set `True` to include imported members in the
+            stub file documentation for *module* object types.
+
+        Returns
+        -------
+        Dict[AutomodsummEntry, Any]
+            Dictionary mapping each entry to its rendered
+            ``(name, content, sources)`` tuple, or to the import error message
+            if the entry could not be rendered.
+        """
+        return dict(
+            self.iter_render_entries(
+                entries, template, imported_members=imported_members
             )
+        )
 
-    def find_in_files(self, filenames: List[str]) -> List[AutomodsummEntry]:
+    def iter_render_entries(
+        self,
+        entries: List[AutomodsummEntry],
+        template: AutomodsummRenderer,
+        imported_members: bool = False,
+    ) -> Iterator[Tuple[AutomodsummEntry, Any]]:
+        """
+        Render the stub file content for all ``entries``, yielding each entry
+        as soon as it is rendered.  If :confval:`automodapi_stub_workers` allows
+        for more than one worker (and the platform supports forking processes),
+        then the entries are sharded by module and rendered by a forked process
+        pool, scheduling the modules with the most entries first.  Otherwise,
+        the entries are rendered serially.
+
+        Parameters
+        ----------
+        entries : List[AutomodsummEntry]
+            The stub file entries to be rendered.
+
+        template : `~plasmapy_sphinx.automodsumm.generate.AutomodsummRenderer`
+            The renderer used to render the stub file templates.
+
+        imported_members : `bool`
+            (Default `False`) Set `True` to include imported members in the
+            stub file documentation for *module* object types.
+
+        Yields
+        ------
+        Tuple[AutomodsummEntry, Any]
+            The entry and its rendered ``(name, content, sources)`` tuple, or
+            the import error message if the entry could not be rendered.
+        """
+        # shard the entries by module so each module is imported by one worker
+        shards = {}  # type: Dict[str, List[AutomodsummEntry]]
+        for entry in entries:
+            shards.setdefault(entry.name.rpartition(".")[0], []).append(entry)
+        shards = sorted(shards.items(), key=lambda item: (-len(item[1]), item[0]))
+
+        workers = min(self._get_stub_workers(), len(shards))
+        if workers > 1 and "fork" not in multiprocessing.get_all_start_methods():
+            self.logger.info(
+                "[automodsumm] process forking not supported, rendering stub "
+                "files serially"
+            )
+            workers = 1
+
+        if workers <= 1:
+            for entry in entries:
+                try:
+                    yield entry, self.render_entry(
+                        entry, template, imported_members=imported_members
+                    )
+                except ImportError as err:
+                    yield entry, str(err)
+
+            return
+
+        self.logger.info(
+            f"[automodsumm] rendering {len(entries)} stub files with {workers} "
+            f"worker processes"
+        )
+        _pool_state.update(
+            gendocs=self, template=template, imported_members=imported_members
+        )
+        try:
+            ctx = multiprocessing.get_context("fork")
+            with ctx.Pool(processes=workers) as pool:
+                for results, metrics, calls in pool.imap_unordered(
+                    _render_shard, [shard for _, shard in shards]
+                ):
+                    self.metrics.merge(metrics)
+                    if calls:
+                        self.app.env.automodsumm_import_profiler.merge(calls)
+                    for entry, result, error in results:
+                        yield entry, error if result is None else result
+        finally:
+            _pool_state.clear()
+
+    def _get_stub_workers(self) -> int:
+        """
+        Number of worker processes defined by :confval:`automodapi_stub_workers`.
+        """
+        try:
+            workers = int(self.app.config.automodapi_stub_workers)
+        except (AttributeError, TypeError, ValueError):
+            return 1
+
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+
+        return workers
+
+    def _get_stub_write_threads(self) -> int:
+        """
+        Number of I/O threads defined by :confval:`automodapi_stub_write_threads`.
+        """
+        try:
+            threads = int(self.app.config.automodapi_stub_write_threads)
+        except (AttributeError, TypeError, ValueError):
+            return 0
+
+        return max(threads, 0)
+
+    def find_in_files(
+        self, filenames: List[str], contents: Dict[str, Optional[str]] = None
+    ) -> List[AutomodsummEntry]:
         """
         Search files for the :rst:dir:`automodapi` and :rst:dir:`automodsumm`
         directives and generate a list of
@@ -370,15 +1044,254 @@ class GenDocsFromAutomodsumm:
         filenames : List[str]
             List of filenames to be searched.
 
+        contents : Dict[str, Optional[str]]
+            Dictionary mapping filenames to their already known content (e.g.
+            just rendered stub files), which is scanned instead of reading the
+            file.
+
 
         .. note:: Adapted from
                   :func:`sphinx.ext.autosummary.generate.find_autosummary_in_files`.
         """
+        scanner = "single-pass"
+        if self.app is not None:
+            scanner = self.app.config.automodapi_directive_scanner
+
+        index = self.directive_index
+        metrics = self.metrics
+        if contents is None:
+            contents = {}
+
         documented = []  # type: List[AutomodsummEntry]
+        scanned = []  # type: List[Tuple[str, List[Tuple[str, str, List[List[str]]]]]]
         for filename in filenames:
-            with open(filename, encoding="utf-8", errors="ignore") as f:
-                lines = f.read().splitlines()
-                documented.extend(self.find_in_lines(lines, filename=filename))
+            text = contents.get(filename, None)
+            if text is not None:
+                metrics.count("files_in_memory")
+
+            if scanner == "lines":
+                # scanning and collecting are not separable for find_in_lines
+                with metrics.timer("scan_seconds"):
+                    if text is None:
+                        with open(filename, encoding="utf-8", errors="ignore") as f:
+                            text = f.read()
+                    documented.extend(
+                        self.find_in_lines(text.splitlines(), filename=filename)
+                    )
+                metrics.count("files_scanned")
+                continue
+
+            # unchanged documents are not re-read when indexed
+            with metrics.timer("scan_seconds"):
+                occurrences = None
+                if index is not None and text is None:
+                    occurrences = index.get(filename)
+
+                if occurrences is None:
+                    if text is None:
+                        with open(filename, encoding="utf-8", errors="ignore") as f:
+                            text = f.read()
+                    occurrences = self.scan_directives(text)
+                    metrics.count("files_scanned")
+
+                    if index is not None:
+                        index.set(filename, occurrences)
+                else:
+                    metrics.count("files_indexed")
+
+            scanned.append((filename, occurrences))
+
+        # let the "subprocess" inventory engine inspect all modules concurrently
+        prefetch_inventories(
+            [modname for _, occurrences in scanned for _, modname, _ in occurrences],
+            app=self.app,
+        )
+
+        for filename, occurrences in scanned:
+            documented.extend(self.entries_from_directives(occurrences, filename))
+        return documented
+
+    def scan_directives(self, text: str) -> List[Tuple[str, str, List[List[str]]]]:
+        """
+        Scan the document ``text`` for the :rst:dir:`automodapi` and
+        :rst:dir:`automodsumm` directives in a single pass.  Documents without
+        the ``"automod"`` sub-string are skipped entirely.
+
+        Parameters
+        ----------
+        text : str
+            The contents of the document to be scanned.
+
+        Returns
+        -------
+        List[Tuple[str, str, List[List[str]]]]
+            A list of directive occurrences ``(kind, modname, options)``, where
+            ``kind`` is the directive name, ``modname`` is the module name with
+            any :rst:dir:`py:currentmodule` applied, and ``options`` is a list of
+            the un-processed ``[kind, option_name, option_args]`` of the
+            directive.  The occurrences are identical to those collected by
+            :meth:`find_in_lines`, including its handling of directives that
+            are directly followed by another directive.
+        """
+        if "automod" not in text:
+            return []
+
+        # normalize line boundaries to how str.splitlines() sees them
+        text = "\n".join(text.splitlines())
+        text_length = len(text)
+
+        occurrences = []  # type: List[Tuple[str, str, List[List[str]]]]
+        current_module = None
+        pending = None  # occurrence waiting for a non-directive line
+        pending_at_eof = False  # pending occurrence is collected at the end
+        last_end = -1
+
+        for match in self._re["directives"].finditer(text):
+            # any line between matches ends the options of a pending directive
+            if pending is not None and match.start() > last_end + 1:
+                occurrences.append(pending)
+                pending = None
+            last_end = match.end()
+
+            if match.group("currentmodule") is not None:
+                current_module = match.group("currentmodule")
+                pending_at_eof = False
+                continue
+
+            kind = match.group("kind")
+            modname = match.group("modname")
+            if current_module is None or modname == current_module:
+                pass
+            elif not modname.startswith(f"{current_module}."):
+                modname = f"{current_module}.{modname}"
+
+            # a directive directly following a pending directive replaces it,
+            # but inherits its options (like in find_in_lines)
+            options = [] if pending is None else pending[2]
+            for line in match.group("options").split("\n")[1:]:
+                option = self._re["option"].search(line)
+                options.append([kind, option.group(2), option.group(3)])
+
+            pending = (kind, modname, options)
+            pending_at_eof = True
+
+        if pending is not None and (pending_at_eof or last_end < text_length):
+            occurrences.append(pending)
+
+        return occurrences
+
+    def find_in_text(self, text: str, filename: str = None) -> List[AutomodsummEntry]:
+        """
+        Search the document ``text`` for the :rst:dir:`automodapi` and
+        :rst:dir:`automodsumm` directives and generate a list of
+        `~plasmapy_sphinx.automodsumm.generate.AutomodsummEntry`'s indicating which
+        stub files need to be generated.  This is the single pass equivalent of
+        :meth:`find_in_lines` (see :meth:`scan_directives`).
+
+        Parameters
+        ----------
+        text : str
+            The contents of the document to be searched.
+
+        filename : str
+            The file from which ``text`` came from.
+        """
+        return self.entries_from_directives(self.scan_directives(text), filename)
+
+    def entries_from_directives(
+        self,
+        occurrences: List[Tuple[str, str, List[List[str]]]],
+        filename: str = None,
+    ) -> List[AutomodsummEntry]:
+        """
+        Generate the list of `~plasmapy_sphinx.automodsumm.generate.AutomodsummEntry`'s
+        for the directive occurrences found by :meth:`scan_directives`.
+
+        Parameters
+        ----------
+        occurrences : List[Tuple[str, str, List[List[str]]]]
+            Directive occurrences as returned by :meth:`scan_directives`.
+
+        filename : str
+            The file the directives were found in.
+        """
+        option_classes = self._option_classes()
+        metrics = self.metrics
+        metrics.count("directives_found", len(occurrences))
+
+        n_modules = len(sys.modules)
+        documented = []  # type: List[AutomodsummEntry]
+        with metrics.timer("collect_seconds"):
+            for kind, modname, raw_options in occurrences:
+                options = {}
+                for option_kind, option_name, option_args in raw_options:
+                    try:
+                        option_spec = option_classes[option_kind].option_spec
+                        options[option_name] = option_spec[option_name](option_args)
+                    except (KeyError, TypeError):
+                        pass
+
+                if kind == "automodsumm":
+                    self.logger.info(f"[automodsumm] {modname}")
+
+                documented.extend(
+                    self._gather_entries(
+                        option_classes[kind], modname, options, filename
+                    )
+                )
+        metrics.count("modules_imported", len(sys.modules) - n_modules)
+
+        return documented
+
+    @staticmethod
+    def _option_classes():
+        from plasmapy_sphinx.autodoc.automodapi import AutomodapiOptions
+        from plasmapy_sphinx.automodsumm.core import AutomodsummOptions
+
+        return {"automodapi": AutomodapiOptions, "automodsumm": AutomodsummOptions}
+
+    def _gather_entries(
+        self, option_cls, modname: str, options: Dict[str, Any], filename: str
+    ) -> List[AutomodsummEntry]:
+        """
+        Generate the stub file entries for a directive on module ``modname``
+        with the processed ``options``.
+        """
+        process_options = option_cls(
+            self.app,
+            modname,
+            options,
+            docname=filename,
+            _warn=self.logger.warning,
+        )
+        options = {
+            "toctree": process_options.toctree["abspath"],
+            "template": process_options.options.get("template", None),
+            "recursive": process_options.options.get("recursive", False),
+        }
+
+        exclude_modules = not self.app.config.automodapi_generate_module_stub_files
+        obj_list = process_options.generate_obj_list(exclude_modules=exclude_modules)
+
+        if process_options.import_failed and self.manifest is not None:
+            # the stub files of the directive are unknown, keep the existing ones
+            self.manifest.note_uninspected(filename)
+
+        documented = [
+            AutomodsummEntry(
+                name=name,
+                path=options["toctree"],
+                template=options["template"],
+                recursive=options["recursive"],
+            )
+            for name in obj_list
+        ]
+
+        self.logger.info(
+            f"[automodsumm stub file gen] collected {len(obj_list):4d} "
+            f"object(s) in '{modname}'"
+        )
+
         return documented
 
     def find_in_lines(
@@ -500,39 +1413,8 @@ class GenDocsFromAutomodsumm:
 
             # gather objects and update documented list
             if gather_objs:
-                process_options = _option_cls(
-                    self.app,
-                    modname,
-                    options,
-                    docname=filename,
-                    _warn=self.logger.warning,
-                )
-                options = {
-                    "toctree": process_options.toctree["abspath"],
-                    "template": process_options.options.get("template", None),
-                    "recursive": process_options.options.get("recursive", False),
-                }
-
-                exclude_modules = (
-                    not self.app.config.automodapi_generate_module_stub_files
-                )
-                obj_list = process_options.generate_obj_list(
-                    exclude_modules=exclude_modules
-                )
-
-                for name in obj_list:
-                    documented.append(
-                        AutomodsummEntry(
-                            name=name,
-                            path=options["toctree"],
-                            template=options["template"],
-                            recursive=options["recursive"],
-                        )
-                    )
-
-                self.logger.info(
-                    f"[automodsumm stub file gen] collected {len(obj_list):4d} "
-                    f"object(s) in '{modname}'"
+                documented.extend(
+                    self._gather_entries(_option_cls, modname, options, filename)
                 )
 
                 # reset for next search
@@ -542,6 +1424,38 @@ class GenDocsFromAutomodsumm:
 
         return documented
 
+    def event_handler__build_finished(self, app: "Sphinx", exception: Exception):
+        """
+        Event handler for the Sphinx event :event:`build-finished`.  This
+        handler summarizes the :attr:`metrics` of the stub file generation in
+        the build log and, if enabled by :confval:`automodapi_stub_metrics`,
+        writes them as the JSON report ``automodsumm_metrics.json`` to the
+        output directory.
+        """
+        if not self._generated:
+            return
+
+        self.logger.info(
+            f"[automodsumm] stub file generation: {self.metrics.summary()}"
+        )
+
+        if not app.config.automodapi_stub_metrics:
+            return
+
+        from plasmapy_sphinx import __version__
+
+        path = os.path.join(app.outdir, "automodsumm_metrics.json")
+        try:
+            self.metrics.write(
+                path,
+                plasmapy_sphinx=__version__,
+                sphinx=sphinx_version,
+                builder=app.builder.name,
+                stub_workers=self._get_stub_workers(),
+            )
+        except OSError as err:
+            self.logger.warning(f"[automodsumm] unable to write stub metrics: {err}")
+
     @staticmethod
     def event_handler__autodoc_skip_member(
         app: "Sphinx", what: str, name: str, obj: Any, skip: bool, options: dict
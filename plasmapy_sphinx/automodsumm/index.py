@@ -0,0 +1,149 @@
+"""
+This module contains functionality for persisting, across builds, the
+:rst:dir:`automodapi` and :rst:dir:`automodsumm` directives found in each source
+document.  With the index, stub file generation only needs to ``stat`` unchanged
+documents instead of reading and scanning them (see configuration value
+:confval:`automodapi_directive_index`).
+"""
+__all__ = ["DirectiveIndex"]
+
+import json
+import os
+
+from sphinx.util import logging
+from typing import Any, Dict, List, Optional
+
+if False:
+    # for annotation, does not need real import
+    from sphinx.application import Sphinx
+
+logger = logging.getLogger(__name__)
+
+
+class DirectiveIndex:
+    """
+    A persistent (on-disk) index of the directive occurrences (see
+    `~plasmapy_sphinx.automodsumm.generate.GenDocsFromAutomodsumm.scan_directives`)
+    of the source documents.  Each document is keyed by its path and its
+    occurrences are only served while the document's modification time and
+    size are unchanged.
+
+    Parameters
+    ----------
+    path : str
+        Path to the JSON file where the index is persisted.
+
+    key : Dict[str, str]
+        Dictionary identifying the conditions under which the documents were
+        scanned.
+    """
+
+    _version = 1
+
+    def __init__(self, path: str, key: Dict[str, str]):
+        self._path = path
+        self._key = key
+        self._records = None  # type: Optional[Dict[str, Dict[str, Any]]]
+        self._dirty = False
+
+    @classmethod
+    def from_app(cls, app: "Sphinx") -> "DirectiveIndex":
+        """
+        Create the index associated with the Sphinx application ``app``.  The
+        index is stored in the doctree directory of the build.
+        """
+        from plasmapy_sphinx import _get_cache_version
+
+        key = {
+            "index_version": str(cls._version),
+            "plasmapy_sphinx": _get_cache_version(),
+        }
+        path = os.path.join(app.doctreedir, "plasmapy_sphinx", "directive_index.json")
+        return cls(path, key)
+
+    @property
+    def path(self) -> str:
+        """Path to the JSON file where the index is persisted."""
+        return self._path
+
+    @property
+    def records(self) -> Dict[str, Dict[str, Any]]:
+        """Dictionary of all indexed documents, keyed by file path."""
+        if self._records is None:
+            self.load()
+        return self._records
+
+    def load(self) -> None:
+        """Load the index from :attr:`path`."""
+        self._records = {}
+        self._dirty = False
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(data, dict) or data.get("key", None) != self._key:
+            logger.info("[automodsumm] discarding outdated directive index")
+            self._dirty = True
+            return
+
+        self._records = data.get("records", {})
+
+    def save(self) -> None:
+        """
+        Write the index to :attr:`path`, if it has been modified.  Documents
+        that no longer exist are dropped from the index.
+        """
+        if self._records is None:
+            return
+
+        for filename in list(self._records):
+            if not os.path.exists(filename):
+                del self._records[filename]
+                self._dirty = True
+
+        if not self._dirty:
+            return
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"key": self._key, "records": self._records}, f)
+        os.replace(tmp_path, self.path)
+
+        self._dirty = False
+
+    def get(self, filename: str) -> Optional[List[List[Any]]]:
+        """
+        Retrieve the directive occurrences of document ``filename``.  Returns
+        `None` if the document is not indexed or has changed since it was
+        indexed.
+        """
+        record = self.records.get(filename, None)
+        if record is None:
+            return None
+
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+
+        if record["stat"] != [stat.st_mtime_ns, stat.st_size]:
+            return None
+
+        return record["directives"]
+
+    def set(self, filename: str, directives: List[Any]) -> None:
+        """Index the directive occurrences ``directives`` of document ``filename``."""
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return
+
+        self.records[filename] = {
+            "stat": [stat.st_mtime_ns, stat.st_size],
+            "directives": directives,
+        }
+        self._dirty = True
@@ -0,0 +1,914 @@
+"""
+This module contains functionality for building, caching, and retrieving the
+module inventories used by the :rst:dir:`automodapi` and :rst:dir:`automodsumm`
+directives.  A module inventory is a serializable summary of what
+`~plasmapy_sphinx.utils.find_mod_objs` discovers in a module (i.e. object names,
+qualified names, and their group classification), without the object instances.
+
+Within a build, inventories are memoized by
+`~plasmapy_sphinx.automodsumm.inventory.InventoryStore` so stub file generation
+and the directives share a single inspection of each module.  Inventories are
+persisted across builds by `~plasmapy_sphinx.automodsumm.inventory.InventoryCache`
+so unchanged modules do not need to be imported just to generate
+:rst:dir:`automodsumm` tables or stub file listings.  (See configuration values
+:confval:`automodapi_inventory_cache` and :confval:`automodapi_inventory_store_size`.)
+
+The source files of the inventories used by the directives of a document are
+tracked by `~plasmapy_sphinx.automodsumm.inventory.SourceDependencies`, so
+incremental builds re-read the documents whose documented modules changed.
+(See configuration value :confval:`automodapi_source_dependencies`.)
+"""
+__all__ = [
+    "InventoryCache",
+    "InventoryStore",
+    "SourceDependencies",
+    "event_handler__build_finished",
+    "event_handler__builder_inited",
+    "event_handler__env_get_outdated",
+    "event_handler__env_merge_info",
+    "event_handler__env_purge_doc",
+    "get_inventory",
+    "inspect_module",
+    "prefetch_inventories",
+]
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+
+from collections import OrderedDict
+from importlib import import_module
+from sphinx import __version__ as sphinx_version
+from sphinx.util import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from plasmapy_sphinx.utils import (
+    find_mod_objs,
+    get_custom_grouping_info,
+    ModuleInventory,
+)
+
+if False:
+    # for annotation, does not need real import
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+
+logger = logging.getLogger(__name__)
+
+
+def _hash_file(path: str) -> str:
+    """Return the SHA256 hex digest of the file contents at ``path``."""
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _fingerprint(path: str) -> List[Any]:
+    """
+    Generate the fingerprint ``[mtime_ns, size, sha256]`` used to determine if
+    the source file ``path`` changed between builds.
+    """
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size, _hash_file(path)]
+
+
+def _validate_fingerprints(sources: Dict[str, List[Any]]) -> Tuple[bool, bool]:
+    """
+    Check the fingerprints of ``sources`` (generated by `_fingerprint`) against
+    the file system.  Files with an updated modification time, but the same
+    content, are accepted and have their fingerprint refreshed in-place.
+    Returns a tuple indicating if all sources are unchanged and if any
+    fingerprint was refreshed.
+    """
+    refreshed = False
+    for source, (mtime_ns, size, sha) in sources.items():
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return False, refreshed
+
+        if stat.st_mtime_ns == mtime_ns and stat.st_size == size:
+            continue
+        elif stat.st_size != size or _hash_file(source) != sha:
+            return False, refreshed
+
+        sources[source] = [stat.st_mtime_ns, size, sha]
+        refreshed = True
+
+    return True, refreshed
+
+
+def _module_source(mod) -> Optional[str]:
+    """Absolute path to the source file of module ``mod``, if it has one."""
+    filename = getattr(mod, "__file__", None)
+    if filename is None:
+        return None
+
+    if filename.endswith((".pyc", ".pyo")):
+        filename = filename[:-1]
+
+    return os.path.abspath(filename) if os.path.isfile(filename) else None
+
+
+def _gather_sources(modname: str, mod_objs: ModuleInventory) -> List[str]:
+    """
+    Collect the source files the inventory of ``modname`` depends on.  This is
+    the source of ``modname`` itself and the sources of all modules (within the
+    same package) that define the inventoried objects, or a base class of an
+    inventoried class.
+    """
+    pkg_name = modname.split(".")[0]
+    modnames = {modname}
+
+    for group in mod_objs:
+        if group == "modules":
+            continue
+
+        for obj in mod_objs.objs(group):
+            bases = obj.__mro__ if inspect.isclass(obj) else (obj,)
+            for base in bases:
+                obj_modname = getattr(base, "__module__", None)
+                if (
+                    isinstance(obj_modname, str)
+                    and obj_modname.split(".")[0] == pkg_name
+                ):
+                    modnames.add(obj_modname)
+
+    sources = set()
+    for name in modnames:
+        source = _module_source(sys.modules.get(name, None))
+        if source is not None:
+            sources.add(source)
+
+    return sorted(sources)
+
+
+def inspect_module(
+    modname: str,
+    app: "Sphinx" = None,
+    engine: str = None,
+    custom_groups: Dict[str, Any] = None,
+) -> Dict[str, Any]:
+    """
+    Inspect the module ``modname`` and generate its inventory.
+
+    Parameters
+    ----------
+    modname : str
+        Name of the module (e.g. ``"plasmapy_sphinx.utils"``) to be inspected.
+
+    app : `~sphinx.application.Sphinx`
+        Instance of the `Sphinx` application.
+
+    engine : str
+        The inspection engine, ``"import"``, ``"static"``, or ``"subprocess"``.
+        If not given, the engine is taken from the configuration value
+        :confval:`automodapi_inventory_engine`.  The ``"static"`` engine (see
+        `~plasmapy_sphinx.automodsumm.static`) falls back to the ``"import"``
+        engine for modules it can not analyze.  The ``"subprocess"`` engine
+        (see `~plasmapy_sphinx.automodsumm.isolated`) falls back to the
+        ``"import"`` engine when its worker pool is not usable (e.g. in
+        parallel read workers).
+
+    custom_groups : Dict[str, Any], optional
+        The custom groups to sort the objects into (see
+        :confval:`automodapi_custom_groups`).  If not given, the custom groups
+        are taken from ``app``.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The module inventory.  The ``"groups"`` key contains a dictionary like
+        that returned by `~plasmapy_sphinx.utils.find_mod_objs`, but without
+        the ``"objs"`` entries.  The ``"pkg_or_module"`` key is ``"pkg"`` if
+        ``modname`` is a package and ``"module"`` otherwise.  The ``"sources"``
+        key maps the source files the inventory depends on to their fingerprint.
+    """
+    if engine is None:
+        engine = _get_engine(app)
+
+    if engine == "subprocess":
+        from plasmapy_sphinx.automodsumm.isolated import get_inspection_pool
+
+        pool = get_inspection_pool(app)
+        if pool is not None:
+            return pool.inspect(modname)
+
+    result = None
+    if engine == "static":
+        from plasmapy_sphinx.automodsumm.static import inspect_module_static
+
+        result = inspect_module_static(
+            modname, app=app, custom_groups=custom_groups
+        )
+
+    if result is None:
+        mod_objs = find_mod_objs(modname, app=app, custom_groups=custom_groups)
+        mod = import_module(modname)
+        pkg_or_module = "pkg" if mod.__package__ == mod.__name__ else "module"
+        source_files = _gather_sources(modname, mod_objs)
+    else:
+        mod_objs, pkg_or_module, source_files = result
+
+    groups = mod_objs.as_dict()
+
+    sources = {}
+    for source in source_files:
+        try:
+            sources[source] = _fingerprint(source)
+        except OSError:
+            continue
+
+    return {
+        "modname": modname,
+        "pkg_or_module": pkg_or_module,
+        "groups": groups,
+        "sources": sources,
+    }
+
+
+def _get_engine(app: "Sphinx" = None) -> str:
+    """
+    Get the inventory engine defined by :confval:`automodapi_inventory_engine`.
+    """
+    try:
+        engine = app.config.automodapi_inventory_engine
+    except AttributeError:
+        return "import"
+
+    if engine not in ("import", "static", "subprocess"):
+        logger.warning(
+            f"[automodsumm] unknown automodapi_inventory_engine '{engine}', "
+            f"using 'import'"
+        )
+        engine = "import"
+
+    return engine
+
+
+class InventoryCache:
+    """
+    A persistent (on-disk) cache of module inventories.
+
+    Each cached inventory records the fingerprints (modification time, size,
+    and SHA256 hash) of the source files it was generated from, and is only
+    served while those files remain unchanged.  The whole cache is discarded
+    if the `plasmapy_sphinx`, `sphinx`, or Python versions, the
+    :confval:`automodapi_inventory_engine`, or the
+    :confval:`automodapi_custom_groups` definition change.
+
+    Parameters
+    ----------
+    path : str
+        Path to the JSON file where the cache is persisted.
+
+    key : Dict[str, str]
+        Dictionary identifying the conditions under which the cached
+        inventories were generated.
+    """
+
+    _version = 1
+
+    def __init__(self, path: str, key: Dict[str, str]):
+        self._path = path
+        self._key = key
+        self._records = None  # type: Optional[Dict[str, Dict[str, Any]]]
+        self._dirty = False
+
+    def __getstate__(self):
+        # the inventories are persisted in their own file, there is no need to
+        # bloat the pickled build environment with them
+        state = self.__dict__.copy()
+        state.update(_records=None, _dirty=False)
+        return state
+
+    @classmethod
+    def from_app(cls, app: "Sphinx") -> "InventoryCache":
+        """
+        Create the cache associated with the Sphinx application ``app``.  The
+        cache is stored in the doctree directory of the build.
+        """
+        from plasmapy_sphinx import _get_cache_version
+
+        custom_groups = json.dumps(
+            get_custom_grouping_info(app), sort_keys=True, default=str
+        )
+        engine = _get_engine(app)
+        key = {
+            "cache_version": str(cls._version),
+            "plasmapy_sphinx": _get_cache_version(),
+            "sphinx": sphinx_version,
+            "python": ".".join(str(v) for v in sys.version_info[:2]),
+            # the subprocess engine generates the same inventories as the
+            # import engine
+            "engine": engine if engine != "subprocess" else "import",
+            "custom_groups": hashlib.sha256(custom_groups.encode()).hexdigest(),
+        }
+        path = os.path.join(app.doctreedir, "plasmapy_sphinx", "inventory_cache.json")
+        return cls(path, key)
+
+    @property
+    def path(self) -> str:
+        """Path to the JSON file where the cache is persisted."""
+        return self._path
+
+    @property
+    def key(self) -> Dict[str, str]:
+        """Dictionary identifying the conditions of the cached inventories."""
+        return self._key.copy()
+
+    @property
+    def records(self) -> Dict[str, Dict[str, Any]]:
+        """Dictionary of all cached inventories, keyed by module name."""
+        if self._records is None:
+            self.load()
+        return self._records
+
+    def load(self) -> None:
+        """Load the cache from :attr:`path`."""
+        self._records = {}
+        self._dirty = False
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(data, dict) or data.get("key", None) != self._key:
+            logger.info("[automodsumm] discarding outdated inventory cache")
+            self._dirty = True
+            return
+
+        self._records = data.get("records", {})
+
+    def save(self) -> None:
+        """Write the cache to :attr:`path`, if it has been modified."""
+        if not self._dirty or self._records is None:
+            return
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"key": self._key, "records": self._records}, f)
+        os.replace(tmp_path, self.path)
+
+        self._dirty = False
+
+    def get(self, modname: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the cached inventory for ``modname``.  Returns `None` if there
+        is no inventory cached or if the cached inventory is outdated.
+        """
+        record = self.records.get(modname, None)
+        if record is None:
+            return None
+
+        if not self._validate_sources(record["sources"]):
+            del self._records[modname]
+            self._dirty = True
+            return None
+
+        return record
+
+    def set(self, modname: str, record: Dict[str, Any]) -> None:
+        """Cache the inventory ``record`` for module ``modname``."""
+        self.records[modname] = record
+        self._dirty = True
+
+    def _validate_sources(self, sources: Dict[str, List[Any]]) -> bool:
+        """
+        Check the recorded source fingerprints against the file system.  Files
+        with an updated modification time, but the same content, are accepted
+        and have their fingerprint refreshed.
+        """
+        valid, refreshed = _validate_fingerprints(sources)
+        if refreshed:
+            self._dirty = True
+
+        return valid
+
+
+class InventoryStore:
+    """
+    A build-scoped, bounded (least recently used) store of module inventories.
+    The store is attached to the build environment at :event:`builder-inited`
+    and is filled during stub file generation, so the directives of the read
+    phase can reuse the inventories without re-inspecting the modules.
+
+    The store also tracks which documents used which inventories.  Those
+    associations are removed when a document is purged from the environment
+    (see :event:`env-purge-doc`).
+
+    With parallel reading (``sphinx-build -j N``), the read workers are forked
+    after :event:`builder-inited` and, thus, inherit the inventories already
+    in the store.  Inventories added by a worker are sent back with the
+    worker's pickled environment and merged into the main process's store (see
+    :meth:`merge` and :event:`env-merge-info`), so later workers inherit them
+    too.  Each module is inspected once, regardless of the number of workers.
+
+    Inventories can also be pinned (e.g. those precomputed by walking the
+    packages listed in :confval:`automodapi_inventory_packages`), which are
+    never discarded and do not count towards ``maxsize``.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of inventories held by the store.  Once exceeded, the
+        least recently used inventory is discarded.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._maxsize = maxsize
+        self._records = OrderedDict()  # type: OrderedDict[str, Dict[str, Any]]
+        self._pinned = {}  # type: Dict[str, Dict[str, Any]]
+        self._users = {}  # type: Dict[str, set]
+
+        # inventories added in a forked read worker
+        self._pid = os.getpid()
+        self._worker_records = OrderedDict()  # type: OrderedDict[str, Dict[str, Any]]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if os.getpid() == self._pid:
+            # the store is build-scoped, do not persist the inventories with the
+            # pickled build environment
+            state.update(_records=OrderedDict(), _pinned={}, _users={})
+        else:
+            # pickled by a read worker to send its environment to the main
+            # process, only send what the main process does not have (the
+            # pinned inventories are inherited from the main process)
+            state.update(_records=self._worker_records.copy(), _pinned={})
+        state.update(_worker_records=OrderedDict())
+        return state
+
+    def __contains__(self, modname: str) -> bool:
+        return modname in self._pinned or modname in self._records
+
+    def __len__(self) -> int:
+        return len(self._pinned) + len(self._records)
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of inventories held by the store."""
+        return self._maxsize
+
+    def get(self, modname: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the inventory for ``modname``, or `None` if it is not stored.
+        """
+        record = self._pinned.get(modname, None)
+        if record is not None:
+            return record
+
+        try:
+            self._records.move_to_end(modname)
+        except KeyError:
+            return None
+
+        return self._records[modname]
+
+    def set(self, modname: str, record: Dict[str, Any], pin: bool = False) -> None:
+        """
+        Store the inventory ``record`` for module ``modname``.  Set ``pin`` to
+        `True` to pin the inventory, so it is never discarded.
+        """
+        if pin:
+            self._records.pop(modname, None)
+            self._pinned[modname] = record
+            return
+        elif modname in self._pinned:
+            self._pinned[modname] = record
+            return
+
+        self._records[modname] = record
+        self._records.move_to_end(modname)
+
+        if os.getpid() != self._pid:
+            self._worker_records[modname] = record
+
+        while len(self._records) > self._maxsize:
+            self._records.popitem(last=False)
+
+    def discard_stale(self) -> List[str]:
+        """
+        Discard the inventories (pinned or not) whose source files changed since
+        they were inspected.  Returns the names of the discarded modules.
+        """
+        stale = []
+        for records in (self._pinned, self._records):
+            for modname, record in list(records.items()):
+                if not _validate_fingerprints(record["sources"])[0]:
+                    del records[modname]
+                    stale.append(modname)
+
+        return stale
+
+    def note_user(self, modname: str, docname: str) -> None:
+        """Record that document ``docname`` used the inventory of ``modname``."""
+        self._users.setdefault(docname, set()).add(modname)
+
+    def purge_doc(self, docname: str) -> None:
+        """Remove all associations of document ``docname`` with the inventories."""
+        self._users.pop(docname, None)
+
+    def merge(self, other: "InventoryStore", docnames: Set[str]) -> List[str]:
+        """
+        Merge the inventories of store ``other`` (from a read worker) and its
+        associations with the documents ``docnames`` into this store.  Returns
+        the names of the modules whose inventories were added.
+        """
+        added = []
+        for modname, record in other._records.items():
+            if modname not in self:
+                self.set(modname, record)
+                added.append(modname)
+
+        for docname in docnames:
+            if docname in other._users:
+                self._users[docname] = set(other._users[docname])
+
+        return added
+
+
+class SourceDependencies:
+    """
+    The source files the documents of a build depend on through the module
+    inventories used by their directives (i.e. the sources of the documented
+    modules and of the modules their objects are re-exported from), along with
+    the fingerprints of the files when the documents were read.
+
+    Unlike the dependencies tracked by Sphinx (see
+    `~sphinx.environment.BuildEnvironment.note_dependency`), which are outdated
+    by any change of a file's modification time, a document is only outdated
+    once the content of one of its source files changes (see :meth:`outdated`).
+    The dependencies persist with the pickled build environment, while the
+    fingerprints refreshed by :meth:`outdated` are persisted in their own file
+    (see :meth:`save_fingerprints`), since Sphinx only pickles the build
+    environment when documents were read.
+    """
+
+    _dirty = False
+
+    def __init__(self):
+        self._docs = {}  # type: Dict[str, Dict[str, List[Any]]]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_dirty", None)
+        return state
+
+    def __contains__(self, docname: str) -> bool:
+        return docname in self._docs
+
+    def load_fingerprints(self, path: str) -> None:
+        """
+        Apply the fingerprints saved to ``path`` by :meth:`save_fingerprints`,
+        which were refreshed after the build environment was pickled.  Only
+        the fingerprints of files with the same content, but a newer
+        modification time, are applied.
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        fingerprints = data.get("fingerprints", {}) if isinstance(data, dict) else {}
+        for deps in self._docs.values():
+            for source, fingerprint in deps.items():
+                refreshed = fingerprints.get(source, None)
+                if (
+                    isinstance(refreshed, list)
+                    and len(refreshed) == 3
+                    and refreshed[1:] == fingerprint[1:]
+                    and refreshed[0] > fingerprint[0]
+                ):
+                    deps[source] = list(refreshed)
+
+    def save_fingerprints(self, path: str) -> None:
+        """
+        Write the fingerprints of all source files to ``path``, if any were
+        refreshed by :meth:`outdated`.
+        """
+        if not self._dirty:
+            return
+
+        fingerprints = {}  # type: Dict[str, List[Any]]
+        for deps in self._docs.values():
+            fingerprints.update(deps)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"fingerprints": fingerprints}, f)
+        os.replace(tmp_path, path)
+
+        self._dirty = False
+
+    def sources(self, docname: str) -> List[str]:
+        """The source files document ``docname`` depends on."""
+        return sorted(self._docs.get(docname, {}))
+
+    def note(self, docname: str, sources: Dict[str, List[Any]]) -> None:
+        """
+        Record that document ``docname`` depends on the source files
+        ``sources``, which maps the files to their fingerprint.
+        """
+        deps = self._docs.setdefault(docname, {})
+        for source, fingerprint in sources.items():
+            deps[source] = list(fingerprint)
+
+    def purge_doc(self, docname: str) -> None:
+        """Remove all the dependencies of document ``docname``."""
+        self._docs.pop(docname, None)
+
+    def merge(self, other: "SourceDependencies", docnames: Set[str]) -> None:
+        """
+        Merge the dependencies of the documents ``docnames`` recorded in
+        ``other`` (from a read worker).
+        """
+        for docname in docnames:
+            if docname in other._docs:
+                self._docs[docname] = other._docs[docname]
+
+    def outdated(self, exclude: Set[str] = frozenset()) -> Set[str]:
+        """
+        Find the documents (not in ``exclude``) depending on a source file
+        whose content changed, or which no longer exists.  Files with an
+        updated modification time, but the same content, are accepted and
+        have their fingerprint refreshed (see :meth:`save_fingerprints`).
+        """
+        # the validated fingerprint of each source file, or None if changed
+        checked = {}  # type: Dict[str, Optional[List[Any]]]
+        outdated = set()
+        for docname, deps in self._docs.items():
+            if docname in exclude:
+                continue
+
+            for source, fingerprint in deps.items():
+                if source not in checked:
+                    sources = {source: fingerprint}
+                    valid, _ = _validate_fingerprints(sources)
+                    checked[source] = sources[source] if valid else None
+
+                if checked[source] is None:
+                    outdated.add(docname)
+                    break
+                elif checked[source] != fingerprint:
+                    deps[source] = list(checked[source])
+                    self._dirty = True
+
+        return outdated
+
+
+def get_inventory(
+    modname: str, app: "Sphinx" = None, docname: str = None, pin: bool = False
+) -> Dict[str, Any]:
+    """
+    Retrieve the inventory of module ``modname``.  The inventory is served from
+    the build's `~plasmapy_sphinx.automodsumm.inventory.InventoryStore` or
+    `~plasmapy_sphinx.automodsumm.inventory.InventoryCache` when possible;
+    otherwise, the module is inspected with
+    `~plasmapy_sphinx.automodsumm.inventory.inspect_module` and the result
+    stored.
+
+    Parameters
+    ----------
+    modname : str
+        Name of the module (e.g. ``"plasmapy_sphinx.utils"``) to be inspected.
+
+    app : `~sphinx.application.Sphinx`
+        Instance of the `Sphinx` application.
+
+    docname : str
+        Name of the document requesting the inventory.  If given, and it is a
+        document of the build, the association is recorded in the
+        `~plasmapy_sphinx.automodsumm.inventory.InventoryStore`.
+
+    pin : bool
+        (Default `False`) Set `True` to pin the inventory into the
+        `~plasmapy_sphinx.automodsumm.inventory.InventoryStore`, so it is never
+        discarded from the store.
+    """
+    env = getattr(app, "env", None)
+    store = getattr(env, "automodsumm_inventory_store", None)
+    cache = getattr(env, "automodsumm_inventory_cache", None)
+
+    record = None if store is None else store.get(modname)
+
+    if record is None and cache is not None:
+        record = cache.get(modname)
+
+    if record is None:
+        record = inspect_module(modname, app=app)
+
+        if cache is not None:
+            cache.set(modname, record)
+
+    if store is not None:
+        if pin or modname not in store:
+            store.set(modname, record, pin=pin)
+
+        if docname is not None and docname in env.found_docs:
+            store.note_user(modname, docname)
+
+            deps = getattr(env, "automodsumm_source_dependencies", None)
+            if deps is not None:
+                deps.note(docname, record["sources"])
+
+    return record
+
+
+def prefetch_inventories(modnames: List[str], app: "Sphinx" = None) -> None:
+    """
+    Queue the inspection of the modules ``modnames`` that are neither in the
+    build's `~plasmapy_sphinx.automodsumm.inventory.InventoryStore` nor in the
+    `~plasmapy_sphinx.automodsumm.inventory.InventoryCache`, so they are
+    inspected concurrently by the ``"subprocess"`` engine (see
+    `~plasmapy_sphinx.automodsumm.isolated.InspectionPool`).  Does nothing for
+    the other engines.  The inventories are retrieved with
+    `~plasmapy_sphinx.automodsumm.inventory.get_inventory`.
+    """
+    from plasmapy_sphinx.automodsumm.isolated import get_inspection_pool
+
+    pool = get_inspection_pool(app)
+    if pool is None:
+        return
+
+    store = getattr(app.env, "automodsumm_inventory_store", None)
+    cache = getattr(app.env, "automodsumm_inventory_cache", None)
+    pool.prefetch(
+        modname
+        for modname in dict.fromkeys(modnames)
+        if (store is None or modname not in store)
+        and (cache is None or cache.get(modname) is None)
+    )
+
+
+def _fingerprints_path(app: "Sphinx") -> str:
+    """
+    Path to the file persisting the refreshed fingerprints of the
+    `~plasmapy_sphinx.automodsumm.inventory.SourceDependencies` of ``app``.
+    """
+    return os.path.join(app.doctreedir, "plasmapy_sphinx", "source_fingerprints.json")
+
+
+def event_handler__builder_inited(app: "Sphinx") -> None:
+    """
+    Event handler for the Sphinx event :event:`builder-inited`.  This handler
+    attaches a new `~plasmapy_sphinx.automodsumm.inventory.InventoryStore`, the
+    `~plasmapy_sphinx.automodsumm.inventory.InventoryCache` (if enabled by
+    :confval:`automodapi_inventory_cache`), and the
+    `~plasmapy_sphinx.automodsumm.isolated.InspectionPool` (if the
+    ``"subprocess"`` :confval:`automodapi_inventory_engine` is used) to the
+    build environment.  The
+    `~plasmapy_sphinx.automodsumm.inventory.SourceDependencies` (if enabled by
+    :confval:`automodapi_source_dependencies`) are kept from the previous
+    build's environment, with the fingerprints refreshed since it was pickled.
+    """
+    env = app.env  # type: BuildEnvironment
+
+    if not app.config.automodapi_source_dependencies:
+        env.automodsumm_source_dependencies = None
+    elif not isinstance(
+        getattr(env, "automodsumm_source_dependencies", None), SourceDependencies
+    ):
+        env.automodsumm_source_dependencies = SourceDependencies()
+    else:
+        env.automodsumm_source_dependencies.load_fingerprints(_fingerprints_path(app))
+
+    env.automodsumm_inventory_store = InventoryStore(
+        maxsize=app.config.automodapi_inventory_store_size
+    )
+
+    if app.config.automodapi_inventory_cache:
+        env.automodsumm_inventory_cache = InventoryCache.from_app(app)
+    else:
+        env.automodsumm_inventory_cache = None
+
+    if _get_engine(app) == "subprocess":
+        from plasmapy_sphinx.automodsumm.isolated import InspectionPool
+
+        workers = app.config.automodapi_inventory_workers
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+
+        env.automodsumm_inspection_pool = InspectionPool(
+            workers,
+            app.config.automodapi_inventory_worker_max_modules,
+            custom_groups=get_custom_grouping_info(app),
+        )
+    else:
+        env.automodsumm_inspection_pool = None
+
+
+def event_handler__env_purge_doc(
+    app: "Sphinx", env: "BuildEnvironment", docname: str
+) -> None:
+    """
+    Event handler for the Sphinx event :event:`env-purge-doc`.  This handler
+    removes the document ``docname`` from the
+    `~plasmapy_sphinx.automodsumm.inventory.InventoryStore` and the
+    `~plasmapy_sphinx.automodsumm.inventory.SourceDependencies`.
+    """
+    store = getattr(env, "automodsumm_inventory_store", None)
+    if store is not None:
+        store.purge_doc(docname)
+
+    deps = getattr(env, "automodsumm_source_dependencies", None)
+    if deps is not None:
+        deps.purge_doc(docname)
+
+
+def event_handler__env_get_outdated(
+    app: "Sphinx",
+    env: "BuildEnvironment",
+    added: Set[str],
+    changed: Set[str],
+    removed: Set[str],
+) -> List[str]:
+    """
+    Event handler for the Sphinx event :event:`env-get-outdated`.  This handler
+    returns the documents that need to be re-read since the content of a
+    source file recorded in the
+    `~plasmapy_sphinx.automodsumm.inventory.SourceDependencies` changed.
+    """
+    deps = getattr(env, "automodsumm_source_dependencies", None)
+    if deps is None:
+        return []
+
+    outdated = deps.outdated(exclude=added | changed | removed)
+    if outdated:
+        # verbose, since sphinx reports the outdated documents on the same line
+        logger.verbose(
+            f"[automodsumm] {len(outdated)} documents depend on changed "
+            f"module sources"
+        )
+
+    return sorted(outdated)
+
+
+def event_handler__env_merge_info(
+    app: "Sphinx",
+    env: "BuildEnvironment",
+    docnames: Set[str],
+    other: "BuildEnvironment",
+) -> None:
+    """
+    Event handler for the Sphinx event :event:`env-merge-info`.  This handler
+    merges the inventories generated by a parallel read worker into the
+    `~plasmapy_sphinx.automodsumm.inventory.InventoryStore` and
+    `~plasmapy_sphinx.automodsumm.inventory.InventoryCache` of the main
+    process, and the documents' source file dependencies into the
+    `~plasmapy_sphinx.automodsumm.inventory.SourceDependencies`.
+    """
+    deps = getattr(env, "automodsumm_source_dependencies", None)
+    other_deps = getattr(other, "automodsumm_source_dependencies", None)
+    if deps is not None and other_deps is not None:
+        deps.merge(other_deps, docnames)
+
+    store = getattr(env, "automodsumm_inventory_store", None)
+    other_store = getattr(other, "automodsumm_inventory_store", None)
+    if store is None or other_store is None:
+        return
+
+    added = store.merge(other_store, docnames)
+
+    cache = getattr(env, "automodsumm_inventory_cache", None)
+    if cache is not None:
+        for modname in added:
+            cache.set(modname, store.get(modname))
+
+
+def event_handler__build_finished(app: "Sphinx", exception: Exception) -> None:
+    """
+    Event handler for the Sphinx event :event:`build-finished`.  This handler
+    persists the `~plasmapy_sphinx.automodsumm.inventory.InventoryCache` and the
+    refreshed fingerprints of the
+    `~plasmapy_sphinx.automodsumm.inventory.SourceDependencies`, and stops the
+    workers of the `~plasmapy_sphinx.automodsumm.isolated.InspectionPool`.
+    """
+    pool = getattr(app.env, "automodsumm_inspection_pool", None)
+    if pool is not None and pool.usable:
+        pool.close()
+
+    deps = getattr(app.env, "automodsumm_source_dependencies", None)
+    if deps is not None:
+        try:
+            deps.save_fingerprints(_fingerprints_path(app))
+        except OSError as err:
+            logger.warning(f"[automodsumm] unable to write source fingerprints: {err}")
+
+    cache = getattr(app.env, "automodsumm_inventory_cache", None)
+    if cache is None:
+        return
+
+    try:
+        cache.save()
+    except OSError as err:
+        logger.warning(f"[automodsumm] unable to write inventory cache: {err}")
@@ -0,0 +1,133 @@
+"""
+This module contains the subprocess-isolated inventory engine used when the
+configuration value :confval:`automodapi_inventory_engine` is set to
+``"subprocess"``.
+
+The engine inspects modules in a pool of worker subprocesses (see
+`~plasmapy_sphinx.automodsumm.isolated.InspectionPool`), which import the
+modules and return their (serializable) inventories.  Thus, the import graphs of
+the inspected modules, and any import side effects, stay out of the Sphinx
+process while the stub files are listed.  The workers are fresh interpreters
+(i.e. spawned, not forked), inherit the `sys.path` of the Sphinx process (e.g.
+as modified by ``conf.py``), and are replaced after inspecting a number of
+modules (see :confval:`automodapi_inventory_worker_max_modules`) to bound their
+memory.  The modules named by the directives of a document are inspected
+concurrently, across the workers (see :confval:`automodapi_inventory_workers`).
+
+The Sphinx process still imports the documented objects to render the stub
+files and to document them (e.g. with :rst:dir:`automodapi`), only the
+inspection for the inventories is isolated.  Since the workers do not run the
+Sphinx extensions, modules relying on import mocking (e.g. by
+``autodoc_mock_imports``) should be inspected with the ``"import"`` engine.
+"""
+__all__ = ["InspectionPool", "get_inspection_pool"]
+
+import multiprocessing
+import os
+
+from typing import Any, Dict, Iterable, Optional
+
+if False:
+    # for annotation, does not need real import
+    from multiprocessing.pool import AsyncResult, Pool
+    from sphinx.application import Sphinx
+
+
+def _inspect(modname: str, custom_groups: Dict[str, Any]) -> Dict[str, Any]:
+    """Inspect module ``modname`` in a worker subprocess."""
+    from plasmapy_sphinx.automodsumm.inventory import inspect_module
+
+    return inspect_module(modname, engine="import", custom_groups=custom_groups)
+
+
+class InspectionPool:
+    """
+    A lazily started pool of worker subprocesses inspecting modules for their
+    inventories (see `~plasmapy_sphinx.automodsumm.inventory.inspect_module`).
+
+    Parameters
+    ----------
+    workers : int
+        Number of worker subprocesses.
+
+    max_modules : int
+        Number of modules a worker inspects before it is replaced by a fresh
+        worker.
+
+    custom_groups : Dict[str, Any]
+        The custom groups defined by :confval:`automodapi_custom_groups`.
+    """
+
+    def __init__(
+        self, workers: int, max_modules: int, custom_groups: Dict[str, Any] = None
+    ):
+        self._workers = max(workers, 1)
+        self._max_modules = max(max_modules, 1)
+        self._custom_groups = dict(custom_groups or {})
+        self._pid = os.getpid()
+        self._pool = None  # type: Optional[Pool]
+        self._pending = {}  # type: Dict[str, AsyncResult]
+
+    def __getstate__(self):
+        # the pool belongs to the process that started it, do not pickle it
+        # with the build environment
+        state = self.__dict__.copy()
+        state.update(_pool=None, _pending={})
+        return state
+
+    @property
+    def usable(self) -> bool:
+        """
+        `True` if the pool can be used by the current process.  The pool is not
+        usable from forked processes (e.g. parallel read workers).
+        """
+        return os.getpid() == self._pid
+
+    def _get_pool(self) -> "Pool":
+        if self._pool is None:
+            ctx = multiprocessing.get_context("spawn")
+            self._pool = ctx.Pool(
+                processes=self._workers, maxtasksperchild=self._max_modules
+            )
+        return self._pool
+
+    def prefetch(self, modnames: Iterable[str]) -> None:
+        """
+        Queue the inspection of the modules ``modnames``, so they are inspected
+        concurrently.  The inventories are retrieved with :meth:`inspect`.
+        """
+        for modname in modnames:
+            if modname not in self._pending:
+                self._pending[modname] = self._get_pool().apply_async(
+                    _inspect, (modname, self._custom_groups)
+                )
+
+    def inspect(self, modname: str) -> Dict[str, Any]:
+        """
+        Retrieve the inventory of module ``modname`` from the workers.  Any
+        exception raised by the inspection (e.g. `ImportError`) is re-raised.
+        """
+        self.prefetch([modname])
+        return self._pending.pop(modname).get()
+
+    def close(self) -> None:
+        """Stop the worker subprocesses, discarding any pending inspections."""
+        self._pending.clear()
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+
+def get_inspection_pool(app: "Sphinx") -> Optional[InspectionPool]:
+    """
+    Retrieve the `~plasmapy_sphinx.automodsumm.isolated.InspectionPool` of the
+    build, if the ``"subprocess"`` engine is used and the pool is usable by the
+    current process.
+    """
+    env = getattr(app, "env", None)
+    pool = getattr(env, "automodsumm_inspection_pool", None)
+    if pool is None or not pool.usable:
+        return None
+
+    return pool
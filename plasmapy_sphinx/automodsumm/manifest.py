@@ -0,0 +1,433 @@
+"""
+This module contains functionality for tracking the stub files generated for the
+:rst:dir:`automodapi` and :rst:dir:`automodsumm` directives across builds.  The
+stub manifest records, for each generated stub file, a hash of the inputs the
+stub was rendered from and fingerprints of the source files of the documented
+object.  This allows `~plasmapy_sphinx.automodsumm.generate.GenDocsFromAutomodsumm`
+to skip rendering (and reading) unchanged stub files, and to identify stub files
+no longer produced by any directive (see configuration values
+:confval:`automodapi_stub_manifest` and :confval:`automodapi_stub_orphans`).
+"""
+__all__ = ["StubManifest", "gather_entry_sources"]
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+
+from sphinx import __version__ as sphinx_version
+from sphinx.util import logging
+from typing import Any, Dict, List, Optional
+
+from plasmapy_sphinx.automodsumm.inventory import (
+    _fingerprint,
+    _module_source,
+    _validate_fingerprints,
+)
+from plasmapy_sphinx.utils import templates_dir
+
+if False:
+    # for annotation, does not need real import
+    from sphinx.application import Sphinx
+
+    from plasmapy_sphinx.automodsumm.generate import AutomodsummEntry
+
+logger = logging.getLogger(__name__)
+
+
+def gather_entry_sources(obj: Any, modname: str) -> List[str]:
+    """
+    Collect the source files the stub file of object ``obj`` (defined in module
+    ``modname``) is rendered from.  This is the source of ``modname``, the
+    source of the module defining ``obj``, and...
+
+    * for classes, the sources of all base classes in the same package.
+    * for modules, the sources of all public members in the same package.
+    """
+    pkg_name = modname.split(".")[0]
+    modnames = {modname}
+
+    if inspect.ismodule(obj):
+        modnames.add(obj.__name__)
+        members = [
+            value
+            for name, value in vars(obj).items()
+            if not name.startswith("_") and not inspect.ismodule(value)
+        ]
+    elif inspect.isclass(obj):
+        members = obj.__mro__
+    else:
+        members = [obj]
+
+    for member in members:
+        member_modname = getattr(member, "__module__", None)
+        if isinstance(member_modname, str) and member_modname.split(".")[0] == pkg_name:
+            modnames.add(member_modname)
+
+    sources = set()
+    for name in modnames:
+        source = _module_source(sys.modules.get(name, None))
+        if source is not None:
+            sources.add(source)
+
+    return sorted(sources)
+
+
+def _hash_templates(app: "Sphinx") -> str:
+    """
+    Generate a hash of all the template files that could be used to render a
+    stub file.
+    """
+    import sphinx.ext.autosummary
+
+    dirs = [
+        os.path.join(app.srcdir, path) for path in app.config.templates_path
+    ]  # type: List[str]
+    dirs.append(str(templates_dir))
+    dirs.append(
+        os.path.join(os.path.dirname(sphinx.ext.autosummary.__file__), "templates")
+    )
+
+    # AutomodsummRenderer appends the plasmapy_sphinx templates directory to
+    # templates_path, so only hash each directory once
+    dirs = dict.fromkeys(os.path.normpath(path) for path in dirs)
+
+    sha = hashlib.sha256()
+    for templates_path in dirs:
+        for root, _, files in sorted(os.walk(templates_path)):
+            for filename in sorted(files):
+                path = os.path.join(root, filename)
+                try:
+                    with open(path, "rb") as f:
+                        content = f.read()
+                except OSError:
+                    continue
+
+                sha.update(os.path.relpath(path, templates_path).encode())
+                sha.update(hashlib.sha256(content).digest())
+
+    return sha.hexdigest()
+
+
+class StubManifest:
+    """
+    A persistent (on-disk) manifest of the stub files generated by
+    `~plasmapy_sphinx.automodsumm.generate.GenDocsFromAutomodsumm`.
+
+    Each record of the manifest is keyed by the absolute path of the stub file
+    and contains...
+
+    * ``"entry"``: the `~plasmapy_sphinx.automodsumm.generate.AutomodsummEntry`
+      the stub file was generated for,
+    * ``"inputs"``: a hash of the entry and the build conditions (versions,
+      templates, and configuration values) the stub file was rendered with,
+    * ``"source"``: the document containing the directive that produced the
+      entry,
+    * ``"sources"``: the fingerprints of the source files of the documented
+      object (see `~plasmapy_sphinx.automodsumm.manifest.gather_entry_sources`),
+    * ``"stat"`` and ``"sha"``: the modification time, size, and hash of the
+      written stub file.
+
+    Parameters
+    ----------
+    path : str
+        Path to the JSON file where the manifest is persisted.
+
+    key : Dict[str, str]
+        Dictionary identifying the conditions under which the stub files are
+        rendered.
+    """
+
+    _version = 1
+
+    def __init__(self, path: str, key: Dict[str, str]):
+        self._path = path
+        self._key = key
+        self._records = None  # type: Optional[Dict[str, Dict[str, Any]]]
+        self._by_entry = {}  # type: Dict[str, str]
+        self._key_matches = False
+        self._dirty = False
+        self._scanned = set()
+        self._uninspected = set()
+        self._produced = {}  # type: Dict[str, set]
+
+    @classmethod
+    def from_app(cls, app: "Sphinx") -> "StubManifest":
+        """
+        Create the manifest associated with the Sphinx application ``app``.  The
+        manifest is stored in the doctree directory of the build.
+        """
+        from plasmapy_sphinx import _get_cache_version
+
+        config = app.config
+        conf_values = json.dumps(
+            {
+                name: getattr(config, name, None)
+                for name in (
+                    "autosummary_context",
+                    "autosummary_filename_map",
+                    "autosummary_ignore_module_all",
+                    "autosummary_imported_members",
+                    "source_encoding",
+                )
+            },
+            sort_keys=True,
+            default=str,
+        )
+        key = {
+            "manifest_version": str(cls._version),
+            "plasmapy_sphinx": _get_cache_version(),
+            "sphinx": sphinx_version,
+            "python": ".".join(str(v) for v in sys.version_info[:2]),
+            "templates": _hash_templates(app),
+            "config": hashlib.sha256(conf_values.encode()).hexdigest(),
+        }
+        path = os.path.join(app.doctreedir, "plasmapy_sphinx", "stub_manifest.json")
+        return cls(path, key)
+
+    @property
+    def path(self) -> str:
+        """Path to the JSON file where the manifest is persisted."""
+        return self._path
+
+    @property
+    def records(self) -> Dict[str, Dict[str, Any]]:
+        """Dictionary of all manifest records, keyed by stub file path."""
+        if self._records is None:
+            self.load()
+        return self._records
+
+    def load(self) -> None:
+        """
+        Load the manifest from :attr:`path`.  If the manifest was written under
+        different conditions, then its records are only used to identify
+        orphaned stub files and never to skip rendering.
+        """
+        self._records = {}
+        self._by_entry = {}
+        self._dirty = False
+        self._key_matches = False
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(data, dict):
+            return
+
+        self._records = data.get("records", {})
+        self._by_entry = {
+            record["entry"]: filename for filename, record in self._records.items()
+        }
+        self._key_matches = data.get("key", None) == self._key
+        if not self._key_matches:
+            logger.info("[automodsumm] stub manifest is outdated, re-rendering stubs")
+
+    def save(self) -> None:
+        """Write the manifest to :attr:`path`, if it has been modified."""
+        if not self._dirty or self._records is None:
+            return
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"key": self._key, "records": self._records}, f)
+        os.replace(tmp_path, self.path)
+
+        self._dirty = False
+
+    @staticmethod
+    def entry_key(entry: "AutomodsummEntry", path: str) -> str:
+        """
+        The string identifying ``entry`` when its stub file is written to
+        directory ``path``.
+        """
+        return json.dumps([entry.name, path, entry.template, entry.recursive])
+
+    def _inputs(self, entry_key: str) -> str:
+        inputs = json.dumps([entry_key, self._key], sort_keys=True)
+        return hashlib.sha256(inputs.encode()).hexdigest()
+
+    def lookup(self, entry: "AutomodsummEntry", path: str) -> Optional[str]:
+        """
+        Retrieve the stub file of ``entry`` (written to directory ``path``) if
+        it is up-to-date, i.e. the inputs and object source files are unchanged
+        and the stub file has not been modified since it was written.  Returns
+        `None` if the stub file needs to be rendered.
+        """
+        if self._records is None:
+            self.load()
+
+        if not self._key_matches:
+            return None
+
+        entry_key = self.entry_key(entry, path)
+        filename = self._by_entry.get(entry_key, None)
+        if filename is None:
+            return None
+
+        record = self._records[filename]
+        if record["inputs"] != self._inputs(entry_key) or not self._stat_matches(
+            filename, record
+        ):
+            return None
+
+        valid, refreshed = _validate_fingerprints(record["sources"])
+        if refreshed:
+            self._dirty = True
+
+        return filename if valid else None
+
+    def recorded_stub(self, entry: "AutomodsummEntry", path: str) -> Optional[str]:
+        """
+        The stub file recorded for ``entry`` (written to directory ``path``),
+        whether or not it is up-to-date.  Returns `None` if no stub file is
+        recorded.
+        """
+        if self._records is None:
+            self.load()
+
+        return self._by_entry.get(self.entry_key(entry, path), None)
+
+    def is_unchanged(self, filename: str, content: str, encoding: str) -> bool:
+        """
+        Check if the stub file ``filename`` was written by the manifest with
+        ``content``, without reading the file.
+        """
+        record = self.records.get(filename, None)
+        if record is None or not self._stat_matches(filename, record):
+            return False
+
+        return record["sha"] == hashlib.sha256(content.encode(encoding)).hexdigest()
+
+    def update(
+        self,
+        entry: "AutomodsummEntry",
+        path: str,
+        filename: str,
+        source: str,
+        sources: List[str],
+        content: str,
+        encoding: str,
+    ) -> None:
+        """
+        Record that the stub file ``filename`` (in directory ``path``) contains
+        ``content`` rendered for ``entry``, which was found in document
+        ``source``, from the object source files ``sources``.
+        """
+        entry_key = self.entry_key(entry, path)
+        stat = os.stat(filename)
+
+        fingerprints = {}
+        for source_file in sources:
+            try:
+                fingerprints[source_file] = _fingerprint(source_file)
+            except OSError:
+                continue
+
+        old_record = self.records.get(filename, None)
+        if old_record is not None:
+            self._by_entry.pop(old_record["entry"], None)
+
+        self.records[filename] = {
+            "entry": entry_key,
+            "inputs": self._inputs(entry_key),
+            "source": source,
+            "sources": fingerprints,
+            "stat": [stat.st_mtime_ns, stat.st_size],
+            "sha": hashlib.sha256(content.encode(encoding)).hexdigest(),
+        }
+        self._by_entry[entry_key] = filename
+        self._dirty = True
+
+        self.note_produced(filename, source)
+
+    def forget(self, filename: str) -> None:
+        """Remove the record of stub file ``filename`` from the manifest."""
+        record = self.records.pop(filename, None)
+        if record is not None:
+            self._by_entry.pop(record["entry"], None)
+            self._dirty = True
+
+    def note_scanned(self, filename: str) -> None:
+        """Record that document ``filename`` was scanned for directives."""
+        self._scanned.add(filename)
+
+    def note_uninspected(self, filename: str) -> None:
+        """
+        Record that the directives of document ``filename`` could not all be
+        inspected (e.g. the documented module failed to import), so the stub
+        files found in the document are never considered orphaned.
+        """
+        self._uninspected.add(filename)
+
+    def note_produced(self, filename: str, source: str) -> None:
+        """
+        Record that stub file ``filename`` is produced, during the current build,
+        by a directive in document ``source``.
+        """
+        self._produced.setdefault(filename, set()).add(source)
+
+    def find_affected(self, paths: List[str]) -> List[str]:
+        """
+        Find the recorded stub files affected by changes to the files ``paths``,
+        i.e. the stub files rendered from any of the files or found in any of
+        the documents.
+        """
+        paths = set(paths)
+        return sorted(
+            filename
+            for filename, record in self.records.items()
+            if record["source"] in paths or not paths.isdisjoint(record["sources"])
+        )
+
+    def find_orphans(self) -> List[str]:
+        """
+        Find the recorded stub files no longer produced by any directive.  A
+        stub file is orphaned if...
+
+        * it was produced during the build, but only by orphaned stub files,
+        * it was not produced and the document it was found in was scanned, or
+        * it was not produced and the document it was found in no longer exists
+          or is itself orphaned.
+
+        Stub files found in documents that were not scanned during the build
+        (e.g. documents excluded by `autosummary_generate` or stub files that
+        did not change), or whose directives could not all be inspected (see
+        :meth:`note_uninspected`), are kept.
+        """
+        orphans = set()
+        changed = True
+        while changed:
+            changed = False
+            for filename, record in self.records.items():
+                if filename in orphans:
+                    continue
+
+                source = record["source"]
+                if source in self._uninspected:
+                    orphaned = False
+                elif filename in self._produced:
+                    orphaned = self._produced[filename] <= orphans
+                elif source in self._scanned:
+                    orphaned = True
+                else:
+                    orphaned = source in orphans or not os.path.exists(source)
+
+                if orphaned:
+                    orphans.add(filename)
+                    changed = True
+
+        return sorted(orphans)
+
+    @staticmethod
+    def _stat_matches(filename: str, record: Dict[str, Any]) -> bool:
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return False
+
+        return [stat.st_mtime_ns, stat.st_size] == record["stat"]
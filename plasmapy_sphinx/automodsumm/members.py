@@ -0,0 +1,255 @@
+"""
+This module contains functionality for enumerating the members of the classes
+documented by the stub files of the :rst:dir:`automodapi` and
+:rst:dir:`automodsumm` directives.  The
+`~plasmapy_sphinx.automodsumm.members.ClassMemberCache` is shared by all the
+class stub files of a stub file generation (see
+`~plasmapy_sphinx.automodsumm.generate.GenDocsFromAutomodsumm`), so members
+inherited along the MRO of the documented classes are classified, and passed
+through :event:`autodoc-skip-member`, only once (see configuration value
+:confval:`automodapi_class_member_cache`).
+"""
+__all__ = ["ClassMemberCache"]
+
+from packaging.version import Version
+from sphinx import __version__ as sphinx_version
+from sphinx.locale import __
+from sphinx.util import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from plasmapy_sphinx.automodsumm.metrics import StubGenMetrics
+
+if False:
+    # for annotation, does not need real import
+    from sphinx.application import Sphinx
+    from sphinx.ext.autosummary.generate import AutosummaryRenderer
+
+logger = logging.getLogger(__name__)
+
+
+def _get_class_members(obj: Any, qualname: str) -> Dict[str, Any]:
+    """
+    Enumerate the members of class ``obj`` as
+    :func:`sphinx.ext.autosummary.generate.generate_autosummary_content` does.
+    """
+    from sphinx.ext.autosummary import generate
+
+    if hasattr(generate, "_get_class_members"):
+        return generate._get_class_members(obj)
+
+    from sphinx.ext.autodoc import get_class_members
+    from sphinx.util.inspect import safe_getattr
+
+    members = get_class_members(obj, [qualname], safe_getattr)
+    return {name: member.object for name, member in members.items()}
+
+
+def _get_objtype(app: "Sphinx", obj: Any, parent: Any) -> str:
+    """
+    Get the autodoc object type best suited to document ``obj``, which belongs
+    to ``parent``.
+    """
+    if Version(sphinx_version) < Version("8.2"):
+        from sphinx.ext.autosummary import get_documenter
+
+        return get_documenter(app, obj, parent).objtype
+    elif Version(sphinx_version) < Version("9.0"):
+        from sphinx.ext.autosummary import _get_documenter
+
+        return _get_documenter(obj, parent, registry=app.registry).objtype
+
+    from sphinx.ext.autosummary import _get_documenter
+
+    return _get_documenter(obj, parent)
+
+
+class ClassMemberCache:
+    """
+    Cache of the class members enumerated for the class stub files of a stub
+    file generation.  The cache holds...
+
+    * the members of each documented class, keyed by the class (identity),
+    * the object type of each member, keyed by the member (identity) and the
+      object type of its class, so a member inherited by several documented
+      classes is only classified once, and
+    * the :event:`autodoc-skip-member` decision for each member, keyed by the
+      member (identity), its name and its object type, so the connected
+      handlers (e.g. the ``event_handler__autodoc_skip_member`` of
+      `~plasmapy_sphinx.automodsumm.generate.GenDocsFromAutomodsumm`) run once
+      per inherited member.
+
+    The cache assumes the object types and skip decisions only depend on the
+    arguments they are keyed by, and should be discarded once the documented
+    modules are re-imported.
+
+    Parameters
+    ----------
+    app : `~sphinx.application.Sphinx`
+        Instance of the Sphinx application.
+
+    metrics : `~plasmapy_sphinx.automodsumm.metrics.StubGenMetrics`
+        The metrics counting the cache hits and misses.
+    """
+
+    def __init__(self, app: "Sphinx", metrics: StubGenMetrics):
+        self.app = app
+        self.metrics = metrics
+        # the cached objects are stored along with their results, to keep the
+        # identities used as keys alive
+        self._members = {}  # type: Dict[Tuple[int, str], Tuple[Any, List[Tuple]]]
+        self._objtypes = {}  # type: Dict[Tuple[int, str], Tuple[Any, str]]
+        self._skips = {}  # type: Dict[Tuple[str, str, int], Tuple[Any, Any]]
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def get_members(self, obj: Any, qualname: str) -> List[Tuple[str, Any, str]]:
+        """
+        Get the ``(name, value, objtype)`` tuples of all members of class
+        ``obj`` (with qualified name ``qualname``).
+        """
+        key = (id(obj), qualname)
+        if key in self._members:
+            self.metrics.count("classes_cached")
+            return self._members[key][1]
+
+        self.metrics.count("classes_enumerated")
+        parent_objtype = self.get_objtype(obj, None)
+        members = [
+            (name, value, self._member_objtype(value, obj, parent_objtype))
+            for name, value in _get_class_members(obj, qualname).items()
+        ]
+        self._members[key] = (obj, members)
+        return members
+
+    def get_objtype(self, obj: Any, parent: Any) -> str:
+        """
+        Get the autodoc object type best suited to document ``obj``, which
+        belongs to ``parent``.  Not cached.
+        """
+        return _get_objtype(self.app, obj, parent)
+
+    def _member_objtype(self, value: Any, parent: Any, parent_objtype: str) -> str:
+        key = (id(value), parent_objtype)
+        if key in self._objtypes:
+            self.metrics.count("members_cached")
+            return self._objtypes[key][1]
+
+        self.metrics.count("members_classified")
+        objtype = self.get_objtype(value, parent)
+        self._objtypes[key] = (value, objtype)
+        return objtype
+
+    def skip_member(self, value: Any, name: str, objtype: str) -> Optional[bool]:
+        """
+        Emit :event:`autodoc-skip-member` for member ``name`` (with ``value``
+        and object type ``objtype``), unless the decision is cached.
+
+        .. note:: Adapted from :func:`sphinx.ext.autosummary.generate._skip_member`.
+        """
+        key = (objtype, name, id(value))
+        if key in self._skips:
+            self.metrics.count("skips_cached")
+            return self._skips[key][1]
+
+        self.metrics.count("skips_emitted")
+        try:
+            skipped = self.app.events.emit_firstresult(
+                "autodoc-skip-member", objtype, name, value, False, {}
+            )
+        except Exception as exc:
+            logger.warning(
+                __(
+                    "autosummary: failed to determine %r to be documented, "
+                    "the following exception was raised:\n%s"
+                ),
+                name,
+                exc,
+                type="autosummary",
+            )
+            return False
+
+        self._skips[key] = (value, skipped)
+        return skipped
+
+    def filter_members(
+        self,
+        obj: Any,
+        qualname: str,
+        types: Set[str],
+        include_public: Set[str] = frozenset(),
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Get the public and all names of the members of class ``obj`` with an
+        object type in ``types``.  Members named in ``include_public`` are
+        considered public, even if their name starts with an underscore.
+
+        .. note:: Adapted from :func:`sphinx.ext.autosummary.generate._get_members`.
+        """
+        items = []  # type: List[str]
+        public = []  # type: List[str]
+
+        for name, value, objtype in self.get_members(obj, qualname):
+            if objtype not in types:
+                continue
+
+            skipped = self.skip_member(value, name, objtype)
+            if skipped is True:
+                pass
+            elif skipped is False:
+                # show the member forcedly
+                items.append(name)
+                public.append(name)
+            else:
+                items.append(name)
+                if name in include_public or not name.startswith("_"):
+                    # considers member as public
+                    public.append(name)
+
+        return public, items
+
+    def generate_content(
+        self,
+        name: str,
+        obj: Any,
+        parent: Any,
+        template: "AutosummaryRenderer",
+        template_name: str,
+        context: Dict[str, Any],
+        modname: str,
+        qualname: str,
+    ) -> Optional[str]:
+        """
+        Render the stub file content of class ``obj`` from the cached members.
+        Returns `None` if ``obj`` is not documented as a class, in which case
+        the content is generated by
+        :func:`sphinx.ext.autosummary.generate.generate_autosummary_content`.
+
+        .. note:: Adapted from
+           :func:`sphinx.ext.autosummary.generate.generate_autosummary_content`.
+        """
+        objtype = self.get_objtype(obj, parent)
+        if objtype != "class":
+            return None
+
+        ns = {}  # type: Dict[str, Any]
+        ns.update(context)
+
+        ns["members"] = dir(obj)
+        ns["inherited_members"] = set(dir(obj)) - set(obj.__dict__.keys())
+        ns["methods"], ns["all_methods"] = self.filter_members(
+            obj, qualname, {"method"}, include_public={"__init__"}
+        )
+        ns["attributes"], ns["all_attributes"] = self.filter_members(
+            obj, qualname, {"attribute", "property"}
+        )
+
+        ns["fullname"] = name
+        ns["module"] = modname
+        ns["objname"] = qualname
+        ns["name"] = qualname
+
+        ns["objtype"] = objtype
+        ns["underline"] = len(name) * "="
+
+        return template.render(template_name or objtype, ns)
@@ -0,0 +1,210 @@
+"""
+This module contains functionality for measuring the phases of the stub file
+generation performed by
+`~plasmapy_sphinx.automodsumm.generate.GenDocsFromAutomodsumm`.  The gathered
+counters and timers are summarized in the build log and written as a JSON report
+to the output directory (see configuration value
+:confval:`automodapi_stub_metrics`).
+"""
+__all__ = ["StubGenMetrics"]
+
+import contextlib
+import json
+import os
+import time
+
+from typing import Any, Dict, Iterator, Union
+
+
+class StubGenMetrics:
+    """
+    Counters and timers for the phases of the stub file generation.
+
+    +--------------------+------------------------------------------------------+
+    | Counter            | Description                                          |
+    +====================+======================================================+
+    | files_scanned      | Source documents read and scanned for directives.    |
+    +--------------------+------------------------------------------------------+
+    | files_indexed      | Source documents served by the directive index.      |
+    +--------------------+------------------------------------------------------+
+    | files_in_memory    | Newly written stub files scanned from their rendered |
+    |                    | content, instead of being read back.                 |
+    +--------------------+------------------------------------------------------+
+    | directives_found   | :rst:dir:`automodapi` and :rst:dir:`automodsumm`     |
+    |                    | directives found in the source documents.            |
+    +--------------------+------------------------------------------------------+
+    | entries_found      | Stub file entries (with a ``:toctree:``) generated   |
+    |                    | from the directives.                                 |
+    +--------------------+------------------------------------------------------+
+    | modules_imported   | Modules imported during the stub file generation.    |
+    +--------------------+------------------------------------------------------+
+    | stubs_up_to_date   | Stub files skipped since the manifest found them     |
+    |                    | up-to-date.                                          |
+    +--------------------+------------------------------------------------------+
+    | stubs_rendered     | Stub files rendered.                                 |
+    +--------------------+------------------------------------------------------+
+    | stubs_written      | Stub files (re-)written to disk.                     |
+    +--------------------+------------------------------------------------------+
+    | stubs_unchanged    | Rendered stub files identical to the existing file.  |
+    +--------------------+------------------------------------------------------+
+    | stubs_kept         | Existing stub files not overwritten (see             |
+    |                    | `autosummary_generate_overwrite`).                   |
+    +--------------------+------------------------------------------------------+
+    | stubs_failed       | Stub files whose object could not be imported.       |
+    +--------------------+------------------------------------------------------+
+    | orphans_removed    | Orphaned stub files removed.                         |
+    +--------------------+------------------------------------------------------+
+    | recursion_depth    | Deepest level of newly written stub files scanned    |
+    |                    | for nested directives (``0`` if only the source      |
+    |                    | documents were scanned).                             |
+    +--------------------+------------------------------------------------------+
+    | classes_enumerated | Classes whose members were enumerated for class stub |
+    |                    | files.                                               |
+    +--------------------+------------------------------------------------------+
+    | classes_cached     | Classes whose members were served by the class       |
+    |                    | member cache (see                                    |
+    |                    | `plasmapy_sphinx.automodsumm.members`).              |
+    +--------------------+------------------------------------------------------+
+    | members_classified | Class members whose object type was determined.      |
+    +--------------------+------------------------------------------------------+
+    | members_cached     | Class members whose object type was served by the    |
+    |                    | class member cache (e.g. inherited members already   |
+    |                    | classified for another class).                       |
+    +--------------------+------------------------------------------------------+
+    | skips_emitted      | :event:`autodoc-skip-member` decisions emitted for   |
+    |                    | class members.                                       |
+    +--------------------+------------------------------------------------------+
+    | skips_cached       | :event:`autodoc-skip-member` decisions served by the |
+    |                    | class member cache.                                  |
+    +--------------------+------------------------------------------------------+
+
+    The timers (in seconds) are ``scan_seconds`` (reading and scanning the
+    source documents), ``collect_seconds`` (inspecting the modules named by
+    the directives), ``import_seconds`` (importing the documented objects),
+    ``render_seconds`` (rendering the stub files), ``write_seconds`` (comparing
+    and writing the stub files), and ``total_seconds``.  When the stub files
+    are rendered by multiple worker processes (see
+    :confval:`automodapi_stub_workers`), the import and render timers are
+    summed over the workers.
+    """
+
+    counters = (
+        "files_scanned",
+        "files_indexed",
+        "files_in_memory",
+        "directives_found",
+        "entries_found",
+        "modules_imported",
+        "stubs_up_to_date",
+        "stubs_rendered",
+        "stubs_written",
+        "stubs_unchanged",
+        "stubs_kept",
+        "stubs_failed",
+        "orphans_removed",
+        "recursion_depth",
+        "classes_enumerated",
+        "classes_cached",
+        "members_classified",
+        "members_cached",
+        "skips_emitted",
+        "skips_cached",
+    )
+    """Names of the counters."""
+
+    timers = (
+        "scan_seconds",
+        "collect_seconds",
+        "import_seconds",
+        "render_seconds",
+        "write_seconds",
+        "total_seconds",
+    )
+    """Names of the timers."""
+
+    def __init__(self):
+        self._values = {}  # type: Dict[str, Union[int, float]]
+        self._values.update(dict.fromkeys(self.counters, 0))
+        self._values.update(dict.fromkeys(self.timers, 0.0))
+
+    def __getitem__(self, name: str) -> Union[int, float]:
+        return self._values[name]
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Increment counter ``name`` by ``n``."""
+        self._values[name] += n
+
+    def maximum(self, name: str, value: int) -> None:
+        """Set counter ``name`` to ``value``, if ``value`` is larger."""
+        self._values[name] = max(self._values[name], value)
+
+    @contextlib.contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Context manager adding the time spent in its block to timer ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._values[name] += time.perf_counter() - start
+
+    def merge(self, other: Dict[str, Union[int, float]]) -> None:
+        """
+        Add the values of ``other`` (as returned by :meth:`as_dict`) to the
+        counters and timers, e.g. those gathered by a worker process.
+        """
+        for name, value in other.items():
+            if name == "recursion_depth":
+                self.maximum(name, value)
+            else:
+                self._values[name] += value
+
+    def as_dict(self) -> Dict[str, Union[int, float]]:
+        """Dictionary of all counters and timers."""
+        return dict(self._values)
+
+    def hit_rate(self, hits: str, misses: str) -> float:
+        """
+        Percentage of cache lookups served by the cache, given the names of the
+        ``hits`` and ``misses`` counters.
+        """
+        lookups = self._values[hits] + self._values[misses]
+        return 100.0 * self._values[hits] / lookups if lookups else 0.0
+
+    def summary(self) -> str:
+        """One line summary of the metrics for the build log."""
+        values = self._values
+        return (
+            f"scanned {values['files_scanned']} file(s) "
+            f"({values['files_indexed']} indexed, "
+            f"{values['files_in_memory']} in memory) with "
+            f"{values['directives_found']} directive(s), "
+            f"imported {values['modules_imported']} module(s), "
+            f"{values['entries_found']} stub file(s) "
+            f"({values['stubs_up_to_date']} up-to-date, "
+            f"{values['stubs_rendered']} rendered, "
+            f"{values['stubs_written']} written, "
+            f"{values['stubs_failed']} failed), "
+            f"recursion depth {values['recursion_depth']}, "
+            f"class member cache hits "
+            f"{self.hit_rate('classes_cached', 'classes_enumerated'):.0f}% classes, "
+            f"{self.hit_rate('members_cached', 'members_classified'):.0f}% members, "
+            f"{self.hit_rate('skips_cached', 'skips_emitted'):.0f}% skips; "
+            f"scan {values['scan_seconds']:.2f}s, "
+            f"collect {values['collect_seconds']:.2f}s, "
+            f"import {values['import_seconds']:.2f}s, "
+            f"render {values['render_seconds']:.2f}s, "
+            f"write {values['write_seconds']:.2f}s, "
+            f"total {values['total_seconds']:.2f}s"
+        )
+
+    def write(self, path: str, **extra: Any) -> None:
+        """
+        Write the metrics, and any ``extra`` items, as a JSON report to
+        ``path``.
+        """
+        report = dict(extra)
+        report["metrics"] = self.as_dict()
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
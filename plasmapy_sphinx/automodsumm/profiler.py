@@ -0,0 +1,401 @@
+"""
+This module contains functionality for profiling the imports `plasmapy_sphinx`
+performs to inspect and document modules (i.e. the
+`~importlib.import_module` calls of `~plasmapy_sphinx.utils.find_mod_objs` and
+the `~sphinx.ext.autosummary.import_by_name` calls of the stub file
+generation).  For each call, the profiler records the wall time, the memory
+allocated (as reported by `tracemalloc`), and the time spent importing each
+(third-party) package along the way.  A ranked report is written to the output
+directory at the end of the build.  (See configuration value
+:confval:`automodapi_import_profile`.)
+"""
+__all__ = [
+    "ImportProfiler",
+    "event_handler__build_finished",
+    "event_handler__builder_inited",
+    "event_handler__env_merge_info",
+    "profile_import",
+]
+
+import builtins
+import contextlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from sphinx.util import logging
+from typing import Any, ContextManager, Dict, Iterator, List, Set
+
+if False:
+    # for annotation, does not need real import
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+
+logger = logging.getLogger(__name__)
+
+
+class ImportProfiler:
+    """
+    Profiler of the imports performed by `plasmapy_sphinx`.  Imports are
+    profiled within :meth:`profile`, which records one call record...
+
+    * ``"kind"`` and ``"name"``: the kind of call (e.g. ``"import_module"``)
+      and the name of the imported module or object.
+    * ``"seconds"``: the wall time of the call.
+    * ``"modules_imported"``: the number of modules newly imported by the call.
+    * ``"memory_bytes"`` and ``"memory_peak_bytes"``: the memory allocated
+      (and still held) by the call, and the peak memory allocated during the
+      call.
+    * ``"packages"``: a dictionary mapping the top-level package of every
+      module imported by the call to ``[seconds, modules]``, where ``seconds``
+      is the time spent executing the package's modules (excluding the time
+      spent importing other packages from them).
+    * ``"error"``: the name of the exception raised by the call, if any.
+
+    Since `tracemalloc` slows down Python, the recorded times are inflated
+    compared to a build without the profiler, but their ranking holds.
+
+    Call records made in forked processes (i.e. the stub file workers or
+    parallel read workers) are sent back to the main process (see
+    :meth:`worker_calls` and :meth:`merge`).
+    """
+
+    def __init__(self):
+        self._calls = []  # type: List[Dict[str, Any]]
+        self._pid = os.getpid()
+
+        # profiled calls and __import__ frames in progress, each frame is a
+        # [child_seconds, child_modules, packages] list
+        self._call_frames = []  # type: List[List[Any]]
+        self._import_frames = []  # type: List[List[Any]]
+        self._original_import = None
+        self._stop_tracemalloc = False
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if os.getpid() == self._pid:
+            # the profile is build-scoped, do not persist it with the pickled
+            # build environment
+            state.update(_calls=[])
+        else:
+            # pickled by a read worker to send its environment to the main
+            # process
+            state.update(_calls=self.worker_calls())
+        state.update(_call_frames=[], _import_frames=[], _original_import=None)
+        return state
+
+    @property
+    def calls(self) -> List[Dict[str, Any]]:
+        """List of the recorded call records."""
+        return self._calls
+
+    def worker_calls(self) -> List[Dict[str, Any]]:
+        """Call records made by the current process, if it is a forked worker."""
+        pid = os.getpid()
+        if pid == self._pid:
+            return []
+        return [call for call in self._calls if call["pid"] == pid]
+
+    def merge(self, calls: List[Dict[str, Any]]) -> None:
+        """Add the call records ``calls`` (e.g. those of a worker process)."""
+        self._calls.extend(calls)
+
+    @contextlib.contextmanager
+    def profile(self, kind: str, name: str) -> Iterator[None]:
+        """
+        Context manager profiling the imports performed in its block as a call
+        of ``kind`` importing ``name``.
+        """
+        outermost = not self._call_frames
+        if outermost:
+            self._start()
+
+        frame = [0.0, 0, {}]
+        self._call_frames.append(frame)
+        n_modules = len(sys.modules)
+        memory, _ = tracemalloc.get_traced_memory()
+        error = None
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException as err:
+            error = type(err).__name__
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            memory_after, memory_peak = tracemalloc.get_traced_memory()
+            modules = len(sys.modules) - n_modules
+            self._call_frames.pop()
+
+            # the module executed by the call itself was not imported through
+            # __import__, attribute its time to the package of name
+            self._attribute(
+                frame[2], name.split(".")[0], seconds - frame[0], modules - frame[1]
+            )
+
+            if self._call_frames:
+                parent = self._call_frames[-1]
+                parent[0] += seconds
+                parent[1] += modules
+                for package, (pkg_seconds, pkg_modules) in frame[2].items():
+                    self._attribute(parent[2], package, pkg_seconds, pkg_modules)
+
+            self._calls.append(
+                {
+                    "kind": kind,
+                    "name": name,
+                    "seconds": seconds,
+                    "modules_imported": modules,
+                    "memory_bytes": memory_after - memory,
+                    "memory_peak_bytes": max(memory_peak - memory, 0),
+                    "packages": frame[2],
+                    "error": error,
+                    "pid": os.getpid(),
+                }
+            )
+
+            if outermost:
+                self._stop()
+
+    @staticmethod
+    def _attribute(
+        packages: Dict[str, List[Any]], package: str, seconds: float, modules: int
+    ) -> None:
+        if modules <= 0:
+            return
+
+        record = packages.setdefault(package, [0.0, 0])
+        record[0] += seconds
+        record[1] += modules
+
+    def _start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._stop_tracemalloc = True
+
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._import
+
+    def _stop(self) -> None:
+        builtins.__import__ = self._original_import
+        self._original_import = None
+
+        if self._stop_tracemalloc:
+            tracemalloc.stop()
+            self._stop_tracemalloc = False
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # stand-in for builtins.__import__ while profiling
+        n_modules = len(sys.modules)
+        frame = [0.0, 0]
+        self._import_frames.append(frame)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            seconds = time.perf_counter() - start
+            modules = len(sys.modules) - n_modules
+            self._import_frames.pop()
+
+            if self._import_frames:
+                self._import_frames[-1][0] += seconds
+                self._import_frames[-1][1] += modules
+
+            if modules > 0 and self._call_frames:
+                if level > 0 and globals is not None:
+                    package = globals.get("__package__") or globals.get("__name__")
+                else:
+                    package = name
+                call_frame = self._call_frames[-1]
+                self._attribute(
+                    call_frame[2],
+                    (package or "").split(".")[0],
+                    seconds - frame[0],
+                    modules - frame[1],
+                )
+                call_frame[0] += seconds - frame[0]
+                call_frame[1] += modules - frame[1]
+
+    def packages(self) -> List[Dict[str, Any]]:
+        """
+        The packages imported by all calls, ranked by the time spent
+        importing them.  Packages that are not the top-level package of a
+        profiled name are flagged as ``"third_party"``.
+        """
+        documented = {call["name"].split(".")[0] for call in self._calls}
+
+        totals = {}  # type: Dict[str, List[Any]]
+        for call in self._calls:
+            for package, (seconds, modules) in call["packages"].items():
+                self._attribute(totals, package, seconds, modules)
+
+        packages = [
+            {
+                "package": package,
+                "seconds": seconds,
+                "modules": modules,
+                "third_party": package not in documented,
+            }
+            for package, (seconds, modules) in totals.items()
+        ]
+        return sorted(packages, key=lambda item: (-item["seconds"], item["package"]))
+
+    def report(self) -> Dict[str, Any]:
+        """
+        The profile as a dictionary of the call records (``"calls"``, ranked by
+        their wall time) and the imported packages (``"packages"``, see
+        :meth:`packages`).
+        """
+        calls = sorted(self._calls, key=lambda item: (-item["seconds"], item["name"]))
+        return {
+            "seconds": sum(call["seconds"] for call in self._calls),
+            "modules_imported": sum(call["modules_imported"] for call in self._calls),
+            "calls": calls,
+            "packages": self.packages(),
+        }
+
+    def format_report(self, limit: int = 50) -> str:
+        """
+        The profile formatted as text, listing the ``limit`` slowest calls and
+        packages.
+        """
+        report = self.report()
+        lines = [
+            f"Import profile: {len(report['calls'])} call(s) imported "
+            f"{report['modules_imported']} module(s) in {report['seconds']:.3f}s",
+            "",
+            "Slowest calls",
+            "-------------",
+            f"{'seconds':>9}  {'modules':>7}  {'memory KiB':>10}  "
+            f"{'peak KiB':>10}  {'kind':<14}  name",
+        ]
+        for call in report["calls"][:limit]:
+            name = call["name"]
+            if call["error"] is not None:
+                name = f"{name} ({call['error']})"
+            lines.append(
+                f"{call['seconds']:9.3f}  {call['modules_imported']:7d}  "
+                f"{call['memory_bytes'] / 1024:10.1f}  "
+                f"{call['memory_peak_bytes'] / 1024:10.1f}  "
+                f"{call['kind']:<14}  {name}"
+            )
+
+        lines.extend(
+            [
+                "",
+                "Slowest packages",
+                "----------------",
+                f"{'seconds':>9}  {'modules':>7}  package",
+            ]
+        )
+        for package in report["packages"][:limit]:
+            third_party = " (third-party)" if package["third_party"] else ""
+            lines.append(
+                f"{package['seconds']:9.3f}  {package['modules']:7d}  "
+                f"{package['package']}{third_party}"
+            )
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str, **extra: Any) -> None:
+        """
+        Write the profile as a JSON report to ``path`` (along with any ``extra``
+        items) and as a text report to ``path`` with the ``.txt`` extension.
+        """
+        report = dict(extra)
+        report.update(self.report())
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+        with open(f"{os.path.splitext(path)[0]}.txt", "w", encoding="utf-8") as f:
+            f.write(self.format_report())
+
+
+def profile_import(app: "Sphinx", kind: str, name: str) -> ContextManager[None]:
+    """
+    Context manager profiling the imports performed in its block with the
+    build's `~plasmapy_sphinx.automodsumm.profiler.ImportProfiler`, if enabled
+    by :confval:`automodapi_import_profile`.
+
+    Parameters
+    ----------
+    app : `~sphinx.application.Sphinx`
+        Instance of the `Sphinx` application.
+
+    kind : str
+        The kind of import call (e.g. ``"import_module"``).
+
+    name : str
+        The name of the imported module or object.
+    """
+    env = getattr(app, "env", None)
+    profiler = getattr(env, "automodsumm_import_profiler", None)
+    if profiler is None:
+        return contextlib.nullcontext()
+
+    return profiler.profile(kind, name)
+
+
+def event_handler__builder_inited(app: "Sphinx") -> None:
+    """
+    Event handler for the Sphinx event :event:`builder-inited`.  This handler
+    attaches a new `~plasmapy_sphinx.automodsumm.profiler.ImportProfiler` to
+    the build environment, if enabled by :confval:`automodapi_import_profile`.
+    """
+    if app.config.automodapi_import_profile:
+        app.env.automodsumm_import_profiler = ImportProfiler()
+    else:
+        app.env.automodsumm_import_profiler = None
+
+
+def event_handler__env_merge_info(
+    app: "Sphinx",
+    env: "BuildEnvironment",
+    docnames: Set[str],
+    other: "BuildEnvironment",
+) -> None:
+    """
+    Event handler for the Sphinx event :event:`env-merge-info`.  This handler
+    merges the call records of a parallel read worker into the
+    `~plasmapy_sphinx.automodsumm.profiler.ImportProfiler` of the main process.
+    """
+    profiler = getattr(env, "automodsumm_import_profiler", None)
+    other_profiler = getattr(other, "automodsumm_import_profiler", None)
+    if profiler is None or other_profiler is None:
+        return
+
+    profiler.merge(other_profiler.calls)
+
+
+def event_handler__build_finished(app: "Sphinx", exception: Exception) -> None:
+    """
+    Event handler for the Sphinx event :event:`build-finished`.  This handler
+    writes the report of the
+    `~plasmapy_sphinx.automodsumm.profiler.ImportProfiler` to the output
+    directory, as ``automodsumm_import_profile.json`` and
+    ``automodsumm_import_profile.txt``.
+    """
+    profiler = getattr(app.env, "automodsumm_import_profiler", None)
+    if profiler is None:
+        return
+
+    from plasmapy_sphinx import __version__
+    from sphinx import __version__ as sphinx_version
+
+    path = os.path.join(app.outdir, "automodsumm_import_profile.json")
+    try:
+        profiler.write(path, plasmapy_sphinx=__version__, sphinx=sphinx_version)
+    except OSError as err:
+        logger.warning(f"[automodsumm] unable to write import profile: {err}")
+        return
+
+    report = profiler.report()
+    logger.info(
+        f"[automodsumm] import profile: {len(report['calls'])} call(s) imported "
+        f"{report['modules_imported']} module(s) in {report['seconds']:.2f}s, "
+        f"see {path}"
+    )
@@ -0,0 +1,368 @@
+"""
+This module contains the ``plasmapy-sphinx-server`` command line interface, a
+local build server that keeps a Sphinx application (and its interpreter) alive
+between builds.  Thus, the documented packages stay imported, the extensions
+stay set up, and the
+`~plasmapy_sphinx.automodsumm.generate.AutomodsummRenderer` Jinja environment
+and the module inventories stay warm, instead of being reloaded by every
+``sphinx-build`` run.
+
+.. code-block:: bash
+
+    $ plasmapy-sphinx-server serve docs docs/_build/html &
+    $ plasmapy-sphinx-server build     # after editing the package or docs
+    $ plasmapy-sphinx-server stop
+
+The server listens on a Unix socket (``--socket``, by default
+``plasmapy-sphinx-server.sock`` in the current directory) and runs a build on
+each request (see `~plasmapy_sphinx.automodsumm.server.BuildServer`).  Before
+each build, the modules whose sources changed since the previous build are
+re-imported and the affected stub files are regenerated, just like the watch
+mode of ``plasmapy-sphinx-autogen`` (see `plasmapy_sphinx.automodsumm.watch`).
+The build logs are written by the server; the client prints a summary of the
+build and exits with the build's status code.  Changes to ``conf.py`` require a
+restart of the server.
+"""
+__all__ = ["BuildServer", "main", "send_request"]
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import time
+
+from sphinx.application import Sphinx
+from sphinx.errors import SphinxError
+from sphinx.util import logging
+from typing import Any, Dict, List
+
+from plasmapy_sphinx.automodsumm import inventory
+from plasmapy_sphinx.automodsumm.watch import (
+    FileWatcher,
+    regenerate_stubs,
+    watched_paths,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET = "plasmapy-sphinx-server.sock"
+"""Default path of the build server's Unix socket."""
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handle a request, one line of JSON answered by one line of JSON."""
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            response = self.server.build_server.handle(request)
+        except (ValueError, AttributeError, TypeError) as err:
+            response = {"status": "error", "error": f"invalid request: {err}"}
+
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class BuildServer:
+    """
+    A build server running the builds of a Sphinx application on requests
+    received over a Unix socket.  The requests are JSON objects with a
+    ``"command"``, which is one of...
+
+    * ``"build"``: build the documentation (re-reading all documents if
+      ``"force_all"`` is `True`), after regenerating the stub files affected by
+      the files changed since the previous build,
+    * ``"status"``: report the state of the server, or
+    * ``"stop"``: stop the server.
+
+    Parameters
+    ----------
+    app : `~sphinx.application.Sphinx`
+        Instance of the Sphinx application, whose stub files were generated at
+        its initialization.
+
+    socket_path : str
+        Path of the Unix socket the server listens on.
+    """
+
+    def __init__(self, app: Sphinx, socket_path: str):
+        self.app = app
+        self.socket_path = os.path.abspath(socket_path)
+        self.builds = 0
+        self._running = False
+        self._conf_py = os.path.join(app.confdir, "conf.py")
+
+        self._watcher = FileWatcher()
+        self._watcher.watch(self._watched_paths())
+
+    def _watched_paths(self) -> List[str]:
+        paths = watched_paths(self.app)
+        paths.add(self._conf_py)
+        return sorted(paths)
+
+    def build(self, force_all: bool = False) -> Dict[str, Any]:
+        """
+        Run a build, after regenerating the stub files affected by the files
+        changed since the previous build.  Returns the summary of the build.
+        """
+        app = self.app
+        start = time.perf_counter()
+
+        changed = self._watcher.poll()
+        if self._conf_py in changed:
+            logger.warning(
+                "[automodsumm] conf.py changed, restart the build server to "
+                "apply the new configuration"
+            )
+            changed.remove(self._conf_py)
+
+        # the status code and warning count of the application are cumulative
+        app.statuscode = 0
+        warnings = getattr(app, "_warncount", 0)
+        stubs_updated = 0
+        try:
+            if changed:
+                gendocs = regenerate_stubs(app, changed)
+                stubs_updated = (
+                    gendocs.metrics["stubs_written"]
+                    + gendocs.metrics["orphans_removed"]
+                )
+
+            app.build(force_all=force_all)
+        except Exception as err:
+            # keep serving, the next build re-reads all documents
+            logger.warning(f"[automodsumm] build failed: {err}")
+            return {"status": "error", "error": str(err), "returncode": 2}
+        finally:
+            self.builds += 1
+            self._watcher.watch(self._watched_paths())
+
+        return {
+            "status": "ok",
+            "returncode": app.statuscode,
+            "changed": changed,
+            "stubs_updated": stubs_updated,
+            "warnings": getattr(app, "_warncount", 0) - warnings,
+            "seconds": round(time.perf_counter() - start, 3),
+        }
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle the (decoded) ``request`` and return the response."""
+        command = request.get("command", None)
+        if command == "build":
+            return self.build(force_all=bool(request.get("force_all", False)))
+        elif command == "status":
+            return {
+                "status": "ok",
+                "pid": os.getpid(),
+                "srcdir": str(self.app.srcdir),
+                "outdir": str(self.app.outdir),
+                "builder": self.app.builder.name,
+                "builds": self.builds,
+            }
+        elif command == "stop":
+            self._running = False
+            return {"status": "ok"}
+
+        return {"status": "error", "error": f"unknown command {command!r}"}
+
+    def _remove_stale_socket(self) -> None:
+        """Remove the socket file of a server that is no longer running."""
+        if not os.path.exists(self.socket_path):
+            return
+
+        try:
+            send_request(self.socket_path, "status")
+        except OSError:
+            os.remove(self.socket_path)
+        else:
+            raise RuntimeError(f"a build server is running on {self.socket_path}")
+
+    def serve(self) -> None:
+        """Serve the requests, one at a time, until a ``"stop"`` request."""
+        self._remove_stale_socket()
+
+        server = socketserver.UnixStreamServer(self.socket_path, _RequestHandler)
+        server.build_server = self
+        self._running = True
+        logger.info(f"[automodsumm] build server listening on {self.socket_path}")
+        try:
+            while self._running:
+                server.handle_request()
+        finally:
+            server.server_close()
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+            inventory.event_handler__build_finished(self.app, None)
+
+
+def send_request(socket_path: str, command: str, **params: Any) -> Dict[str, Any]:
+    """
+    Send ``command`` (with the parameters ``params``) to the build server
+    listening on ``socket_path``, and return its response.  Raises `OSError` if
+    no server is listening.
+    """
+    request = dict(params, command=command)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Create the argument parser of ``plasmapy-sphinx-server``."""
+    parser = argparse.ArgumentParser(
+        prog="plasmapy-sphinx-server",
+        description=(
+            "Run Sphinx builds from a long-lived local server, keeping the "
+            "documented packages imported between builds."
+        ),
+    )
+    parser.add_argument(
+        "--socket",
+        default=DEFAULT_SOCKET,
+        metavar="PATH",
+        help=f"Unix socket of the build server (default: {DEFAULT_SOCKET})",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve = subparsers.add_parser("serve", help="start the build server")
+    serve.add_argument("sourcedir", help="path to the documentation source files")
+    serve.add_argument("outputdir", help="path to the output directory")
+    serve.add_argument(
+        "-b", dest="builder", default="html", help="builder to use (default: html)"
+    )
+    serve.add_argument(
+        "-c",
+        dest="confdir",
+        default=None,
+        help="directory containing conf.py (default: sourcedir)",
+    )
+    serve.add_argument(
+        "-d",
+        dest="doctreedir",
+        default=None,
+        help="directory for the cached environment (default: outputdir/.doctrees)",
+    )
+    serve.add_argument(
+        "-D",
+        dest="define",
+        action="append",
+        default=[],
+        metavar="setting=value",
+        help="override a setting in conf.py",
+    )
+    serve.add_argument(
+        "-j",
+        dest="jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="number of parallel processes reading and writing documents",
+    )
+    serve.add_argument(
+        "-v",
+        dest="verbosity",
+        action="count",
+        default=0,
+        help="increase verbosity (can be repeated)",
+    )
+    serve.add_argument(
+        "-q", "--quiet", action="store_true", help="only print warnings and errors"
+    )
+
+    build = subparsers.add_parser("build", help="request a build")
+    build.add_argument(
+        "-a", dest="force_all", action="store_true", help="write all files"
+    )
+    subparsers.add_parser("status", help="report the state of the build server")
+    subparsers.add_parser("stop", help="stop the build server")
+
+    return parser
+
+
+def _serve(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    """Start the build server of ``plasmapy-sphinx-server serve``."""
+    if not hasattr(socket, "AF_UNIX"):
+        parser.error("Unix sockets are not supported on this platform")
+
+    srcdir = os.path.abspath(args.sourcedir)
+    outdir = os.path.abspath(args.outputdir)
+    confdir = srcdir if args.confdir is None else os.path.abspath(args.confdir)
+    if args.doctreedir is None:
+        doctreedir = os.path.join(outdir, ".doctrees")
+    else:
+        doctreedir = os.path.abspath(args.doctreedir)
+
+    overrides = {}  # type: Dict[str, Any]
+    for define in args.define:
+        name, sep, value = define.partition("=")
+        if not sep:
+            parser.error(f"-D option argument must be in the form name=value: {define}")
+        overrides[name] = value
+
+    try:
+        app = Sphinx(
+            srcdir,
+            confdir,
+            outdir,
+            doctreedir,
+            args.builder,
+            confoverrides=overrides,
+            status=None if args.quiet else sys.stdout,
+            warning=sys.stderr,
+            verbosity=args.verbosity,
+            parallel=args.jobs,
+        )
+        BuildServer(app, args.socket).serve()
+    except (SphinxError, RuntimeError) as err:
+        print(f"plasmapy-sphinx-server: error: {err}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Entry point of ``plasmapy-sphinx-server``.  For the ``build`` command, the
+    exit status is the status code of the build.
+    """
+    parser = get_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        return _serve(args, parser)
+
+    params = {"force_all": args.force_all} if args.command == "build" else {}
+    try:
+        response = send_request(args.socket, args.command, **params)
+    except OSError as err:
+        print(
+            f"plasmapy-sphinx-server: error: no build server on {args.socket}: {err}",
+            file=sys.stderr,
+        )
+        return 2
+
+    if response["status"] != "ok":
+        print(f"plasmapy-sphinx-server: error: {response['error']}", file=sys.stderr)
+        return response.get("returncode", 2)
+
+    if args.command == "build":
+        print(
+            f"build finished in {response['seconds']:.2f} s with "
+            f"{response['warnings']} warning(s), {len(response['changed'])} changed "
+            f"path(s), {response['stubs_updated']} stub file(s) updated"
+        )
+        return response["returncode"]
+    elif args.command == "status":
+        print(json.dumps(response, indent=2))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,776 @@
+"""
+This module contains the static (import free) inventory engine used when the
+configuration value :confval:`automodapi_inventory_engine` is set to
+``"static"``.
+
+The engine parses the module source with `ast` and reconstructs the module
+namespace from the ``__all__`` dunder, the custom group dunders (see
+:confval:`automodapi_custom_groups`), the top-level definitions, and the
+re-exporting imports.  The reconstructed namespace is then grouped with
+`~plasmapy_sphinx.utils.group_mod_objs`, so the inventory matches that of
+`~plasmapy_sphinx.utils.find_mod_objs`.  Only names that can not be resolved
+statically cause the module to be imported, and only those names are taken
+from the imported module.
+
+The static analysis assumes:
+
+* Decorated functions and classes remain functions and classes.
+* Names imported from 3rd party modules that are not already imported, and not
+  listed in ``__all__``, are 3rd party objects and, thus, excluded.
+* A package's direct sub-modules are only bound to the package namespace when
+  they are imported (directly or indirectly) by the package itself.
+"""
+__all__ = ["inspect_module_static"]
+
+import ast
+import builtins
+import os
+import sys
+import types
+
+from functools import lru_cache
+from importlib import import_module
+from importlib.machinery import ModuleSpec
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from plasmapy_sphinx.utils import group_mod_objs, ModuleInventory
+
+if False:
+    # for annotation, does not need real import
+    from sphinx.application import Sphinx
+
+_UNRESOLVED = object()
+"""Sentinel for a name that can not be resolved statically."""
+
+
+class _ExternalObject:
+    """
+    Stand-in for an object imported from a 3rd party module that is not
+    imported (and, thus, not analyzed).
+    """
+
+    def __init__(self, modname: str, name: str):
+        self.__module__ = modname
+        self.__name__ = name
+
+
+class _ParsedModule(NamedTuple):
+    """The statically extracted namespace information of a module."""
+
+    modname: str
+    path: str
+    is_pkg: bool
+    bindings: Dict[str, Tuple]
+    """
+    Top-level names mapped to how they are bound, one of ``("def",)``,
+    ``("class", bases)``, ``("value", node)``, ``("module", modname)``,
+    ``("from", modname, attr)``, or ``("unknown",)``.
+    """
+    dunders: Dict[str, Optional[List[Tuple]]]
+    """
+    Top-level dunders (e.g. ``__all__``) mapped to a list of parts, which are
+    either ``("names", [...])`` or ``("ref", name, dunder)``.  `None` indicates
+    a dunder that can not be statically determined.
+    """
+    stars: List[str]
+    """Names of the modules star-imported (``from x import *``)."""
+    imports: Set[str]
+    """Names of all the modules imported at the top-level of the module."""
+
+
+def find_spec(modname: str) -> Optional[ModuleSpec]:
+    """
+    Find the `~importlib.machinery.ModuleSpec` of module ``modname`` without
+    importing the module or any of its parent packages.
+    """
+    mod = sys.modules.get(modname, None)
+    if getattr(mod, "__spec__", None) is not None:
+        return mod.__spec__
+
+    parts = modname.split(".")
+    path = None
+    spec = None
+    for ii in range(len(parts)):
+        name = ".".join(parts[: ii + 1])
+        parent = sys.modules.get(name, None)
+        if getattr(parent, "__spec__", None) is not None:
+            spec = parent.__spec__
+        else:
+            spec = None
+            for finder in sys.meta_path:
+                try:
+                    spec = finder.find_spec(name, path)
+                except (AttributeError, ImportError, ValueError):
+                    continue
+                if spec is not None:
+                    break
+
+        if spec is None:
+            return None
+
+        path = spec.submodule_search_locations
+        if path is None and ii < len(parts) - 1:
+            return None
+
+    return spec
+
+
+def _source_path(spec: Optional[ModuleSpec]) -> Optional[str]:
+    """Path to the Python source file associated with ``spec``, if any."""
+    if spec is None or not isinstance(spec.origin, str):
+        return None
+    elif not spec.origin.endswith(".py") or not os.path.isfile(spec.origin):
+        return None
+
+    return os.path.abspath(spec.origin)
+
+
+def _resolve_relative(modname: str, is_pkg: bool, module: str, level: int) -> str:
+    """Resolve the (possibly) relative import ``module`` found in ``modname``."""
+    if level == 0:
+        return module
+
+    base = modname if is_pkg else modname.rpartition(".")[0]
+    for _ in range(level - 1):
+        base = base.rpartition(".")[0]
+
+    return f"{base}.{module}" if module else base
+
+
+def _dunder_parts(node: ast.AST) -> Optional[List[Tuple]]:
+    """
+    Convert the value ``node`` of a dunder assignment into a list of parts.
+    Returns `None` if the value can not be statically determined.
+    """
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left = _dunder_parts(node.left)
+        right = _dunder_parts(node.right)
+        return None if left is None or right is None else left + right
+    elif (
+        isinstance(node, ast.Attribute)
+        and isinstance(node.value, ast.Name)
+        and node.attr.startswith("__")
+    ):
+        return [("ref", node.value.id, node.attr)]
+
+    try:
+        value = ast.literal_eval(node)
+    except ValueError:
+        return None
+
+    if not isinstance(value, (list, tuple, set)) or not all(
+        isinstance(name, str) for name in value
+    ):
+        return None
+
+    return [("names", list(value))]
+
+
+def _is_type_checking(node: ast.If) -> bool:
+    """Is ``node`` an ``if TYPE_CHECKING:`` (or ``if False:``) block."""
+    test = node.test
+    if isinstance(test, ast.Name):
+        return test.id == "TYPE_CHECKING"
+    elif isinstance(test, ast.Attribute):
+        return test.attr == "TYPE_CHECKING"
+    elif isinstance(test, ast.Constant):
+        return test.value is False
+
+    return False
+
+
+class _ModuleParser:
+    """Extract the `_ParsedModule` information from a module's `ast`."""
+
+    def __init__(self, modname: str, path: str, is_pkg: bool):
+        self.modname = modname
+        self.path = path
+        self.is_pkg = is_pkg
+        self.bindings = {}  # type: Dict[str, Tuple]
+        self.dunders = {}  # type: Dict[str, Optional[List[Tuple]]]
+        self.stars = []  # type: List[str]
+        self.imports = set()  # type: Set[str]
+
+    def parse(self, tree: ast.Module) -> _ParsedModule:
+        for node in tree.body:
+            self.visit(node, nested=False)
+
+        return _ParsedModule(
+            modname=self.modname,
+            path=self.path,
+            is_pkg=self.is_pkg,
+            bindings=self.bindings,
+            dunders=self.dunders,
+            stars=self.stars,
+            imports=self.imports,
+        )
+
+    def bind(self, name: str, binding: Tuple, nested: bool) -> None:
+        self.dunders.pop(name, None)
+        self.bindings[name] = ("unknown",) if nested else binding
+
+    def visit(self, node: ast.AST, nested: bool) -> None:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            self.bind(node.name, ("def",), nested)
+        elif isinstance(node, ast.ClassDef):
+            self.bind(node.name, ("class", node.bases), nested)
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                self.imports.update(self._with_parents(alias.name))
+                if alias.asname is None:
+                    name = alias.name.split(".")[0]
+                    self.bind(name, ("module", name), nested)
+                else:
+                    self.bind(alias.asname, ("module", alias.name), nested)
+        elif isinstance(node, ast.ImportFrom):
+            module = _resolve_relative(
+                self.modname, self.is_pkg, node.module or "", node.level
+            )
+            self.imports.update(self._with_parents(module))
+            for alias in node.names:
+                if alias.name == "*":
+                    if nested:
+                        self.stars.append(None)
+                    else:
+                        self.stars.append(module)
+                    continue
+
+                # the attribute may be a sub-module imported by the statement
+                self.imports.add(f"{module}.{alias.name}")
+                self.bind(
+                    alias.asname or alias.name, ("from", module, alias.name), nested
+                )
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                self.visit_target(target, node.value, nested)
+        elif isinstance(node, ast.AnnAssign):
+            if node.value is not None:
+                self.visit_target(node.target, node.value, nested)
+        elif isinstance(node, ast.AugAssign):
+            self.visit_augment(node.target, node.value, nested)
+        elif isinstance(node, ast.Expr) and isinstance(node.value, ast.Call):
+            self.visit_call(node.value, nested)
+        elif isinstance(node, ast.Delete):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    self.bindings.pop(target.id, None)
+                    self.dunders.pop(target.id, None)
+        elif isinstance(node, ast.If) and _is_type_checking(node):
+            for child in node.orelse:
+                self.visit(child, nested=True)
+        elif isinstance(
+            node,
+            (ast.If, ast.Try, ast.For, ast.AsyncFor, ast.While, ast.With, ast.AsyncWith),
+        ):
+            for field in ("body", "orelse", "finalbody", "handlers"):
+                for child in getattr(node, field, []):
+                    if isinstance(child, ast.ExceptHandler):
+                        for grandchild in child.body:
+                            self.visit(grandchild, nested=True)
+                    else:
+                        self.visit(child, nested=True)
+
+            if isinstance(node, (ast.For, ast.AsyncFor)):
+                self.visit_target(node.target, None, nested=True)
+
+    def visit_target(
+        self, target: ast.AST, value: Optional[ast.AST], nested: bool
+    ) -> None:
+        if isinstance(target, ast.Name):
+            name = target.id
+            if name.startswith("__") and name.endswith("__"):
+                self.bindings.pop(name, None)
+                self.dunders[name] = (
+                    None if nested or value is None else _dunder_parts(value)
+                )
+            elif value is None:
+                self.bind(name, ("unknown",), nested=True)
+            else:
+                self.bind(name, ("value", value), nested)
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            for element in target.elts:
+                self.visit_target(element, None, nested=True)
+        elif isinstance(target, ast.Starred):
+            self.visit_target(target.value, None, nested=True)
+
+    def visit_augment(self, target: ast.AST, value: ast.AST, nested: bool) -> None:
+        if not isinstance(target, ast.Name):
+            return
+
+        name = target.id
+        if name in self.dunders:
+            parts = _dunder_parts(value)
+            if nested or parts is None or self.dunders[name] is None:
+                self.dunders[name] = None
+            else:
+                self.dunders[name] = self.dunders[name] + parts
+        elif name in self.bindings:
+            self.bindings[name] = ("unknown",)
+
+    def visit_call(self, node: ast.Call, nested: bool) -> None:
+        # look for __all__.extend([...]) and __all__.append("...")
+        func = node.func
+        if not (
+            isinstance(func, ast.Attribute)
+            and isinstance(func.value, ast.Name)
+            and func.value.id in self.dunders
+        ):
+            return
+
+        name = func.value.id
+        parts = None
+        if func.attr == "extend" and len(node.args) == 1:
+            parts = _dunder_parts(node.args[0])
+        elif func.attr == "append" and len(node.args) == 1:
+            arg = node.args[0]
+            if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                parts = [("names", [arg.value])]
+
+        if nested or parts is None or self.dunders[name] is None:
+            self.dunders[name] = None
+        else:
+            self.dunders[name] = self.dunders[name] + parts
+
+    @staticmethod
+    def _with_parents(modname: str) -> Set[str]:
+        parts = modname.split(".")
+        return {".".join(parts[: ii + 1]) for ii in range(len(parts))}
+
+
+@lru_cache(maxsize=2048)
+def _parse_file(
+    modname: str, path: str, is_pkg: bool, mtime_ns: int, size: int
+) -> Optional[_ParsedModule]:
+    # mtime_ns and size are only used to invalidate the lru_cache
+    try:
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+    return _ModuleParser(modname, path, is_pkg).parse(tree)
+
+
+class StaticAnalyzer:
+    """
+    Statically resolve the namespace of a module (and the modules it imports)
+    into stand-in objects suitable for `~plasmapy_sphinx.utils.group_mod_objs`.
+    """
+
+    def __init__(self, pkg_name: str):
+        self._pkg_name = pkg_name
+        self._parsed = {}  # type: Dict[str, Optional[_ParsedModule]]
+        self._resolving = set()  # type: Set[Tuple[str, str]]
+        self._modules = {}  # type: Dict[str, types.ModuleType]
+
+    @property
+    def sources(self) -> List[str]:
+        """Source files of the analyzed package parsed during the analysis."""
+        return sorted(
+            parsed.path
+            for modname, parsed in self._parsed.items()
+            if parsed is not None and modname.split(".")[0] == self._pkg_name
+        )
+
+    def parse(self, modname: str) -> Optional[_ParsedModule]:
+        """Statically parse module ``modname``, `None` if not possible."""
+        if modname in self._parsed:
+            return self._parsed[modname]
+
+        spec = find_spec(modname)
+        path = _source_path(spec)
+        if path is None:
+            parsed = None
+        else:
+            stat = os.stat(path)
+            parsed = _parse_file(
+                modname,
+                path,
+                spec.submodule_search_locations is not None,
+                stat.st_mtime_ns,
+                stat.st_size,
+            )
+
+        self._parsed[modname] = parsed
+        return parsed
+
+    def module(self, modname: str) -> Any:
+        """A stand-in for module ``modname``, or `_UNRESOLVED`."""
+        if modname in sys.modules:
+            return sys.modules[modname]
+        elif modname in self._modules:
+            return self._modules[modname]
+
+        spec = find_spec(modname)
+        if spec is None:
+            return _UNRESOLVED
+
+        mod = types.ModuleType(modname)
+        if spec.submodule_search_locations is not None:
+            mod.__package__ = modname
+        else:
+            mod.__package__ = modname.rpartition(".")[0]
+
+        self._modules[modname] = mod
+        return mod
+
+    def dunder(self, modname: str, dunder: str) -> Any:
+        """
+        The list of names assigned to ``dunder`` in ``modname``.  Returns `None`
+        if the dunder is not defined, or `_UNRESOLVED` if it can not be
+        statically determined.
+        """
+        parsed = self.parse(modname)
+        if parsed is None:
+            return _UNRESOLVED
+        elif dunder not in parsed.dunders:
+            return None
+        elif parsed.dunders[dunder] is None:
+            return _UNRESOLVED
+
+        names = []
+        for part in parsed.dunders[dunder]:
+            if part[0] == "names":
+                names.extend(part[1])
+                continue
+
+            _, name, ref_dunder = part
+            binding = parsed.bindings.get(name, ("unknown",))
+            if binding[0] == "module":
+                ref_modname = binding[1]
+            elif binding[0] == "from":
+                ref_modname = f"{binding[1]}.{binding[2]}"
+            else:
+                return _UNRESOLVED
+
+            ref_names = self.dunder(ref_modname, ref_dunder)
+            if ref_names is None or ref_names is _UNRESOLVED:
+                return _UNRESOLVED
+            names.extend(ref_names)
+
+        return names
+
+    def public_names(self, modname: str) -> Any:
+        """
+        The names a star import (``from modname import *``) binds, or
+        `_UNRESOLVED` if they can not be statically determined.
+        """
+        names = self.dunder(modname, "__all__")
+        if names is not None:
+            return names
+
+        parsed = self.parse(modname)
+        names = [name for name in parsed.bindings if not name.startswith("_")]
+        for star in parsed.stars:
+            star_names = _UNRESOLVED if star is None else self.public_names(star)
+            if star_names is _UNRESOLVED:
+                return _UNRESOLVED
+            names.extend(star_names)
+
+        return names
+
+    def namespace(self, modname: str) -> Any:
+        """
+        The names bound in module ``modname`` mapped to their statically
+        resolved stand-ins (or `_UNRESOLVED`).  Returns `_UNRESOLVED` if the
+        namespace can not be determined.
+        """
+        parsed = self.parse(modname)
+        if parsed is None:
+            return _UNRESOLVED
+
+        ns = {}
+
+        # sub-modules imported while importing modname get bound to modname
+        if parsed.is_pkg:
+            prefix = f"{modname}."
+            for imported in sorted(self._imported_modules(modname)):
+                if not imported.startswith(prefix):
+                    continue
+
+                child = imported[len(prefix) :].split(".")[0]
+                child_modname = f"{prefix}{child}"
+                if self.module(child_modname) is not _UNRESOLVED:
+                    ns[child] = self.module(child_modname)
+
+        for star in parsed.stars:
+            star_names = _UNRESOLVED if star is None else self.public_names(star)
+            if star_names is _UNRESOLVED:
+                return _UNRESOLVED
+
+            for name in star_names:
+                ns[name] = self.resolve_from(star, name)
+
+        for name in parsed.bindings:
+            ns[name] = self.resolve(modname, name)
+
+        return ns
+
+    def _imported_modules(self, modname: str) -> Set[str]:
+        """All modules imported, directly or indirectly, by importing ``modname``."""
+        pkg_name = modname.split(".")[0]
+        imported = set()
+        to_visit = [modname]
+        while to_visit:
+            name = to_visit.pop()
+            if name in imported:
+                continue
+            imported.add(name)
+
+            parsed = self.parse(name)
+            if parsed is None:
+                continue
+
+            for child in parsed.imports:
+                if child.split(".")[0] == pkg_name and child not in imported:
+                    to_visit.append(child)
+
+        # only keep the names that are real modules
+        return {name for name in imported if find_spec(name) is not None}
+
+    def resolve(self, modname: str, name: str) -> Any:
+        """
+        Resolve ``name`` bound in module ``modname`` to a stand-in object, or
+        `_UNRESOLVED`.
+        """
+        key = (modname, name)
+        if key in self._resolving:
+            return _UNRESOLVED
+
+        self._resolving.add(key)
+        try:
+            return self._resolve(modname, name)
+        finally:
+            self._resolving.discard(key)
+
+    def _resolve(self, modname: str, name: str) -> Any:
+        parsed = self.parse(modname)
+        if parsed is None:
+            return _UNRESOLVED
+
+        binding = parsed.bindings.get(name, None)
+        if binding is None:
+            for star in reversed(parsed.stars):
+                if star is None:
+                    return _UNRESOLVED
+
+                star_names = self.public_names(star)
+                if star_names is _UNRESOLVED:
+                    return _UNRESOLVED
+                elif name in star_names:
+                    return self.resolve_from(star, name)
+
+            return getattr(builtins, name, _UNRESOLVED)
+
+        kind = binding[0]
+        if kind == "def":
+            return _stand_in_function(name, modname)
+        elif kind == "class":
+            return self._resolve_class(modname, name, binding[1])
+        elif kind == "module":
+            return self.module(binding[1])
+        elif kind == "from":
+            return self.resolve_from(binding[1], binding[2])
+        elif kind == "value":
+            return self._resolve_value(modname, binding[1])
+
+        return _UNRESOLVED
+
+    def resolve_from(self, modname: str, name: str) -> Any:
+        """Resolve ``from modname import name`` to a stand-in or `_UNRESOLVED`."""
+        mod = sys.modules.get(modname, None)
+        if mod is not None and name in mod.__dict__:
+            return mod.__dict__[name]
+        elif mod is None and modname.split(".")[0] != self._pkg_name:
+            # do not analyze 3rd party packages
+            return _ExternalObject(modname, name)
+
+        parsed = self.parse(modname)
+        if parsed is not None and name in parsed.bindings:
+            resolved = self.resolve(modname, name)
+            if resolved is not _UNRESOLVED:
+                return resolved
+
+        # the name may be a sub-module
+        submodule = self.module(f"{modname}.{name}")
+        if submodule is not _UNRESOLVED:
+            return submodule
+        elif parsed is not None:
+            return self.resolve(modname, name)
+
+        return _UNRESOLVED
+
+    def _resolve_expr(self, modname: str, node: ast.AST) -> Any:
+        """Resolve a name or attribute expression found in ``modname``."""
+        if isinstance(node, ast.Name):
+            return self.resolve(modname, node.id)
+        elif isinstance(node, ast.Attribute):
+            parent = self._resolve_expr(modname, node.value)
+            if isinstance(parent, types.ModuleType):
+                return self.resolve_from(parent.__name__, node.attr)
+
+        return _UNRESOLVED
+
+    def _resolve_class(self, modname: str, name: str, bases: List[ast.AST]) -> Any:
+        base = object
+        for node in bases:
+            if isinstance(node, ast.Subscript):
+                # generics like Generic[T]
+                node = node.value
+
+            resolved = self._resolve_expr(modname, node)
+            if resolved is _UNRESOLVED or not isinstance(resolved, type):
+                return _UNRESOLVED
+            elif issubclass(resolved, Warning):
+                base = Warning
+            elif issubclass(resolved, BaseException) and base is object:
+                base = BaseException
+
+        return _stand_in_class(name, modname, base)
+
+    def _resolve_value(self, modname: str, node: ast.AST) -> Any:
+        try:
+            return ast.literal_eval(node)
+        except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+            pass
+
+        if isinstance(node, ast.Subscript):
+            # aliases of 3rd party generics, like List[int], keep the 3rd
+            # party __module__
+            base = self._resolve_expr(modname, node.value)
+            base_modname = getattr(base, "__module__", None)
+            if (
+                isinstance(base_modname, str)
+                and base_modname.split(".")[0] != self._pkg_name
+            ):
+                return _ExternalObject(base_modname, "")
+
+            return _UNRESOLVED
+
+        return self._resolve_expr(modname, node)
+
+
+def _stand_in_function(name: str, modname: str) -> types.FunctionType:
+    """Create a function standing in for function ``name`` of ``modname``."""
+
+    def func():  # coverage: ignore
+        pass
+
+    func.__name__ = name
+    func.__qualname__ = name
+    func.__module__ = modname
+    return func
+
+
+def _stand_in_class(name: str, modname: str, base: type) -> type:
+    """Create a class standing in for class ``name`` of ``modname``."""
+    return type(name, (base,), {"__module__": modname, "__qualname__": name})
+
+
+def inspect_module_static(
+    modname: str, app: "Sphinx" = None, custom_groups: Dict[str, Any] = None
+) -> Optional[Tuple[ModuleInventory, str, List[str]]]:
+    """
+    Statically inspect the module ``modname`` and group its objects like
+    `~plasmapy_sphinx.utils.find_mod_objs`.
+
+    Parameters
+    ----------
+    modname : str
+        Name of the module (e.g. ``"plasmapy_sphinx.utils"``) to be inspected.
+
+    app : `~sphinx.application.Sphinx`
+        Instance of the `Sphinx` application.
+
+    custom_groups : Dict[str, Any], optional
+        The custom groups to sort the objects into (see
+        :confval:`automodapi_custom_groups`).  If not given, the custom groups
+        are taken from ``app``.
+
+    Returns
+    -------
+    Optional[Tuple[ModuleInventory, str, List[str]]]
+        A tuple of the grouped objects (where the object instances are
+        stand-ins for statically resolved objects), ``"pkg"`` or ``"module"``,
+        and the source files analyzed.  `None` is returned if the module can
+        not be statically analyzed at all (e.g. an extension module or a
+        dynamically defined ``__all__``), in which case the module needs to be
+        imported.
+    """
+    from plasmapy_sphinx.utils import get_custom_grouping_info
+
+    if custom_groups is not None:
+        cgroups_def = custom_groups
+    elif app is None:
+        cgroups_def = {}
+    else:
+        cgroups_def = get_custom_grouping_info(app)
+
+    analyzer = StaticAnalyzer(modname.split(".")[0])
+    parsed = analyzer.parse(modname)
+    if parsed is None or "__getattr__" in parsed.bindings:
+        # a module __getattr__ makes the namespace dynamic
+        return None
+
+    ns = analyzer.namespace(modname)
+    if ns is _UNRESOLVED:
+        return None
+
+    dunders = {}
+    for dunder in ["__all__"] + [info["dunder"] for info in cgroups_def.values()]:
+        names = analyzer.dunder(modname, dunder)
+        if names is _UNRESOLVED:
+            return None
+        elif names is not None:
+            dunders[dunder] = names
+
+    # determine the names that need to be resolved for the grouping
+    if "__all__" in dunders:
+        required = set(dunders["__all__"])
+        # any un-listed name that might be a module is needed to find the
+        # sub-modules
+        required.update(
+            name
+            for name, binding in parsed.bindings.items()
+            if not name.startswith("_") and binding[0] in ("from", "unknown")
+        )
+    else:
+        required = {name for name in ns if not name.startswith("_")}
+
+    unresolved = {
+        name for name in required if ns.get(name, _UNRESOLVED) is _UNRESOLVED
+    }
+    if "__all__" in dunders:
+        # the group of a listed 3rd party object depends on the real object
+        unresolved.update(
+            name
+            for name in dunders["__all__"]
+            if isinstance(ns.get(name, None), _ExternalObject)
+        )
+    if unresolved:
+        # fall back to a real import, but only for the unresolved names
+        from plasmapy_sphinx.automodsumm.profiler import profile_import
+
+        with profile_import(app, "import_module", modname):
+            mod = import_module(modname)
+        for name in unresolved:
+            if hasattr(mod, name):
+                ns[name] = getattr(mod, name)
+            else:
+                ns.pop(name, None)
+
+    for name, obj in list(ns.items()):
+        if obj is _UNRESOLVED or name.startswith("__"):
+            # dunders (like a module __getattr__) are not inspected and would
+            # alter the behavior of the stand-in module
+            del ns[name]
+
+    stand_in = types.ModuleType(modname)
+    stand_in.__package__ = modname if parsed.is_pkg else modname.rpartition(".")[0]
+    stand_in.__dict__.update(ns)
+    stand_in.__dict__.update(dunders)
+
+    mod_objs = group_mod_objs(stand_in, custom_groups=cgroups_def)
+    pkg_or_module = "pkg" if parsed.is_pkg else "module"
+
+    return mod_objs, pkg_or_module, analyzer.sources
@@ -0,0 +1,104 @@
+"""
+Tests for the pruning of orphaned stub files by
+`~plasmapy_sphinx.automodsumm.generate.GenDocsFromAutomodsumm.prune_orphans`.
+"""
+import io
+import os
+import pytest
+import sys
+
+from sphinx.application import Sphinx
+
+from plasmapy_sphinx.automodsumm.generate import GenDocsFromAutomodsumm
+
+_MODULE = '''"""A documented module."""
+__all__ = ["func_a", "func_b"]
+
+
+def func_a(x):
+    """Function A."""
+    return x
+
+
+def func_b(x):
+    """Function B."""
+    return x
+'''
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """
+    Write a package with a documented module and a Sphinx project documenting
+    it with :rst:dir:`automodapi`, removing any orphaned stub files.  Returns
+    the path of the module and the function generating the stub files.
+    """
+    pkg_name = f"orphan_pkg_{os.path.basename(tmp_path)}".replace("-", "_")
+    pkg_dir = tmp_path / "src" / pkg_name
+    pkg_dir.mkdir(parents=True)
+    (pkg_dir / "__init__.py").write_text('"""A documented package."""\n')
+    (pkg_dir / "mod.py").write_text(_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path / "src"))
+
+    srcdir = tmp_path / "docs"
+    srcdir.mkdir()
+    (srcdir / "conf.py").write_text(
+        "\n".join(
+            [
+                'extensions = ["plasmapy_sphinx.ext.autodoc"]',
+                "autosummary_generate = True",
+                "automodapi_inventory_cache = False",
+                'automodapi_stub_orphans = "remove"',
+            ]
+        )
+    )
+    (srcdir / "index.rst").write_text(
+        f"Index\n=====\n\n.. automodapi:: {pkg_name}.mod\n"
+    )
+
+    def generate_stubs():
+        for modname in [name for name in sys.modules if name.startswith(pkg_name)]:
+            monkeypatch.delitem(sys.modules, modname)
+
+        Sphinx(
+            srcdir=str(srcdir),
+            confdir=str(srcdir),
+            outdir=str(tmp_path / "_build"),
+            doctreedir=str(tmp_path / "_build" / ".doctrees"),
+            buildername="dummy",
+            status=None,
+            warning=io.StringIO(),
+        )
+        return sorted(os.listdir(srcdir / "api"))
+
+    return pkg_dir / "mod.py", generate_stubs
+
+
+def test_stubs_kept_on_module_import_error(project):
+    module_path, generate_stubs = project
+
+    stubs = generate_stubs()
+    assert len(stubs) == 2
+
+    module_path.write_text('raise ImportError("boom")\n' + _MODULE)
+    assert generate_stubs() == stubs
+
+
+def test_stub_kept_on_object_import_error(project, monkeypatch):
+    module_path, generate_stubs = project
+
+    stubs = generate_stubs()
+    assert len(stubs) == 2
+
+    render_entry = GenDocsFromAutomodsumm.render_entry
+
+    def _render_entry(self, entry, *args, **kwargs):
+        if entry.name.endswith(".func_a"):
+            raise ImportError("boom")
+        return render_entry(self, entry, *args, **kwargs)
+
+    monkeypatch.setattr(GenDocsFromAutomodsumm, "render_entry", _render_entry)
+
+    # change the module, so the stub files are rendered again
+    module_path.write_text(_MODULE + "\nCONSTANT = 1\n")
+    assert generate_stubs() == stubs
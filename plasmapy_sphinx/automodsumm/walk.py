@@ -0,0 +1,154 @@
+"""
+This module contains functionality for precomputing the module inventories of
+whole packages at :event:`builder-inited`, before the stub files are generated
+and the documents are read.  (See configuration value
+:confval:`automodapi_inventory_packages`.)
+
+Each listed package is walked once (with `pkgutil`), recording a parent →
+children index of its modules (see
+`~plasmapy_sphinx.automodsumm.walk.PackageIndex`), and the inventory of every
+module is pinned into the build's
+`~plasmapy_sphinx.automodsumm.inventory.InventoryStore`.  Thus, the
+:rst:dir:`automodapi` and :rst:dir:`automodsumm` directives are served from the
+store, regardless of how many times a module is referenced or of the store's
+size.  Test packages and private modules (i.e. with a leading underscore) are
+not walked, and modules that can not be inspected are left to the directives.
+"""
+__all__ = ["PackageIndex", "event_handler__builder_inited", "walk_package"]
+
+import importlib.util
+import pkgutil
+
+from sphinx.util import logging
+from typing import Dict, Iterator, List
+
+from plasmapy_sphinx.automodsumm.inventory import (
+    get_inventory,
+    prefetch_inventories,
+)
+
+if False:
+    # for annotation, does not need real import
+    from sphinx.application import Sphinx
+
+logger = logging.getLogger(__name__)
+
+
+class PackageIndex:
+    """
+    A parent → children index of the modules of the walked packages.  Every
+    indexed module, except for the root packages, is listed as a child of its
+    parent package.
+    """
+
+    def __init__(self):
+        self._children = {}  # type: Dict[str, List[str]]
+
+    def __contains__(self, modname: str) -> bool:
+        return modname in self._children
+
+    def __len__(self) -> int:
+        return len(self._children)
+
+    @property
+    def modules(self) -> List[str]:
+        """Names of all the indexed modules, in the order they were walked."""
+        return list(self._children)
+
+    def add(self, modname: str) -> None:
+        """Add module ``modname`` to the index."""
+        if modname in self._children:
+            return
+
+        self._children[modname] = []
+
+        parent = modname.rpartition(".")[0]
+        if parent in self._children:
+            self._children[parent].append(modname)
+
+    def children(self, modname: str) -> List[str]:
+        """
+        Names of the direct sub-packages and sub-modules of ``modname``.  Raises
+        `KeyError` if ``modname`` is not indexed.
+        """
+        return list(self._children[modname])
+
+
+def _is_walked(name: str) -> bool:
+    """
+    Check if the (unqualified) module ``name`` is walked.  Test packages and
+    private modules are not walked.
+    """
+    return name != "tests" and not name.startswith("_")
+
+
+def walk_package(package: str) -> Iterator[str]:
+    """
+    Walk the package ``package`` and yield the names of the package and all its
+    sub-packages and sub-modules (parents before their children).  The walk
+    locates the modules without importing them.  If ``package`` is a module,
+    only its name is yielded.
+    """
+    spec = importlib.util.find_spec(package)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{package}'", name=package)
+
+    yield package
+
+    def walk(modname, path):
+        for info in pkgutil.iter_modules(path, prefix=f"{modname}."):
+            if not _is_walked(info.name.rpartition(".")[2]):
+                continue
+
+            yield info.name
+
+            if info.ispkg:
+                sub_spec = info.module_finder.find_spec(info.name)
+                if sub_spec is not None and sub_spec.submodule_search_locations:
+                    yield from walk(info.name, sub_spec.submodule_search_locations)
+
+    if spec.submodule_search_locations:
+        yield from walk(package, spec.submodule_search_locations)
+
+
+def _pin_inventory(modname: str, app: "Sphinx") -> None:
+    """Pin the inventory of ``modname`` into the build's inventory store."""
+    try:
+        get_inventory(modname, app=app, pin=True)
+    except Exception as err:
+        # the directives documenting the module will report the error
+        logger.verbose(f"[automodsumm] unable to inventory module {modname}: {err}")
+
+
+def event_handler__builder_inited(app: "Sphinx") -> None:
+    """
+    Event handler for the Sphinx event :event:`builder-inited`.  This handler
+    walks the packages listed by :confval:`automodapi_inventory_packages`,
+    attaches the resulting `~plasmapy_sphinx.automodsumm.walk.PackageIndex` to
+    the build environment, and pins the inventories of the walked modules into
+    the `~plasmapy_sphinx.automodsumm.inventory.InventoryStore`.
+    """
+    index = PackageIndex()
+    app.env.automodsumm_package_index = index
+
+    packages = app.config.automodapi_inventory_packages
+    if not packages:
+        return
+
+    for package in packages:
+        try:
+            for modname in walk_package(package):
+                index.add(modname)
+        except (ImportError, ValueError) as err:
+            logger.warning(f"[automodsumm] unable to walk package {package}: {err}")
+
+    # the modules are inspected in the walked order, so a package is inspected
+    # before the import of its sub-packages
+    prefetch_inventories(index.modules, app)
+    for modname in index.modules:
+        _pin_inventory(modname, app)
+
+    logger.info(
+        f"[automodsumm] precomputed the inventories of {len(index)} modules "
+        f"in {len(packages)} packages"
+    )
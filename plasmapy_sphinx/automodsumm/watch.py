@@ -0,0 +1,333 @@
+"""
+This module contains the watch mode of the ``plasmapy-sphinx-autogen`` command
+line interface (see `plasmapy_sphinx.automodsumm.autogen`), which keeps the stub
+files of the :rst:dir:`automodapi` and :rst:dir:`automodsumm` directives
+up-to-date while the documented packages and the documents are edited.
+
+.. code-block:: bash
+
+    $ plasmapy-sphinx-autogen docs --watch
+
+The watched files are the documents, the templates, and the source files the
+stub files were rendered from (as recorded by the
+`~plasmapy_sphinx.automodsumm.manifest.StubManifest`), along with their
+directories to notice added and removed files.  The files are polled for
+changes (see `~plasmapy_sphinx.automodsumm.watch.FileWatcher`).  On a change,
+the changed modules (and the modules holding their objects) are re-imported,
+the stale inventories are discarded, and the stub file generation of
+`~plasmapy_sphinx.automodsumm.generate.GenDocsFromAutomodsumm` is run again.
+If only source files of the documented objects changed, the generation only
+scans the documents containing the directives of the affected stub files (see
+`~plasmapy_sphinx.automodsumm.manifest.StubManifest.find_affected`).
+Otherwise (i.e. a document or template changed, or documents were added or
+removed), all documents are scanned, and the stub files not affected by the
+change are found up-to-date without importing the documented objects.
+"""
+__all__ = [
+    "FileWatcher",
+    "evict_modules",
+    "get_stub_generator",
+    "regenerate_stubs",
+    "watch_stubs",
+    "watched_paths",
+]
+
+import importlib
+import inspect
+import os
+import sys
+import time
+
+from sphinx.util import logging
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from plasmapy_sphinx.automodsumm.generate import GenDocsFromAutomodsumm
+from plasmapy_sphinx.automodsumm.inventory import _module_source
+from plasmapy_sphinx.automodsumm.isolated import get_inspection_pool
+
+if False:
+    # for annotation, does not need real import
+    from sphinx.application import Sphinx
+
+logger = logging.getLogger(__name__)
+
+
+class FileWatcher:
+    """
+    Polls a set of files and directories for changes, i.e. a changed
+    modification time or size, or the creation or removal of the path.
+    """
+
+    def __init__(self):
+        self._stats = {}  # type: Dict[str, Optional[Tuple[int, int]]]
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._stats
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    @staticmethod
+    def _stat(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size
+
+    def watch(self, paths: Iterable[str]) -> None:
+        """
+        Set the watched paths to ``paths``.  Paths already watched keep their
+        recorded state, so changes made since the last :meth:`poll` are still
+        reported.
+        """
+        paths = set(paths)
+        self._stats = {
+            path: self._stats[path] if path in self._stats else self._stat(path)
+            for path in paths
+        }
+
+    def poll(self) -> List[str]:
+        """Return the (sorted) watched paths changed since the last poll."""
+        changed = []
+        for path, old_stat in self._stats.items():
+            stat = self._stat(path)
+            if stat != old_stat:
+                self._stats[path] = stat
+                changed.append(path)
+
+        return sorted(changed)
+
+
+def _holds_objects_of(mod, modnames: Set[str]) -> bool:
+    """
+    Check if module ``mod`` holds (e.g. re-exports) any of the modules
+    ``modnames`` or objects defined in them.
+    """
+    for value in list(vars(mod).values()):
+        if inspect.ismodule(value):
+            if value.__name__ in modnames:
+                return True
+            continue
+
+        try:
+            modname = getattr(value, "__module__", None)
+        except Exception:
+            continue
+
+        if isinstance(modname, str) and modname in modnames:
+            return True
+
+    return False
+
+
+def evict_modules(paths: Iterable[str], packages: bool = False) -> List[str]:
+    """
+    Remove the modules with source files ``paths`` from `sys.modules`, so they
+    are imported again from the changed sources.  The modules of the same
+    packages holding the evicted modules, or objects defined in them, are
+    evicted too (e.g. the parent packages and modules re-exporting or
+    subclassing the changed objects), so they do not keep serving the old
+    objects.  Set ``packages`` to `True` to evict the whole (top-level)
+    packages containing the modules instead.  Returns the names of the evicted
+    modules.
+    """
+    paths = set(paths)
+    modnames = {
+        modname
+        for modname, mod in list(sys.modules.items())
+        if _module_source(mod) in paths
+    }
+    top_level = {modname.split(".")[0] for modname in modnames}
+
+    # the running extension is never evicted
+    top_level.discard(__name__.split(".")[0])
+    modnames = {modname for modname in modnames if modname.split(".")[0] in top_level}
+
+    if packages:
+        modnames = {
+            modname for modname in sys.modules if modname.split(".")[0] in top_level
+        }
+
+    candidates = {
+        modname: mod
+        for modname, mod in list(sys.modules.items())
+        if modname.split(".")[0] in top_level and modname not in modnames
+    }
+    found = True
+    while found:
+        found = False
+        for modname, mod in list(candidates.items()):
+            if mod is not None and _holds_objects_of(mod, modnames):
+                modnames.add(modname)
+                del candidates[modname]
+                found = True
+
+    evicted = sorted(modnames)
+    for modname in evicted:
+        del sys.modules[modname]
+
+    importlib.invalidate_caches()
+    return evicted
+
+
+def watched_paths(app: "Sphinx") -> Set[str]:
+    """
+    Collect the paths watched for changes to the stub file inputs of the
+    documents of ``app``, i.e. the documents, the templates, the source files
+    recorded in the stub manifest, and their directories.
+    """
+    env = app.env
+    paths = {os.path.abspath(env.doc2path(docname)) for docname in env.found_docs}
+
+    for templates_path in app.config.templates_path:
+        for root, _, files in os.walk(os.path.join(app.srcdir, templates_path)):
+            paths.add(root)
+            paths.update(os.path.join(root, filename) for filename in files)
+
+    manifest = get_stub_generator(app).manifest
+    if manifest is not None:
+        records = manifest.records
+
+        # the stub files are written by the generation itself
+        paths.difference_update(records)
+        for record in records.values():
+            paths.update(record["sources"])
+
+    paths.update({os.path.dirname(path) for path in paths})
+    return paths
+
+
+def get_stub_generator(app: "Sphinx") -> GenDocsFromAutomodsumm:
+    """
+    Retrieve the `~plasmapy_sphinx.automodsumm.generate.GenDocsFromAutomodsumm`
+    connected to :event:`builder-inited` of ``app``, which generated the stub
+    files at the application's initialization.
+    """
+    for listener in app.events.listeners.get("builder-inited", []):
+        if isinstance(listener.handler, GenDocsFromAutomodsumm):
+            return listener.handler
+
+    raise ValueError("plasmapy_sphinx.automodsumm is not set up by the application")
+
+
+def _documents(app: "Sphinx", exclude: Set[str]) -> Set[str]:
+    """The paths of the documents found for ``app``, except those in ``exclude``."""
+    env = app.env
+    paths = {os.path.abspath(env.doc2path(docname)) for docname in env.found_docs}
+    return paths - exclude
+
+
+def regenerate_stubs(app: "Sphinx", changed: List[str]) -> GenDocsFromAutomodsumm:
+    """
+    Regenerate the stub files of ``app`` after the files ``changed`` changed,
+    with the stub file generator of ``app`` (see
+    `~plasmapy_sphinx.automodsumm.watch.get_stub_generator`), which is returned.
+
+    The changed modules, and the modules holding their objects, are re-imported
+    (see `~plasmapy_sphinx.automodsumm.watch.evict_modules`).  If the stub
+    manifest is enabled and only recorded source files of the documented
+    objects changed, only the documents containing the directives of the
+    affected stub files are scanned.  Otherwise (i.e. a document or template
+    changed, or documents were added or removed), all documents are scanned.
+    """
+    gendocs = get_stub_generator(app)
+    manifest = gendocs.manifest
+
+    # directories change whenever files are created in them (e.g. by editors
+    # saving through a temporary file), only added or removed documents matter
+    dirs = [path for path in changed if os.path.isdir(path)]
+    files = [path for path in changed if path not in dirs]
+    docs_changed = False
+    if dirs:
+        # the stub files written by the generation are documents too
+        stubs = set() if manifest is None else set(manifest.records)
+        documents = _documents(app, stubs)
+        app.env.find_files(app.config, app.builder)
+        docs_changed = _documents(app, stubs) != documents
+
+    filenames = None  # type: Optional[List[str]]
+    if manifest is not None:
+        records = manifest.records
+        affected = manifest.find_affected(files)
+
+        sources = set().union(*(record["sources"] for record in records.values()))
+        if not docs_changed and all(path in sources for path in files):
+            filenames = sorted({records[filename]["source"] for filename in affected})
+
+        logger.verbose(
+            f"[automodsumm] {len(files)} changed file(s) affect "
+            f"{len(affected)} stub file(s)"
+        )
+
+    # without the manifest, it is unknown which modules the stub files are
+    # rendered from
+    evicted = evict_modules(files, packages=manifest is None)
+    if evicted:
+        logger.verbose(f"[automodsumm] evicted {len(evicted)} changed modules")
+
+        # the workers of the "subprocess" engine hold the old modules
+        pool = get_inspection_pool(app)
+        if pool is not None:
+            pool.close()
+
+    store = getattr(app.env, "automodsumm_inventory_store", None)
+    if store is not None:
+        store.discard_stale()
+
+    if hasattr(app, "automodsumm_plan"):
+        app.automodsumm_plan = []
+
+    gendocs(app, filenames=filenames)
+    return gendocs
+
+
+def watch_stubs(app: "Sphinx", interval: float = 0.25, cycles: int = None) -> None:
+    """
+    Watch the inputs of the stub files of ``app`` and regenerate the affected
+    stub files on changes, until interrupted (e.g. by `KeyboardInterrupt`).
+
+    Parameters
+    ----------
+    app : `~sphinx.application.Sphinx`
+        Instance of the Sphinx application, whose stub files were generated
+        at its initialization.
+
+    interval : float
+        (Default ``0.25``) Seconds between polls of the watched files.
+
+    cycles : int
+        Number of polls before returning, or `None` to poll indefinitely.
+    """
+    if not app.config.automodapi_stub_manifest:
+        logger.warning(
+            "[automodsumm] automodapi_stub_manifest is disabled, only the "
+            "documents are watched and every change re-renders all stub files"
+        )
+
+    watcher = FileWatcher()
+    watcher.watch(watched_paths(app))
+    logger.info(f"[automodsumm] watching {len(watcher)} paths for changes")
+
+    cycle = 0
+    while cycles is None or cycle < cycles:
+        cycle += 1
+        time.sleep(interval)
+
+        changed = watcher.poll()
+        if not changed:
+            continue
+
+        start = time.perf_counter()
+        gendocs = regenerate_stubs(app, changed)
+        elapsed = time.perf_counter() - start
+
+        updated = gendocs.metrics["stubs_written"] + gendocs.metrics["orphans_removed"]
+        _log = logger.info if updated else logger.verbose
+        _log(
+            f"[automodsumm] {len(changed)} changed path(s), updated {updated} "
+            f"stub file(s) in {elapsed:.2f} s"
+        )
+
+        watcher.watch(watched_paths(app))
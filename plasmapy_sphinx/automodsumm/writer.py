@@ -0,0 +1,150 @@
+"""
+This module contains functionality for writing the stub files generated for the
+:rst:dir:`automodapi` and :rst:dir:`automodsumm` directives.  Stub files are
+compared to the existing files, only changed stub files are (atomically)
+replaced, and the writes are performed by a small pool of I/O threads (see
+configuration value :confval:`automodapi_stub_write_threads`).
+"""
+__all__ = ["StubWriter"]
+
+import os
+import threading
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Set
+
+
+class StubWriter:
+    """
+    Writer of stub files.  Each write (see :meth:`write`) returns a
+    `~concurrent.futures.Future` resolving to the status of the stub file...
+
+    * ``"written"``: the stub file did not exist, or its content changed,
+      and it was written.
+    * ``"unchanged"``: the stub file already has the content and was not
+      touched (its modification time is preserved).
+    * ``"kept"``: the content of the stub file changed, but it was not
+      overwritten since ``overwrite`` is `False`.
+
+    Stub files are written to a temporary file in the same directory, which
+    then replaces the stub file, so interrupted builds never leave truncated
+    stub files behind.
+
+    Parameters
+    ----------
+    encoding : str
+        Encoding of the stub files.
+
+    overwrite : bool
+        (Default `True`) Set `False` to keep existing stub files whose content
+        has changed.
+
+    threads : int
+        (Default ``4``) Number of I/O threads.  With ``0``, stub files are
+        written synchronously by :meth:`write`.
+
+    dry_run : bool
+        (Default `False`) Set `True` to only compare the content with the
+        existing stub files.  The statuses are reported as if the stub files
+        were written, but nothing is written.
+    """
+
+    def __init__(
+        self,
+        encoding: str,
+        overwrite: bool = True,
+        threads: int = 4,
+        dry_run: bool = False,
+    ):
+        self._encoding = encoding
+        self._overwrite = overwrite
+        self._dry_run = dry_run
+        self._dirs = set()  # type: Set[str]
+        self._dirs_lock = threading.Lock()
+        self._executor = (
+            None
+            if threads <= 0
+            else ThreadPoolExecutor(
+                max_workers=threads, thread_name_prefix="automodsumm-writer"
+            )
+        )
+
+    def __enter__(self) -> "StubWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Wait for all pending writes and shut down the I/O threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def write(self, filename: str, content: str) -> Future:
+        """
+        Queue writing ``content`` to the stub file ``filename``.  The directory
+        of ``filename`` is created if needed.
+        """
+        if self._executor is not None:
+            return self._executor.submit(self._write, filename, content)
+
+        future = Future()
+        try:
+            future.set_result(self._write(filename, content))
+        except Exception as err:
+            future.set_exception(err)
+        return future
+
+    def _ensuredir(self, path: str) -> None:
+        # directories are created once per writer, instead of once per stub file
+        if path in self._dirs:
+            return
+
+        with self._dirs_lock:
+            if path not in self._dirs:
+                os.makedirs(path, exist_ok=True)
+                self._dirs.add(path)
+
+    def _write(self, filename: str, content: str) -> str:
+        # match how text mode writes the content
+        data = content.replace("\n", os.linesep).encode(self._encoding)
+
+        try:
+            size = os.stat(filename).st_size
+        except FileNotFoundError:
+            pass
+        else:
+            # only read the existing stub file if it could be unchanged
+            if size == len(data):
+                with open(filename, "rb") as f:
+                    if f.read() == data:
+                        return "unchanged"
+
+            if not self._overwrite:
+                return "kept"
+
+        if self._dry_run:
+            return "written"
+
+        path = os.path.dirname(filename)
+        self._ensuredir(path)
+
+        tmp_filename = os.path.join(
+            path,
+            f".{os.path.basename(filename)}.{os.getpid()}.{threading.get_ident()}.tmp",
+        )
+        try:
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+            fd = os.open(tmp_filename, flags, 0o666)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_filename, filename)
+        except BaseException:
+            try:
+                os.remove(tmp_filename)
+            except OSError:
+                pass
+            raise
+
+        return "written"
@@ -66,9 +66,10 @@ from sphinx.application import Sphinx
 from sphinx.domains.python import PyField
 from sphinx.locale import _
 from sphinx.util.docfields import Field
+from typing import Dict
 
 
-def setup(app: Sphinx) -> None:
+def setup(app: Sphinx) -> Dict[str, bool]:
     """
     A `sphinx` ``setup()`` function setting up the :rst:dir:`confval` directive
     and :rst:role:`confval` role.
@@ -97,3 +98,5 @@ def setup(app: Sphinx) -> None:
             ),
         ],
     )
+
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -73,6 +73,7 @@ import re
 from sphinx import addnodes
 from sphinx.application import Sphinx
 from sphinx.util.docfields import GroupedField
+from typing import Dict
 
 
 def parse_event(env, sig, signode):
@@ -118,7 +119,7 @@ def parse_event(env, sig, signode):
     return name
 
 
-def setup(app: Sphinx) -> None:
+def setup(app: Sphinx) -> Dict[str, bool]:
     """
     A `sphinx` ``setup()`` function setting up the :rst:dir:`event` directive
     and :rst:role:`event` role.
@@ -139,3 +140,5 @@ def setup(app: Sphinx) -> None:
             )
         ],
     )
+
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
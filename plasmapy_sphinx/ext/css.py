@@ -4,13 +4,164 @@ This module is a `Sphinx extension
 that adds the PlasmaPy CSS style sheet to the `sphinx` build
 environment.  The :file:`plasmapy.css` is loaded into the build system
 using `~sphinx.application.Sphinx.add_css_file` with a priority of
-``501``.
+``501``.  If `sphinx_gallery` is installed, then its style sheets are also
+loaded (via ``sphinx_gallery.load_style``).
+
+By default, :file:`plasmapy.css` and the style sheets it imports are served
+as a single minified bundle, :file:`_static/css/plasmapy.{hash}.min.css`,
+whose name contains a hash of its content (see
+:confval:`plasmapy_css_bundle`).  Since the name of the bundle changes
+whenever its content changes, hosts can serve
+:file:`_static/css/plasmapy.*.min.css` with immutable (long-term) cache
+headers.  With the PlasmaPy theme, the bundle replaces the theme style sheet.
+
+.. confval:: plasmapy_css_bundle
+
+    (Default `True`)  Serve :file:`plasmapy.css` as a content hashed, minified
+    bundle.  The style sheets imported from the PlasmaPy CSS directory (e.g.
+    :file:`admonition_color_contrast.css`) are inlined into the bundle, while
+    other imports (e.g. the :file:`theme.css` of `sphinx_rtd_theme`) are kept
+    as ``@import`` rules.  Set to `False` to serve the unminified
+    :file:`plasmapy.css` and its imports as separate files.
 """
+__all__ = [
+    "add_plasmapy_css",
+    "bundle_css",
+    "minify_css",
+    "setup",
+    "write_plasmapy_css_bundle",
+]
+
+import hashlib
+import importlib.util
+import os
+import re
 
+from pathlib import Path
 from sphinx.application import Sphinx
+from sphinx.util import logging
+from typing import Dict, List, Set, Tuple
 
 from plasmapy_sphinx.utils import static_dir, css_dir
 
+logger = logging.getLogger(__name__)
+
+_re = {
+    "tokens": re.compile(
+        r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')|/\*.*?\*/", re.DOTALL
+    ),
+    "import": re.compile(
+        r"@import\s+(?:url\(\s*([\"']?)(?P<url>[^\"')\s]+)\1\s*\)"
+        r"|([\"'])(?P<url2>[^\"']+)\3)\s*;"
+    ),
+    "placeholder": re.compile("\x00(\\d+)\x00"),
+}
+"""Regular expressions used to bundle and minify the style sheets."""
+
+
+def minify_css(text: str) -> str:
+    """
+    Minify the CSS ``text`` by removing comments and the whitespace not needed
+    to separate tokens.  Strings are left untouched.
+    """
+    strings = []  # type: List[str]
+
+    def _stash(match: re.Match) -> str:
+        if match.group(1) is None:
+            # a comment, which separates tokens like whitespace
+            return " "
+
+        strings.append(match.group(1))
+        return f"\x00{len(strings) - 1}\x00"
+
+    text = _re["tokens"].sub(_stash, text)
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r" ?([{};,>]) ?", r"\1", text)
+    text = text.replace(": ", ":").replace(";}", "}")
+    text = _re["placeholder"].sub(lambda match: strings[int(match.group(1))], text)
+
+    return text.strip() + "\n"
+
+
+def _read_css(path: Path, imports: List[str], seen: Set[Path]) -> str:
+    """
+    Read the style sheet ``path`` with the style sheets it imports from the
+    same directory inlined.  Other imports (including those not found in the
+    directory) are removed from the content and collected in ``imports``.
+    """
+    seen.add(path)
+    text = path.read_text(encoding="utf-8")
+
+    # drop the comments first, so commented out imports are not inlined
+    text = _re["tokens"].sub(lambda match: match.group(1) or " ", text)
+
+    def _inline(match: re.Match) -> str:
+        url = match.group("url") or match.group("url2")
+        target = (path.parent / url).resolve()
+        if (
+            "://" in url
+            or url.startswith("/")
+            or target.parent != path.parent
+            or not target.is_file()
+        ):
+            # served by another static directory (e.g. a parent theme's)
+            if url not in imports:
+                imports.append(url)
+            return ""
+        elif target in seen:
+            return ""
+
+        return _read_css(target, imports, seen)
+
+    return _re["import"].sub(_inline, text)
+
+
+def bundle_css(path: Path) -> Tuple[str, str]:
+    """
+    Bundle the style sheet ``path`` and the style sheets it imports from the
+    same directory into a single minified style sheet, keeping all other
+    imports as ``@import`` rules at the top of the bundle.
+
+    Returns
+    -------
+    Tuple[str, str]
+        The file name of the bundle, which contains a hash of its content, and
+        the content of the bundle.
+    """
+    imports = []  # type: List[str]
+    text = _read_css(Path(path).resolve(), imports, set())
+    content = minify_css("".join(f'@import "{url}";' for url in imports) + text)
+
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return f"{stem}.{digest}.min.css", content
+
+
+def _write_css_bundle(bundle_dir: str, filename: str, content: str) -> None:
+    """
+    Write the bundle ``filename`` to the directory ``bundle_dir``, removing
+    the bundles of any previous content.
+    """
+    os.makedirs(bundle_dir, exist_ok=True)
+    stem = filename.split(".", 1)[0]
+    for old_filename in os.listdir(bundle_dir):
+        if (
+            old_filename != filename
+            and old_filename.startswith(f"{stem}.")
+            and old_filename.endswith(".min.css")
+        ):
+            os.remove(os.path.join(bundle_dir, old_filename))
+
+    path = os.path.join(bundle_dir, filename)
+    if os.path.isfile(path):
+        # the content is identified by the file name
+        return
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
 
 def add_plasmapy_css(app, config):
 
@@ -18,13 +169,51 @@ def add_plasmapy_css(app, config):
         config.html_static_path.append(str(static_dir))
 
     rel_path = css_dir.relative_to(static_dir)
-    app.add_css_file(str(rel_path / "plasmapy.css"), priority=501)
+    if not config.plasmapy_css_bundle:
+        app.add_css_file(str(rel_path / "plasmapy.css"), priority=501)
+        return
+
+    # the bundle is referenced through configuration values, so pages are
+    # re-written when the name of the bundle changes
+    filename, _ = bundle_css(css_dir / "plasmapy.css")
+    bundle = (rel_path / filename).as_posix()
+    if config.html_theme == "plasmapy_theme" and config.html_style is None:
+        # replace the theme style sheet (i.e. the unbundled plasmapy.css)
+        config.html_style = bundle
+    else:
+        config.html_css_files = list(config.html_css_files) + [
+            (bundle, {"priority": 501})
+        ]
+
 
+def write_plasmapy_css_bundle(app: Sphinx) -> None:
+    """
+    Write the :file:`plasmapy.css` bundle (see `bundle_css`) to the
+    :file:`_static/css` directory of the output, for HTML builders.  Bundles
+    of any previous content are removed.
+    """
+    if not app.config.plasmapy_css_bundle or app.builder.format != "html":
+        return
 
-def setup(app: Sphinx) -> None:
-    app.setup_extension("sphinx_gallery.load_style")
+    filename, content = bundle_css(css_dir / "plasmapy.css")
+    bundle_dir = os.path.join(app.outdir, "_static", css_dir.name)
+    try:
+        _write_css_bundle(bundle_dir, filename, content)
+    except OSError as err:
+        logger.warning(f"[plasmapy_sphinx] unable to write CSS bundle: {err}")
+
+
+def setup(app: Sphinx) -> Dict[str, bool]:
+    # sphinx_gallery is an optional dependency, only load its styles if available
+    if importlib.util.find_spec("sphinx_gallery") is not None:
+        app.setup_extension("sphinx_gallery.load_style")
+
+    app.add_config_value("plasmapy_css_bundle", True, "html")
 
     # for some "unknown" reason, an extension can not add a style sheet
     # to the sphinx build unless it's done through the 'config-inited'
     # event
     app.connect("config-inited", add_plasmapy_css)
+    app.connect("builder-inited", write_plasmapy_css_bundle)
+
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -9,14 +9,17 @@ that exposes the functionality of `plasmapy_sphinx.directives`.
 
 """
 from sphinx.application import Sphinx
+from typing import Dict
 
 from plasmapy_sphinx.directives import confval, event
 
 
-def setup(app: Sphinx) -> None:
+def setup(app: Sphinx) -> Dict[str, bool]:
     """
     A `sphinx` ``setup()`` function for setting up all the functionality defined in
     `plasmapy_sphinx.directives`.
     """
     confval.setup(app)
     event.setup(app)
+
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -14,20 +14,25 @@ To use the PlasmaPy theme one needs to the :file:`conf.py`:
     extensions = ["plasmapy_sphinx.theme"]
     html_theme = "plasmapy_theme"
 
+The theme style sheets are served as a single minified bundle with a content
+hash in its file name, which can be cached by browsers indefinitely (see
+`plasmapy_sphinx.ext.css` and :confval:`plasmapy_css_bundle`).
 """
 __all__ = ["setup"]
 from sphinx.application import Sphinx
+from typing import Dict
 
 from plasmapy_sphinx.ext.css import setup as css_setup
 from plasmapy_sphinx.utils import theme_dir
 
 
-def setup(app: Sphinx) -> None:
+def setup(app: Sphinx) -> Dict[str, bool]:
     """
     Sphinx ``setup()`` function for setting up the PlasmaPy theme.
     """
-    css_setup(app)
-    app.setup_extension("sphinx_gallery.load_style")
+    rtn = css_setup(app)  # also loads the sphinx_gallery styles, if installed
 
     # Register the theme that can be referenced without adding a theme path
     app.add_html_theme("plasmapy_theme", theme_path=str(theme_dir.absolute()))
+
+    return rtn
@@ -3,9 +3,11 @@ A utility package containing functions and variables to support development of
 the core functionality in `plasmapy_sphinx`.
 """
 __all__ = [
+    "ModuleInventory",
     "default_grouping_info",
     "find_mod_objs",
     "get_custom_grouping_info",
+    "group_mod_objs",
     "package_dir",
     "templates_dir",
     "theme_dir",
@@ -14,12 +16,15 @@ __all__ = [
 ]
 
 import inspect
+import sys
 
 from collections import OrderedDict
+from collections.abc import Mapping
 from importlib import import_module
 from sphinx.application import Sphinx
 from pathlib import Path
-from typing import Any, Dict
+from types import ModuleType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 package_dir = Path(__file__).parent.absolute()
 """Absolute path to the `plasmapy_sphinx` package directory."""
@@ -52,6 +57,253 @@ extend using the configuration value :confval:`automodapi_custom_groups`.
 """
 
 
+def _sort_group(
+    names: Iterable[str], qualnames: Iterable[str]
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Sort the (aligned) ``names`` and ``qualnames`` of a group by name."""
+    pairs = sorted(zip(names, qualnames))
+    return tuple(pair[0] for pair in pairs), tuple(pair[1] for pair in pairs)
+
+
+class _GroupView(Mapping):
+    """
+    A read-only view of a group of a `~plasmapy_sphinx.utils.ModuleInventory`,
+    behaving like the dictionary ``{"names": [...], "qualnames": [...], "objs":
+    [...]}``.
+    """
+
+    __slots__ = ("_inventory", "_group")
+    _keys = ("names", "qualnames", "objs")
+
+    def __init__(self, inventory: "ModuleInventory", group: str):
+        self._inventory = inventory
+        self._group = group
+
+    def __getitem__(self, key: str) -> List[Any]:
+        if key == "names":
+            return list(self._inventory.names(self._group))
+        elif key == "qualnames":
+            return list(self._inventory.qualnames(self._group))
+        elif key == "objs":
+            return self._inventory.objs(self._group)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class ModuleInventory(Mapping):
+    """
+    The grouped objects of a module, as found by
+    `~plasmapy_sphinx.utils.find_mod_objs`.
+
+    For each group (modules, classes, functions, etc.), the inventory stores the
+    object names and fully qualified names as tuples sorted by name.  Names are
+    looked up through an index that is built on first use (see :meth:`lookup`),
+    and the object instances are not stored but resolved from the module when
+    requested (see :meth:`obj`).
+
+    The inventory is a read-only mapping of the group names to views behaving
+    like the dictionaries ``{"names": [...], "qualnames": [...], "objs": [...]}``,
+    i.e. ``inventory["classes"]["qualnames"]`` is the list of the qualified
+    names of the classes.
+
+    Parameters
+    ----------
+    modname : str
+        Name of the inventoried module.
+
+    groups : Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]]
+        The tuple of names and the (aligned) tuple of qualified names of each
+        group, sorted by name.
+
+    module : `~types.ModuleType`, optional
+        The inventoried module, used to resolve the object instances.  If not
+        given, the module is imported when an object is first resolved.
+    """
+
+    __slots__ = ("_modname", "_groups", "_module", "_index")
+
+    def __init__(
+        self,
+        modname: str,
+        groups: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]],
+        module: ModuleType = None,
+    ):
+        self._modname = modname
+        self._groups = groups
+        self._module = module
+        self._index = None  # type: Optional[Dict[str, Tuple[str, int]]]
+
+    @classmethod
+    def from_groups(
+        cls, modname: str, groups: Dict[str, Dict[str, Any]], module: ModuleType = None
+    ) -> "ModuleInventory":
+        """
+        Create the inventory from a dictionary of groups shaped like
+        ``{group: {"names": [...], "qualnames": [...]}}`` (e.g. the ``"groups"``
+        of an inventory generated by
+        `~plasmapy_sphinx.automodsumm.inventory.inspect_module`).  Any ``"objs"``
+        entries are ignored.
+        """
+        return cls(
+            modname,
+            {
+                group: _sort_group(info["names"], info["qualnames"])
+                for group, info in groups.items()
+            },
+            module=module,
+        )
+
+    def __getstate__(self):
+        # modules can not be pickled, the objects are resolved by importing
+        # the module instead
+        return self._modname, self._groups
+
+    def __setstate__(self, state):
+        self._modname, self._groups = state
+        self._module = None
+        self._index = None
+
+    def __getitem__(self, group: str) -> _GroupView:
+        if group not in self._groups:
+            raise KeyError(group)
+        return _GroupView(self, group)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._groups)
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._modname!r}, {self.as_dict()!r})"
+
+    @property
+    def modname(self) -> str:
+        """Name of the inventoried module."""
+        return self._modname
+
+    def names(self, group: str) -> Tuple[str, ...]:
+        """The sorted names of the objects in ``group``."""
+        return self._groups[group][0]
+
+    def qualnames(self, group: str) -> Tuple[str, ...]:
+        """The qualified names of the objects in ``group``, ordered by name."""
+        return self._groups[group][1]
+
+    def lookup(self, name: str) -> Optional[Tuple[str, str, str]]:
+        """
+        Look up the object by its name or qualified name ``name``.  Returns
+        the tuple ``(group, name, qualname)`` of the object, or `None` if the
+        object is not in the inventory.
+        """
+        if self._index is None:
+            index = {}
+            for group, (names, qualnames) in self._groups.items():
+                for ii, (short_name, qualname) in enumerate(zip(names, qualnames)):
+                    index.setdefault(short_name, (group, ii))
+                    index.setdefault(qualname, (group, ii))
+            self._index = index
+
+        try:
+            group, ii = self._index[name]
+        except KeyError:
+            return None
+
+        names, qualnames = self._groups[group]
+        return group, names[ii], qualnames[ii]
+
+    def _get_module(self) -> ModuleType:
+        if self._module is None:
+            self._module = sys.modules.get(self._modname, None)
+            if self._module is None:
+                self._module = import_module(self._modname)
+        return self._module
+
+    def obj(self, name: str) -> Any:
+        """
+        Resolve the object instance of the object with name (or qualified name)
+        ``name``.  Raises `KeyError` if the object is not in the inventory.
+        """
+        entry = self.lookup(name)
+        if entry is None:
+            raise KeyError(name)
+
+        return getattr(self._get_module(), entry[1])
+
+    def objs(self, group: str) -> List[Any]:
+        """Resolve the object instances of ``group``, ordered by name."""
+        mod = self._get_module()
+        return [getattr(mod, name) for name in self.names(group)]
+
+    def filtered(
+        self, groups: Iterable[str] = None, skip: Iterable[str] = ()
+    ) -> "ModuleInventory":
+        """
+        Create a new inventory with only the groups ``groups`` (all groups if
+        `None`), excluding the objects whose name or qualified name is in
+        ``skip``.  Groups left empty are dropped.
+        """
+        groups = set(self._groups) if groups is None else set(groups)
+        skip = set(skip)
+
+        filtered = {}
+        for group, (names, qualnames) in self._groups.items():
+            if group not in groups:
+                continue
+
+            if skip:
+                pairs = [
+                    pair
+                    for pair in zip(names, qualnames)
+                    if pair[0] not in skip and pair[1] not in skip
+                ]
+                names = tuple(pair[0] for pair in pairs)
+                qualnames = tuple(pair[1] for pair in pairs)
+
+            if len(names) > 0:
+                filtered[group] = (names, qualnames)
+
+        return self.__class__(self._modname, filtered, module=self._module)
+
+    def sorted_qualnames(self, exclude_groups: Iterable[str] = ()) -> List[str]:
+        """
+        List the qualified names of all the objects, excluding the groups
+        ``exclude_groups``.  The list is sorted based on the casefolded names
+        of the objects.
+        """
+        exclude_groups = set(exclude_groups)
+
+        pairs = []
+        for group, (names, qualnames) in self._groups.items():
+            if group not in exclude_groups:
+                pairs.extend(zip(names, qualnames))
+
+        pairs.sort(key=lambda pair: pair[0].casefold())
+        return [pair[1] for pair in pairs]
+
+    def as_dict(self, objs: bool = False) -> Dict[str, Dict[str, List[Any]]]:
+        """
+        Convert the inventory into a dictionary of groups shaped like
+        ``{group: {"names": [...], "qualnames": [...]}}``.  Set ``objs`` to
+        `True` to include the ``"objs"`` entries (i.e. resolve the object
+        instances).
+        """
+        groups = {}
+        for group, (names, qualnames) in self._groups.items():
+            groups[group] = {"names": list(names), "qualnames": list(qualnames)}
+            if objs:
+                groups[group]["objs"] = self.objs(group)
+        return groups
+
+
 def get_custom_grouping_info(app: Sphinx):
     """
     Retrieve the custom groups dictionary defined by the configuration value
@@ -65,11 +317,14 @@ def get_custom_grouping_info(app: Sphinx):
     return _info
 
 
-def find_mod_objs(modname: str, app: Sphinx = None) -> Dict[str, Dict[str, Any]]:
+def find_mod_objs(
+    modname: str, app: Sphinx = None, custom_groups: Dict[str, Any] = None
+) -> ModuleInventory:
     """
     Inspect the module ``modname`` for all the contained objects, sort for the
-    object type (module, function, class, etc.), and return a dictionary containing
-    object names, fully qualified names, and instances.
+    object type (module, function, class, etc.), and return an inventory
+    (`~plasmapy_sphinx.utils.ModuleInventory`) containing object names, fully
+    qualified names, and instances.
 
     Parameters
     ----------
@@ -79,49 +334,41 @@ def find_mod_objs(modname: str, app: Sphinx = None) -> Dict[str, Dict[str, Any]]
     app : `~sphinx.application.Sphinx`
         Instance of the `Sphinx` application.
 
+    custom_groups : Dict[str, Any], optional
+        The custom groups to sort the objects into (see
+        :confval:`automodapi_custom_groups`).  If not given, the custom groups
+        are taken from ``app``.
+
     Returns
     -------
-    mod_objs : Dict[str, Dict[str, List[Any]]]
+    mod_objs : `~plasmapy_sphinx.utils.ModuleInventory`
 
-        A dictionary containing names, qualified names, and objects instances of all
-        the objects in ``modname`` sorted by their respective group (module, class,
-        function, etc.)
+        A dictionary-like inventory containing names, qualified names, and objects
+        instances of all the objects in ``modname`` sorted by their respective group
+        (module, class, function, etc.)
 
-        The first key of the dictionary represents the object type (modules, classes,
+        The first key of the inventory represents the object type (modules, classes,
         functions, etc.).  The second key is either ``"names"`` (list of all object
         short names), ``"qualnames"`` (list of all object qualified names), and
-        ``"objs"`` (list of object instances).
+        ``"objs"`` (list of object instances).  The object instances are resolved
+        from the module when the ``"objs"`` entries are accessed.
 
     Examples
     --------
 
-    >>> find_mod_objs("plasmapy_sphinx.utils")
-    {
-        'functions': {
-            'names': ['find_mod_objs', 'get_custom_grouping_info'],
-            'qualnames': [
-                'plasmapy_sphinx.utils.find_mod_objs',
-                'plasmapy_sphinx.utils.get_custom_grouping_info',
-            ],
-            'objs': [
-                <function plasmapy_sphinx.utils.find_mod_objs>,
-                <function plasmapy_sphinx.utils.get_custom_grouping_info>,
-            ]
-        },
-        'variables': {
-            'names': ['default_grouping_info', 'package_dir', 'templates_dir'],
-            'qualnames': [
-                'plasmapy_sphinx.utils.default_grouping_info',
-                'plasmapy_sphinx.utils.package_dir',
-                'plasmapy_sphinx.utils.templates_dir',
-            ],
-            'objs': [
-                OrderedDict(...),
-                "/.../plasmapy_sphinx",
-                "/.../plasmapy_sphinx/templates",
-            ]
-        }
-    }
+    >>> mod_objs = find_mod_objs("plasmapy_sphinx.utils")
+    >>> mod_objs
+    ModuleInventory('plasmapy_sphinx.utils', {'classes': {...}, ...})
+    >>> list(mod_objs)
+    ['classes', 'functions', 'variables']
+    >>> mod_objs["functions"]
+    {'names': ['find_mod_objs', 'get_custom_grouping_info', 'group_mod_objs'],
+     'qualnames': ['plasmapy_sphinx.utils.find_mod_objs',
+                   'plasmapy_sphinx.utils.get_custom_grouping_info',
+                   'plasmapy_sphinx.utils.group_mod_objs'],
+     'objs': [<function find_mod_objs at ...>,
+              <function get_custom_grouping_info at ...>,
+              <function group_mod_objs at ...>]}
 
 
     Notes
@@ -145,19 +392,60 @@ def find_mod_objs(modname: str, app: Sphinx = None) -> Dict[str, Dict[str, Any]]
        :attr:`default_grouping_info`.
 
     """
-    if app is not None:
-        if isinstance(app, Sphinx):
-            cgroups_def = get_custom_grouping_info(app)
-        else:
-            # assuming dict for testing
-            cgroups_def = app
+    from plasmapy_sphinx.automodsumm.profiler import profile_import
 
-        cgroups = set(cgroups_def)
-    else:
+    with profile_import(app, "import_module", modname):
+        mod = import_module(modname)
+
+    return group_mod_objs(mod, app=app, custom_groups=custom_groups)
+
+
+def group_mod_objs(
+    mod: ModuleType,
+    app: Union[Sphinx, Dict[str, Any]] = None,
+    custom_groups: Dict[str, Any] = None,
+) -> ModuleInventory:
+    """
+    Sort the objects of the (already imported) module ``mod`` for the object type
+    (module, function, class, etc.), and return an inventory containing object
+    names, fully qualified names, and instances.  This is the grouping
+    performed by `~plasmapy_sphinx.utils.find_mod_objs` once the module is
+    imported.
+
+    Parameters
+    ----------
+    mod : `~types.ModuleType`
+        The module to be inspected.  Only the module's ``__name__`` and
+        `globals` (i.e. ``__dict__``) are used for the inspection, so any
+        object behaving like a module is suitable.
+
+    app : `~sphinx.application.Sphinx`
+        Instance of the `Sphinx` application.
+
+    custom_groups : Dict[str, Any], optional
+        The custom groups to sort the objects into (see
+        :confval:`automodapi_custom_groups`).  If not given, the custom groups
+        are taken from ``app``.
+
+    Returns
+    -------
+    mod_objs : `~plasmapy_sphinx.utils.ModuleInventory`
+        Same as the return of `~plasmapy_sphinx.utils.find_mod_objs`.  The
+        object instances are resolved from ``mod``.
+    """
+    if custom_groups is not None:
+        cgroups_def = custom_groups
+    elif app is None:
         cgroups_def = {}
-        cgroups = set()
+    elif isinstance(app, Sphinx):
+        cgroups_def = get_custom_grouping_info(app)
+    else:
+        # assuming dict for testing
+        cgroups_def = app
+
+    cgroups = set(cgroups_def)
 
-    mod = import_module(modname)
+    modname = mod.__name__
     pkg_name = modname.split(".")[0]
 
     # define what to search
@@ -262,14 +550,15 @@ def find_mod_objs(modname: str, app: Sphinx = None) -> Dict[str, Dict[str, Any]]
         else:
             mod_objs["variables"]["names"].append(name)
 
-    # retrieve and defined qualnames and objs
-    for obj_type in list(mod_objs):
-        if len(mod_objs[obj_type]["names"]) == 0:
-            del mod_objs[obj_type]
+    # retrieve and defined qualnames
+    groups = {}  # type: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]]
+    for obj_type, info in mod_objs.items():
+        if len(info["names"]) == 0:
             continue
 
-        mod_objs[obj_type].update({"qualnames": [], "objs": []})
-        for name in list(mod_objs[obj_type]["names"]):
+        names = []
+        qualnames = []
+        for name in info["names"]:
             # Note:  The 'qualname' is always constructed with 'name' so when
             #        something like
             #
@@ -295,7 +584,6 @@ def find_mod_objs(modname: str, app: Sphinx = None) -> Dict[str, Dict[str, Any]]
                     pass
                 elif not obj.__module__.startswith(pkg_name):
                     # object not from package being documented
-                    mod_objs[obj_type]["names"].remove(name)
                     continue
 
             if ismod:
@@ -320,18 +608,10 @@ def find_mod_objs(modname: str, app: Sphinx = None) -> Dict[str, Dict[str, Any]]
             else:
                 qualname = f"{obj.__module__}.{name}"
 
-            mod_objs[obj_type]["qualnames"].append(qualname)
-            mod_objs[obj_type]["objs"].append(obj)
-
-        # sort lists
-        names = sorted(mod_objs[obj_type]["names"].copy())
-        qualnames = []
-        objs = []
-        for name in names:
-            index = mod_objs[obj_type]["names"].index(name)
-            qualnames.append(mod_objs[obj_type]["qualnames"][index])
-            objs.append(mod_objs[obj_type]["objs"][index])
+            names.append(name)
+            qualnames.append(qualname)
 
-        mod_objs[obj_type] = {"names": names, "qualnames": qualnames, "objs": objs}
+        # sort lists (once, instead of locating each name)
+        groups[obj_type] = _sort_group(names, qualnames)
 
-    return mod_objs
+    return ModuleInventory(modname, groups, module=mod)
@@ -10,4 +10,4 @@ site.ENABLE_USER_SITE = "--user" in sys.argv[1:]
 # Get configuration information from all of the various subpackages.
 # See the docstring for setup_helpers.update_package_files for more
 # details.
-setup(use_scm_version=True)
+setup(use_scm_version={"write_to": "plasmapy_sphinx/_version.py"})